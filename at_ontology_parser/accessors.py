@@ -0,0 +1,127 @@
+import keyword
+from typing import Any
+from typing import ClassVar
+from typing import Dict
+from typing import FrozenSet
+from typing import Iterator
+from typing import Tuple
+from typing import Type
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from at_ontology_parser.base import Instancable
+    from at_ontology_parser.base import Instance
+    from at_ontology_parser.model.definitions.property_definition import PropertyDefinition
+
+ACCESSOR_META_KEY = "property_accessor"
+
+
+def effective_properties(instancable: "Instancable") -> Dict[str, "PropertyDefinition"]:
+    """Property definitions of the type and all its parents, the derived types override the parents."""
+    result: Dict[str, "PropertyDefinition"] = {}
+    for entity in instancable.derivation:
+        result.update(entity.properties or {})
+    return result
+
+
+def slot_name(alias: str, index: int) -> str:
+    if alias.isidentifier() and not keyword.iskeyword(alias) and not alias.startswith("_"):
+        return alias
+    # aliases that can't be attributes are still available by item access
+    return f"_p{index}"
+
+
+class PropertyAccessor:
+    """
+    Base of the generated per-type property views. Every effective property of the type has a slot,
+    multi-valued properties hold the list of the assigned values, other ones the value or the default.
+    """
+
+    __slots__ = ()
+
+    _type_name: ClassVar[str] = ""
+    _definitions: ClassVar[Dict[str, "PropertyDefinition"]] = {}
+    _slots: ClassVar[Dict[str, str]] = {}
+    _multiple: ClassVar[FrozenSet[str]] = frozenset()
+
+    @classmethod
+    def from_instance(cls, instance: "Instance") -> "PropertyAccessor":
+        result = cls.__new__(cls)
+        values: Dict[str, Any] = {}
+        for alias, definition in cls._definitions.items():
+            default = definition.default
+            if alias in cls._multiple:
+                values[alias] = [] if default is None else list(default) if isinstance(default, list) else [default]
+            else:
+                values[alias] = default
+
+        assigned = set()
+        for assignment in instance.properties or []:
+            alias = assignment.definition.alias
+            if alias not in cls._slots:
+                continue
+            if alias in cls._multiple:
+                if alias not in assigned:
+                    values[alias] = []
+                values[alias].append(assignment.value)
+            else:
+                values[alias] = assignment.value
+            assigned.add(alias)
+
+        for alias, value in values.items():
+            object.__setattr__(result, cls._slots[alias], value)
+        return result
+
+    def __getitem__(self, alias: str) -> Any:
+        try:
+            return getattr(self, self._slots[alias])
+        except KeyError:
+            raise KeyError(f'Type "{self._type_name}" has no property "{alias}"') from None
+
+    def __contains__(self, alias: str) -> bool:
+        return alias in self._slots
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._slots)
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        for alias, slot in self._slots.items():
+            yield alias, getattr(self, slot)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"{self.__class__.__name__} is read-only")
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, PropertyAccessor) and self.as_dict() == other.as_dict()
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{alias}={value!r}" for alias, value in self.items())
+        return f"{self.__class__.__name__}({values})"
+
+
+def accessor_class(instancable: "Instancable") -> Type[PropertyAccessor]:
+    """
+    Generates the property view class of the type once and caches it in the type metadata.
+    The class is not cached until the derivation of the type is resolved.
+    """
+    cls = instancable._meta.get(ACCESSOR_META_KEY)
+    if cls is None:
+        definitions = effective_properties(instancable)
+        slots = {alias: slot_name(alias, i) for i, alias in enumerate(definitions)}
+        cls = type(
+            f"{instancable.name.split('.')[-1]}Properties",
+            (PropertyAccessor,),
+            {
+                "__slots__": tuple(slots.values()),
+                "_type_name": instancable.name,
+                "_definitions": definitions,
+                "_slots": slots,
+                "_multiple": frozenset(alias for alias, d in definitions.items() if d.allows_multiple),
+            },
+        )
+        if not instancable.derivation[0].derived_from:
+            instancable._meta[ACCESSOR_META_KEY] = cls
+    return cls
@@ -9,6 +9,8 @@ from typing import Self
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
+from at_ontology_parser.accessors import accessor_class
+from at_ontology_parser.accessors import PropertyAccessor
 from at_ontology_parser.exceptions import Context
 from at_ontology_parser.exceptions import OntologyException
 
@@ -146,6 +148,24 @@ class Instance(OntologyEntity):
     properties: Optional[List["PropertyAssignment"]] = field(default=None, repr=False)
     artifacts: Optional[List["ArtifactAssignment"]] = field(default=None, repr=False)
 
+    @property
+    def props(self) -> PropertyAccessor:
+        """
+        Attribute view of the assigned properties generated from the effective properties of the instance type.
+        Built on first access and rebuilt when an assignment or an assigned value is replaced.
+        """
+        cached = self._meta.get("props")
+        # the assignments and their values, held by the cache so that their ids are not reused while compared
+        objects = [obj for assignment in self.properties or [] for obj in (assignment, assignment.value)]
+        if cached is None or [id(obj) for obj in cached[0]] != [id(obj) for obj in objects]:
+            if not self.type.fulfilled:
+                raise OntologyException(
+                    f'Type "{self.type.alias}" of the instance is not resolved', context=Context(name=self.name)
+                )
+            cached = (objects, accessor_class(self.type.value).from_instance(self))
+            self._meta["props"] = cached
+        return cached[1]
+
     def _to_repr(self, context: "Context", minify=True, exclude_name=True, with_restricted=False):
         result = super()._to_repr(context, minify, exclude_name, with_restricted=with_restricted)
 
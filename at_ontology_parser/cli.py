@@ -0,0 +1,183 @@
+"""
+Command line interface of the parser::
+
+    at-ontology validate ontologies/ archives/*.zip --model models/base.mdl.yml --jobs 8
+    at-ontology serve ontologies/ --model models/base.mdl.yml --port 8765
+
+Every validated file is reported as a JSON line on the standard output, a summary goes to the standard error.
+The server answers lookups over the loaded ontologies, see :mod:`at_ontology_parser.server`.
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import as_completed
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import TextIO
+
+from at_ontology_parser.exceptions import LoadException
+from at_ontology_parser.exceptions import OntologyException
+from at_ontology_parser.parsing.parser import Parser
+
+ONTOLOGY_SUFFIXES = (".ont.yml", ".ont.yaml", ".zip", ".tar", ".tar.gz", ".tgz")
+
+# the parser with the shared models of a worker process, the validated ontologies are loaded into its forks
+_worker_parser: Optional[Parser] = None
+# the error of loading the shared models, reported as the result of every file of the worker
+_worker_error: Optional[Exception] = None
+
+
+def iter_ontology_paths(inputs: Iterable[str]) -> Iterator[Path]:
+    """Expands files, directories (searched recursively) and glob patterns, every path is yielded once."""
+    seen = set()
+    for item in inputs:
+        if glob.has_magic(item):
+            candidates = [Path(p) for p in sorted(glob.glob(item, recursive=True))]
+        elif Path(item).is_dir():
+            candidates = sorted(p for p in Path(item).rglob("*") if p.is_file() and p.name.endswith(ONTOLOGY_SUFFIXES))
+        else:
+            candidates = [Path(item)]
+        for path in candidates:
+            if path not in seen:
+                seen.add(path)
+                yield path
+
+
+def init_worker(models: List[str]):
+    # an exception raised here would break the whole pool, so it is kept and reported per file instead
+    global _worker_parser, _worker_error
+    _worker_parser = Parser()
+    _worker_error = None
+    try:
+        for model in models:
+            _worker_parser.load_model(model)
+    except Exception as e:
+        _worker_error = e
+
+
+def error_representation(error: Exception) -> Dict[str, Any]:
+    if isinstance(error, OntologyException) and error.context is not None:
+        return error.represent()
+    if isinstance(error, LoadException):
+        return {"msg": str(error), "errors": error.errors}
+    return {"msg": f"{error.__class__.__name__}: {error}"}
+
+
+def validate_file(path: str | Path) -> Dict[str, Any]:
+    if _worker_parser is None:
+        init_worker([])
+    started = time.perf_counter()
+    result: Dict[str, Any] = {"path": str(path)}
+    if _worker_error is not None:
+        result.update(ok=False, error=error_representation(_worker_error), time=time.perf_counter() - started)
+        return result
+    try:
+        ontology = _worker_parser.fork().load_ontology(path)
+        result.update(
+            ok=True,
+            name=ontology.name,
+            vertices=len(ontology.vertices or {}),
+            relationships=len(ontology.relationships or {}),
+        )
+    except Exception as e:
+        result.update(ok=False, error=error_representation(e))
+    result["time"] = time.perf_counter() - started
+    return result
+
+
+def iter_results(paths: List[Path], models: List[str], jobs: int) -> Iterator[Dict[str, Any]]:
+    """Yields the results as soon as they are ready, so with several jobs not in the order of the paths."""
+    if jobs <= 1:
+        init_worker(models)
+        for path in paths:
+            yield validate_file(path)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker, initargs=(models,)) as executor:
+        futures = [executor.submit(validate_file, path) for path in paths]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def validate(args: argparse.Namespace, output: Optional[TextIO] = None, summary: Optional[TextIO] = None) -> int:
+    output = output or sys.stdout
+    summary = summary or sys.stderr
+    paths = list(iter_ontology_paths(args.paths))
+    started = time.perf_counter()
+    failed = 0
+    for result in iter_results(paths, args.model, args.jobs):
+        failed += not result["ok"]
+        output.write(json.dumps(result, ensure_ascii=False, default=str) + "\n")
+        output.flush()
+
+    elapsed = time.perf_counter() - started
+    summary.write(
+        json.dumps({"files": len(paths), "failed": failed, "time": elapsed, "jobs": args.jobs}, ensure_ascii=False)
+        + "\n"
+    )
+    return 1 if failed else 0
+
+
+def serve(args: argparse.Namespace) -> int:
+    # the server module imports this one
+    from at_ontology_parser.server import OntologyService
+    from at_ontology_parser.server import QueryServer
+
+    service = OntologyService(model_paths=args.model, ontology_paths=list(iter_ontology_paths(args.paths)))
+    with QueryServer(
+        service, (args.host, args.port), reload_interval=args.reload_interval, verbose=args.verbose
+    ) as server:
+        sys.stderr.write(json.dumps({"url": server.url, **service.status()}, ensure_ascii=False) + "\n")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+def build_argument_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="at-ontology", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    validate_parser = commands.add_parser("validate", help="load ontology files and archives and report the errors")
+    validate_parser.add_argument("paths", nargs="+", help="ontology files, archives, directories or glob patterns")
+    validate_parser.add_argument(
+        "--model",
+        action="append",
+        default=[],
+        help="model file or archive loaded once per worker and shared by the validated ontologies",
+    )
+    validate_parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, help="worker processes")
+    validate_parser.set_defaults(handler=validate)
+
+    serve_parser = commands.add_parser("serve", help="keep ontologies loaded and answer queries over local HTTP")
+    serve_parser.add_argument("paths", nargs="*", help="ontology files, archives, directories or glob patterns")
+    serve_parser.add_argument("--model", action="append", default=[], help="model file or archive to load")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8765)
+    serve_parser.add_argument(
+        "--reload-interval", type=float, default=1.0, help="seconds between checks of the loaded files, 0 disables"
+    )
+    serve_parser.add_argument("--verbose", "-v", action="store_true", help="log the requests")
+    serve_parser.set_defaults(handler=serve)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_argument_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
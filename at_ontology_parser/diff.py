@@ -0,0 +1,197 @@
+import hashlib
+import json
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Literal
+from typing import Mapping
+from typing import Optional
+from typing import Tuple
+
+from at_ontology_parser.base import OntologyBase
+from at_ontology_parser.ontology.assignments import PropertyAssignment
+from at_ontology_parser.reference import AbstractReference
+
+HASH_META_KEY = "structural_hash"
+DIGEST_SIZE = 16
+# mappings of ontology objects larger than that are split into buckets by the digests of their keys
+BUCKET_SIZE = 32
+
+ADDED = "added"
+REMOVED = "removed"
+CHANGED = "changed"
+
+
+def _digest(*parts: bytes) -> bytes:
+    hasher = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    for part in parts:
+        hasher.update(len(part).to_bytes(8, "little"))
+        hasher.update(part)
+    return hasher.digest()
+
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(value, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+
+
+@dataclass(kw_only=True)
+class Node:
+    """Hashed subtree, ``value`` is the hashed object."""
+
+    digest: bytes
+    value: Any = field(repr=False)
+
+
+@dataclass(kw_only=True)
+class EntityNode(Node):
+    fields: Dict[str, Node] = field(repr=False)
+
+
+@dataclass(kw_only=True)
+class Bucket:
+    """Node of the hash tree of a mapping: either ``entries`` or ``buckets`` keyed by a byte of the key digests."""
+
+    digest: bytes
+    entries: Optional[Dict[str, Node]] = field(default=None, repr=False)
+    buckets: Optional[Dict[int, "Bucket"]] = field(default=None, repr=False)
+
+    @classmethod
+    def build(cls, entries: Dict[str, Tuple[bytes, Node]], depth: int = 0) -> "Bucket":
+        if len(entries) <= BUCKET_SIZE or depth >= DIGEST_SIZE:
+            parts = [_encode(key) + child.digest for key, (_, child) in sorted(entries.items())]
+            return cls(digest=_digest(b"entries", *parts), entries={key: child for key, (_, child) in entries.items()})
+        grouped: Dict[int, Dict[str, Tuple[bytes, Node]]] = {}
+        for key, entry in entries.items():
+            grouped.setdefault(entry[0][depth], {})[key] = entry
+        buckets = {byte: cls.build(group, depth + 1) for byte, group in grouped.items()}
+        parts = [bytes([byte]) + bucket.digest for byte, bucket in sorted(buckets.items())]
+        return cls(digest=_digest(b"buckets", *parts), buckets=buckets)
+
+    def flatten(self) -> Dict[str, Node]:
+        if self.entries is not None:
+            return self.entries
+        result = {}
+        for bucket in self.buckets.values():
+            result.update(bucket.flatten())
+        return result
+
+
+@dataclass(kw_only=True)
+class MappingNode(Node):
+    tree: Bucket = field(repr=False)
+
+
+def _sequence_keys(items: List[Any]) -> List[str]:
+    # property assignments are matched by the property and the occurrence, entities by the name
+    result = []
+    occurrences: Dict[str, int] = {}
+    for i, item in enumerate(items):
+        if isinstance(item, PropertyAssignment):
+            key = item.definition.alias
+        else:
+            key = getattr(item, "name", None) or getattr(item, "file", None) or str(i)
+        occurrence = occurrences.get(key, 0)
+        occurrences[key] = occurrence + 1
+        result.append(key if not occurrence else f"{key}[{occurrence}]")
+    return result
+
+
+def _is_structural(value: Any) -> bool:
+    return isinstance(value, OntologyBase) and not isinstance(value, AbstractReference)
+
+
+def hash_node(value: Any) -> Node:
+    """Hashed subtree of the value, the nodes of ontology objects are cached in their ``_meta``."""
+    if isinstance(value, AbstractReference):
+        return Node(digest=_digest(b"ref", _encode(value.alias)), value=value.alias)
+    if isinstance(value, OntologyBase):
+        cached = value._meta.get(HASH_META_KEY)
+        if cached is None:
+            fields = {name: hash_node(getattr(value, name)) for name in sorted(value.public_fields())}
+            parts = [_encode(name) + node.digest for name, node in fields.items()]
+            cached = EntityNode(
+                digest=_digest(_encode(value.__class__.__qualname__), *parts), value=value, fields=fields
+            )
+            value._meta[HASH_META_KEY] = cached
+        return cached
+    if isinstance(value, Mapping) and all(_is_structural(v) for v in value.values()):
+        entries = {
+            str(key): (hashlib.blake2b(_encode(str(key)), digest_size=DIGEST_SIZE).digest(), hash_node(item))
+            for key, item in value.items()
+        }
+        tree = Bucket.build(entries)
+        return MappingNode(digest=_digest(b"mapping", tree.digest), value=value, tree=tree)
+    if isinstance(value, (list, tuple)) and all(_is_structural(v) for v in value):
+        entries = {
+            key: (hashlib.blake2b(_encode(key), digest_size=DIGEST_SIZE).digest(), hash_node(item))
+            for key, item in zip(_sequence_keys(value), value)
+        }
+        tree = Bucket.build(entries)
+        return MappingNode(digest=_digest(b"sequence", tree.digest), value=value, tree=tree)
+    return Node(digest=_digest(b"value", _encode(value)), value=value)
+
+
+def structural_hash(entity: OntologyBase) -> str:
+    """
+    Merkle hash of the entity: its fields, references by their aliases and the hashes of the owned objects.
+    Computed once and cached, the entities are expected not to change after the load.
+    """
+    return hash_node(entity).digest.hex()
+
+
+@dataclass(kw_only=True)
+class Change:
+    kind: Literal["added", "removed", "changed"]
+    # field names and mapping keys from the compared handlers, e.g. ("vertices", "Vertex1", "label")
+    path: Tuple[str, ...]
+    old: Any = field(default=None, repr=False)
+    new: Any = field(default=None, repr=False)
+
+    def represent(self) -> Dict[str, Any]:
+        return {"kind": self.kind, "path": list(self.path)}
+
+
+def _diff_entries(old: Dict[str, Node], new: Dict[str, Node], path: Tuple[str, ...], changes: List[Change]):
+    for key, node in old.items():
+        if key not in new:
+            changes.append(Change(kind=REMOVED, path=path + (key,), old=node.value))
+    for key, node in new.items():
+        if key not in old:
+            changes.append(Change(kind=ADDED, path=path + (key,), new=node.value))
+        else:
+            _diff_nodes(old[key], node, path + (key,), changes)
+
+
+def _diff_buckets(old: Bucket, new: Bucket, path: Tuple[str, ...], changes: List[Change]):
+    if old.digest == new.digest:
+        return
+    if old.buckets is None or new.buckets is None:
+        _diff_entries(old.flatten(), new.flatten(), path, changes)
+        return
+    for byte in old.buckets.keys() | new.buckets.keys():
+        empty = Bucket(digest=b"", entries={})
+        _diff_buckets(old.buckets.get(byte, empty), new.buckets.get(byte, empty), path, changes)
+
+
+def _diff_nodes(old: Node, new: Node, path: Tuple[str, ...], changes: List[Change]):
+    if old.digest == new.digest:
+        return
+    if isinstance(old, EntityNode) and isinstance(new, EntityNode) and old.value.__class__ is new.value.__class__:
+        for name in old.fields:
+            _diff_nodes(old.fields[name], new.fields[name], path + (name,), changes)
+    elif isinstance(old, MappingNode) and isinstance(new, MappingNode):
+        _diff_buckets(old.tree, new.tree, path, changes)
+    else:
+        changes.append(Change(kind=CHANGED, path=path, old=old.value, new=new.value))
+
+
+def diff(old: OntologyBase, new: OntologyBase) -> List[Change]:
+    """
+    Changes between two versions of a model or an ontology, or of any of their entities.
+    Only the subtrees with different structural hashes are compared, see :func:`structural_hash`.
+    """
+    changes: List[Change] = []
+    _diff_nodes(hash_node(old), hash_node(new), (), changes)
+    return changes
@@ -1,11 +1,15 @@
+import weakref
 from dataclasses import dataclass
 from dataclasses import field
+from dataclasses import InitVar
 from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
 from typing import TYPE_CHECKING
 
+from pydantic import BaseModel
+
 if TYPE_CHECKING:
     from at_ontology_parser.base import OntologyBase
     from at_ontology_parser.parsing.parser import Parser
@@ -15,13 +19,47 @@ if TYPE_CHECKING:
 class Context:
     name: str | int
     data: Optional[Any] = field(default=None, repr=False)
-    initiator: Optional["OntologyBase"] = field(default=None, repr=False)
+    # stored in _initiator, see the initiator property below
+    initiator: InitVar[Optional["OntologyBase"]] = None
     parent: Optional["Context"] = field(default=None, repr=False)
     parser: Optional["Parser"] = field(default=None, repr=False)
+    _initiator: Any = field(init=False, default=None, repr=False)
 
-    def __post_init__(self):
+    def __post_init__(self, initiator: Optional["OntologyBase"]):
+        # the initiator property below replaces the default of the init variable in the class namespace
+        self.initiator = None if isinstance(initiator, property) else initiator
         if self.parent is not None:
             self.parser = self.parent.parser
+        if self.parser is not None and not self.parser.retain_context_data:
+            self.data = None
+            if isinstance(self.initiator, BaseModel):
+                self.initiator = None
+
+    def _get_initiator(self) -> Optional["OntologyBase"]:
+        initiator = self._initiator
+        return initiator() if isinstance(initiator, weakref.ref) else initiator
+
+    def _set_initiator(self, initiator: Optional["OntologyBase"]):
+        # the initiators own the objects keeping their contexts, so a weak pointer back to them is enough,
+        # and contexts shared with other modules don't keep an unloaded module alive.
+        # The parsed pydantic models are kept for debugging, see Parser.retain_context_data
+        if initiator is not None and not isinstance(initiator, BaseModel):
+            try:
+                initiator = weakref.ref(initiator)
+            except TypeError:
+                pass
+        self._initiator = initiator
+
+    initiator = property(_get_initiator, _set_initiator)
+
+    def compact(self):
+        """Releases the parse-time data of the context and its parents, only the path is kept for error reporting."""
+        context = self
+        while context is not None:
+            context.data = None
+            if isinstance(context.initiator, BaseModel):
+                context.initiator = None
+            context = context.parent
 
     @property
     def path(self):
@@ -84,3 +122,16 @@ class LoadException(OntologyException):
 
 class ImportException(OntologyException):
     pass
+
+
+class ConsistencyException(OntologyException):
+    relationships: List[str]
+
+    def __init__(self, *args, context: Context, relationships: List[str]):
+        super().__init__(*args, context=context)
+        self.relationships = relationships
+
+    def represent(self):
+        result = super().represent()
+        result["relationships"] = self.relationships
+        return result
@@ -0,0 +1,163 @@
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+from at_ontology_parser.exceptions import ConsistencyException
+from at_ontology_parser.exceptions import Context
+from at_ontology_parser.exceptions import LoadException
+from at_ontology_parser.ontology.graph import index_graph
+from at_ontology_parser.ontology.graph import strongly_connected_components
+from at_ontology_parser.ontology.inference import relationship_semantics
+from at_ontology_parser.ontology.inference import relationships_by_type
+from at_ontology_parser.ontology.inference import RelationshipSemantics
+
+if TYPE_CHECKING:
+    from at_ontology_parser.ontology.handler import Ontology
+    from at_ontology_parser.ontology.instances.relationship import Relationship
+
+
+def _relationship_context(relationship: "Relationship") -> Context:
+    # references are created in the child contexts of their relationship
+    return relationship.type.context.parent or relationship.type.context
+
+
+def _violation(message: str, relationship_type: str, relationships: List["Relationship"]) -> ConsistencyException:
+    return ConsistencyException(
+        f"{message} for relationship type {relationship_type}",
+        context=_relationship_context(relationships[0]),
+        relationships=[r.name for r in relationships],
+    )
+
+
+def check_reflexivity(relationship_type: str, relationships: List["Relationship"]) -> List[ConsistencyException]:
+    return [
+        _violation("Reflexive relationship is not allowed", relationship_type, [r])
+        for r in relationships
+        if r.source.alias == r.target.alias
+    ]
+
+
+def check_symmetry(relationship_type: str, relationships: List["Relationship"]) -> List[ConsistencyException]:
+    result = []
+    pairs: Dict[Tuple[str, str], "Relationship"] = {}
+    for relationship in relationships:
+        source, target = relationship.source.alias, relationship.target.alias
+        if source == target:
+            continue
+        inverse = pairs.get((target, source))
+        if inverse is not None:
+            result.append(
+                _violation("Symmetric relationships are not allowed", relationship_type, [inverse, relationship])
+            )
+        pairs.setdefault((source, target), relationship)
+    return result
+
+
+def check_transitivity(relationship_type: str, relationships: List["Relationship"]) -> List[ConsistencyException]:
+    """
+    Reports the shortcuts ``a -> c`` over two relationships ``a -> b -> c``. Every relationship is checked as a
+    shortcut by intersecting the successors of its source with the predecessors of its target, iterating over the
+    smaller of them, so the cost is O(E * sqrt(E)) for E relationships even with hub vertices
+    (the bound of triangle listing), and linear for graphs of bounded degree.
+    """
+    result = []
+    outgoing: Dict[str, Dict[str, "Relationship"]] = {}
+    incoming: Dict[str, Dict[str, "Relationship"]] = {}
+    for relationship in relationships:
+        source, target = relationship.source.alias, relationship.target.alias
+        if source != target and target not in outgoing.get(source, {}):
+            outgoing.setdefault(source, {})[target] = relationship
+            incoming.setdefault(target, {})[source] = relationship
+    for source, targets in outgoing.items():
+        for target, shortcut in targets.items():
+            successors, predecessors = targets, incoming[target]
+            if len(successors) <= len(predecessors):
+                middles = [m for m in successors if m in predecessors]
+            else:
+                middles = [m for m in predecessors if m in successors]
+            for middle in middles:
+                if middle != source and middle != target:
+                    result.append(
+                        _violation(
+                            "Transitive relationships are not allowed",
+                            relationship_type,
+                            [successors[middle], outgoing[middle][target], shortcut],
+                        )
+                    )
+    return result
+
+
+def check_acyclicity(
+    relationship_type: str, relationships: List["Relationship"], reported: Optional[Set[int]] = None
+) -> List[ConsistencyException]:
+    """Reports the cycles, except the ones made only of the relationships in ``reported`` (by their ids)."""
+    edges = [(r.source.alias, r.target.alias) for r in relationships]
+    ids, _, adjacency = index_graph(edges)
+    component_of: Dict[int, int] = {}
+    cycles: List[List[int]] = []
+    for component in strongly_connected_components(adjacency):
+        if len(component) > 1:
+            for vertex in component:
+                component_of[vertex] = len(cycles)
+            cycles.append(component)
+
+    cycle_relationships: List[List["Relationship"]] = [[] for _ in cycles]
+    for relationship, (source, target) in zip(relationships, edges):
+        # loops are reported by the reflexivity check
+        c = component_of.get(ids[source])
+        if c is not None and source != target and c == component_of.get(ids[target]):
+            cycle_relationships[c].append(relationship)
+    reported = reported or set()
+    return [
+        _violation("Cycle is not allowed", relationship_type, rels)
+        for rels in cycle_relationships
+        if not all(id(r) in reported for r in rels)
+    ]
+
+
+def is_hierarchy_like(semantics: RelationshipSemantics) -> bool:
+    return semantics.anti_symmetric
+
+
+def check_consistency(
+    ontology: "Ontology",
+    acyclic_types: Optional[Iterable[str]] = None,
+    raise_errors: bool = False,
+    context: Optional[Context] = None,
+) -> List[ConsistencyException]:
+    """
+    Verifies, that relationships of the ontology obey the semantics of their types:
+    anti-reflexive types have no loops, anti-symmetric types have no pairs of opposite relationships,
+    anti-transitive types have no shortcuts over two relationships.
+    Anti-symmetric (hierarchy-like) types and types listed in ``acyclic_types`` are checked for cycles.
+    """
+    acyclic_types: Set[str] = set(acyclic_types or [])
+    result: List[ConsistencyException] = []
+    for relationship_type, relationships in relationships_by_type(ontology).items():
+        semantics = relationship_semantics(relationships[0].type.value)
+        if semantics.anti_reflexive:
+            result += check_reflexivity(relationship_type, relationships)
+        symmetric: List[ConsistencyException] = []
+        if semantics.anti_symmetric:
+            symmetric = check_symmetry(relationship_type, relationships)
+            result += symmetric
+        if semantics.anti_transitive:
+            result += check_transitivity(relationship_type, relationships)
+        if is_hierarchy_like(semantics) or relationship_type in acyclic_types:
+            # the pairs of opposite relationships are cycles already reported by the symmetry check
+            names = {name for violation in symmetric for name in violation.relationships}
+            reported = {id(r) for r in relationships if r.name in names}
+            result += check_acyclicity(relationship_type, relationships, reported)
+
+    if result and raise_errors:
+        context = context or Context(name=ontology.name, data=None, initiator=ontology)
+        raise LoadException(
+            "Ontology relationships are inconsistent with their types",
+            context=context,
+            errors=[e.represent() for e in result],
+        )
+    return result
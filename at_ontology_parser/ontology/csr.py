@@ -0,0 +1,139 @@
+from array import array
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import TYPE_CHECKING
+
+from at_ontology_parser.exceptions import OntologyException
+
+if TYPE_CHECKING:
+    from at_ontology_parser.ontology.handler import Ontology
+    from at_ontology_parser.ontology.instances.vertex import Vertex
+    from at_ontology_parser.ontology.instances.relationship import Relationship
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "numpy is required for CSR export. Install at-ontology-parser with the 'analytics' extra"
+        ) from e
+    return numpy
+
+
+@dataclass(kw_only=True)
+class OntologyCSR:
+    """
+    Integer encoded adjacency of an ontology.
+    For the relationship type ``t`` the targets of the vertex ``v`` are
+    ``targets[t][offsets[t][v]:offsets[t][v + 1]]`` and the relationships forming those edges are
+    ``edge_relationships[t][offsets[t][v]:offsets[t][v + 1]]`` (indices in ``relationship_names``).
+    """
+
+    vertex_names: List[str]
+    vertex_ids: Dict[str, int]
+    vertex_type_names: List[str]
+    vertex_types: Any
+    relationship_types: List[str]
+    relationship_names: List[str]
+    offsets: Dict[str, Any]
+    targets: Dict[str, Any]
+    edge_relationships: Dict[str, Any]
+    _vertices: List["Vertex"] = field(repr=False)
+    _relationships: List["Relationship"] = field(repr=False)
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self.vertex_names)
+
+    def vertex(self, vertex_id: int) -> "Vertex":
+        return self._vertices[vertex_id]
+
+    def vertices(self, vertex_ids) -> List["Vertex"]:
+        return [self._vertices[i] for i in vertex_ids]
+
+    def relationship(self, relationship_id: int) -> "Relationship":
+        return self._relationships[relationship_id]
+
+    def neighbours(self, relationship_type: str, vertex_id: int):
+        offsets = self.offsets[relationship_type]
+        start, end = offsets[vertex_id], offsets[vertex_id + 1]
+        return self.targets[relationship_type][start:end]
+
+    def out_degree(self, relationship_type: str):
+        return _import_numpy().diff(self.offsets[relationship_type])
+
+    def in_degree(self, relationship_type: str):
+        numpy = _import_numpy()
+        return numpy.bincount(self.targets[relationship_type], minlength=self.vertex_count)
+
+
+def build_csr(ontology: "Ontology") -> OntologyCSR:
+    numpy = _import_numpy()
+
+    vertices: List["Vertex"] = list(ontology.vertices.values())
+    vertex_index: Dict[int, int] = {id(v): i for i, v in enumerate(vertices)}
+    type_names: List[str] = []
+    type_index: Dict[str, int] = {}
+
+    def vertex_id(vertex: "Vertex") -> int:
+        # relationships may point to vertices of other loaded ontologies
+        key = id(vertex)
+        if key not in vertex_index:
+            vertex_index[key] = len(vertices)
+            vertices.append(vertex)
+        return vertex_index[key]
+
+    relationships: List["Relationship"] = []
+    edges: Dict[str, tuple[array, array, array]] = {}
+
+    for relationship in ontology.relationships.values():
+        if not (relationship.type.fulfilled and relationship.source.fulfilled and relationship.target.fulfilled):
+            raise OntologyException(
+                f'Can\'t export not resolved relationship "{relationship.name}"',
+                context=relationship.type.context,
+            )
+        sources, targets, edge_relationships = edges.setdefault(
+            relationship.type.value.name, (array("q"), array("q"), array("q"))
+        )
+        sources.append(vertex_id(relationship.source.value))
+        targets.append(vertex_id(relationship.target.value))
+        edge_relationships.append(len(relationships))
+        relationships.append(relationship)
+
+    vertex_types = numpy.empty(len(vertices), dtype=numpy.int32)
+    for i, vertex in enumerate(vertices):
+        type_name = vertex.type.value.name if vertex.type.fulfilled else vertex.type.alias
+        if type_name not in type_index:
+            type_index[type_name] = len(type_names)
+            type_names.append(type_name)
+        vertex_types[i] = type_index[type_name]
+
+    vertex_count = len(vertices)
+    offsets, targets, edge_relationships = {}, {}, {}
+    for relationship_type, (type_sources, type_targets, type_relationships) in edges.items():
+        sources = numpy.frombuffer(type_sources, dtype=numpy.int64)
+        order = numpy.argsort(sources, kind="stable")
+        type_offsets = numpy.zeros(vertex_count + 1, dtype=numpy.int64)
+        numpy.cumsum(numpy.bincount(sources, minlength=vertex_count), out=type_offsets[1:])
+        offsets[relationship_type] = type_offsets
+        targets[relationship_type] = numpy.frombuffer(type_targets, dtype=numpy.int64)[order]
+        edge_relationships[relationship_type] = numpy.frombuffer(type_relationships, dtype=numpy.int64)[order]
+
+    vertex_names = [v.name for v in vertices]
+    return OntologyCSR(
+        vertex_names=vertex_names,
+        vertex_ids={name: i for i, name in enumerate(vertex_names)},
+        vertex_type_names=type_names,
+        vertex_types=vertex_types,
+        relationship_types=list(edges),
+        relationship_names=[r.name for r in relationships],
+        offsets=offsets,
+        targets=targets,
+        edge_relationships=edge_relationships,
+        _vertices=vertices,
+        _relationships=relationships,
+    )
@@ -0,0 +1,114 @@
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Sequence
+
+
+def strongly_connected_components(adjacency: Sequence[Sequence[int]]) -> List[List[int]]:
+    """
+    Iterative Tarjan algorithm over vertices ``0..len(adjacency) - 1``.
+    Components are returned in reverse topological order: every component goes after the components it reaches.
+    """
+    count = len(adjacency)
+    index = [-1] * count
+    lowlink = [0] * count
+    on_stack = [False] * count
+    stack: List[int] = []
+    result: List[List[int]] = []
+    next_index = 0
+
+    for root in range(count):
+        if index[root] != -1:
+            continue
+        work = [(root, 0)]
+        while work:
+            vertex, edge = work.pop()
+            if edge == 0:
+                index[vertex] = lowlink[vertex] = next_index
+                next_index += 1
+                stack.append(vertex)
+                on_stack[vertex] = True
+            successors = adjacency[vertex]
+            while edge < len(successors):
+                successor = successors[edge]
+                edge += 1
+                if index[successor] == -1:
+                    work.append((vertex, edge))
+                    work.append((successor, 0))
+                    break
+                if on_stack[successor] and index[successor] < lowlink[vertex]:
+                    lowlink[vertex] = index[successor]
+            else:
+                if lowlink[vertex] == index[vertex]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == vertex:
+                            break
+                    result.append(component)
+                if work:
+                    parent = work[-1][0]
+                    if lowlink[vertex] < lowlink[parent]:
+                        lowlink[parent] = lowlink[vertex]
+    return result
+
+
+def iter_bits(bits: int) -> Iterator[int]:
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+class ReachabilityIndex:
+    """
+    Transitive closure of a directed graph stored per strongly connected component as an integer bitset
+    of reachable components, so a reachability query is a single bit test.
+    """
+
+    def __init__(self, adjacency: Sequence[Sequence[int]]):
+        self.components = strongly_connected_components(adjacency)
+        self.component_of = [0] * len(adjacency)
+        for c, component in enumerate(self.components):
+            for vertex in component:
+                self.component_of[vertex] = c
+
+        self.reach: List[int] = [0] * len(self.components)
+        # components go in reverse topological order, so successors are ready before their predecessors
+        for c, component in enumerate(self.components):
+            bits = 0
+            cyclic = len(component) > 1
+            for vertex in component:
+                for successor in adjacency[vertex]:
+                    d = self.component_of[successor]
+                    if d == c:
+                        cyclic = True
+                    else:
+                        bits |= self.reach[d] | (1 << d)
+            if cyclic:
+                bits |= 1 << c
+            self.reach[c] = bits
+
+    def reachable(self, source: int, target: int) -> bool:
+        return bool(self.reach[self.component_of[source]] >> self.component_of[target] & 1)
+
+    def successors(self, source: int) -> Iterator[int]:
+        for c in iter_bits(self.reach[self.component_of[source]]):
+            yield from self.components[c]
+
+
+def index_graph(edges: Sequence[tuple]) -> tuple[Dict, List, List[List[int]]]:
+    """Encodes hashable vertices of ``(source, target)`` pairs as integers and builds the adjacency lists."""
+    ids: Dict = {}
+    keys: List = []
+    adjacency: List[List[int]] = []
+    for source, target in edges:
+        for key in (source, target):
+            if key not in ids:
+                ids[key] = len(keys)
+                keys.append(key)
+                adjacency.append([])
+        adjacency[ids[source]].append(ids[target])
+    return ids, keys, adjacency
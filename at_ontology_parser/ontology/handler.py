@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from dataclasses import field
+from pathlib import Path
 from typing import Dict
 from typing import List
 from typing import Optional
@@ -14,6 +15,11 @@ if TYPE_CHECKING:
     from at_ontology_parser.parsing.parser import ModelModule
     from at_ontology_parser.ontology.instances.vertex import Vertex
     from at_ontology_parser.ontology.instances.relationship import Relationship
+    from at_ontology_parser.ontology.csr import OntologyCSR
+    from at_ontology_parser.ontology.inference import InferredRelations
+    from at_ontology_parser.ontology.query import PathQuery
+    from at_ontology_parser.ontology.query import QueryPlan
+    from at_ontology_parser.exceptions import ConsistencyException
 
 
 @dataclass(kw_only=True)
@@ -36,6 +42,32 @@ class Ontology(OntologyEntity):
                 else:
                     return resolved_import[1]
 
+    def to_csr(self) -> "OntologyCSR":
+        from at_ontology_parser.ontology.csr import build_csr
+
+        return build_csr(self)
+
+    def write_snapshot(self, path: str | Path) -> Path:
+        from at_ontology_parser.ontology.snapshot import write_snapshot
+
+        return write_snapshot(self, path)
+
+    def infer_relations(self) -> "InferredRelations":
+        from at_ontology_parser.ontology.inference import InferredRelations
+
+        return InferredRelations(self)
+
+    def query(self, query: "str | PathQuery") -> "QueryPlan":
+        """Plans a path query, iterating the plan yields the matches lazily, see :mod:`.query`."""
+        from at_ontology_parser.ontology.query import QueryPlan
+
+        return QueryPlan.build(self, query)
+
+    def check_consistency(self, acyclic_types: List[str] = None, raise_errors=False) -> List["ConsistencyException"]:
+        from at_ontology_parser.ontology.consistency import check_consistency
+
+        return check_consistency(self, acyclic_types=acyclic_types, raise_errors=raise_errors)
+
     def _to_repr(self, context, minify=True, exclude_name=True, with_restricted=False):
         result = super()._to_repr(context, minify, exclude_name, with_restricted=with_restricted)
         result["name"] = self.name
@@ -0,0 +1,215 @@
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+from at_ontology_parser.ontology.graph import index_graph
+from at_ontology_parser.ontology.graph import ReachabilityIndex
+
+if TYPE_CHECKING:
+    from at_ontology_parser.model.types.relationship_type import RelationshipType
+    from at_ontology_parser.ontology.handler import Ontology
+    from at_ontology_parser.ontology.instances.relationship import Relationship
+    from at_ontology_parser.ontology.instances.vertex import Vertex
+
+# data types of the normative model, that describe the semantics of relationship types
+SEMANTIC_DATA_TYPES = {
+    "reflexivity": "ATOntology.data_types.Reflexivity",
+    "symmetry": "ATOntology.data_types.Symmetry",
+    "transitivity": "ATOntology.data_types.Transitivity",
+}
+
+
+@dataclass(kw_only=True)
+class RelationshipSemantics:
+    reflexivity: Optional[str] = field(default=None)
+    symmetry: Optional[str] = field(default=None)
+    transitivity: Optional[str] = field(default=None)
+
+    @property
+    def reflexive(self) -> bool:
+        return self.reflexivity == "reflexive"
+
+    @property
+    def anti_reflexive(self) -> bool:
+        return self.reflexivity == "anti-reflexive"
+
+    @property
+    def symmetric(self) -> bool:
+        return self.symmetry == "symmetric"
+
+    @property
+    def anti_symmetric(self) -> bool:
+        return self.symmetry == "anti-symmetric"
+
+    @property
+    def transitive(self) -> bool:
+        return self.transitivity == "transitive"
+
+    @property
+    def anti_transitive(self) -> bool:
+        return self.transitivity == "anti-transitive"
+
+
+def relationship_semantics(relationship_type: "RelationshipType") -> RelationshipSemantics:
+    """
+    Reads the semantics from the defaults of the properties typed with the normative
+    ``Reflexivity``, ``Symmetry`` and ``Transitivity`` data types (or their derivatives).
+    Properties of derived types override the properties of their parents.
+    """
+    result = RelationshipSemantics()
+    for entity in relationship_type.derivation:
+        for definition in (entity.properties or {}).values():
+            if definition.type is None or not definition.type.fulfilled:
+                continue
+            derivation_path = definition.type.value.derivation_path
+            for semantic, data_type in SEMANTIC_DATA_TYPES.items():
+                if data_type in derivation_path:
+                    setattr(result, semantic, definition.default)
+    return result
+
+
+def relationships_by_type(ontology: "Ontology") -> Dict[str, List["Relationship"]]:
+    result: Dict[str, List["Relationship"]] = {}
+    for relationship in ontology.relationships.values():
+        if relationship.type.fulfilled:
+            result.setdefault(relationship.type.value.name, []).append(relationship)
+    return result
+
+
+class RelationClosure:
+    """Relation of a single relationship type extended according to its semantics."""
+
+    def __init__(self, semantics: RelationshipSemantics, edges: List[Tuple[str, str]], domain: Set[str]):
+        self.semantics = semantics
+        self.asserted: Set[Tuple[str, str]] = set(edges)
+        self.domain = domain if semantics.reflexive else set()
+
+        if semantics.symmetric:
+            edges = edges + [(target, source) for source, target in edges]
+        self.ids, self.names, adjacency = index_graph(edges)
+
+        self.index: Optional[ReachabilityIndex] = None
+        self.adjacency: List[Set[int]] = []
+        if semantics.transitive:
+            self.index = ReachabilityIndex(adjacency)
+        else:
+            self.adjacency = [set(successors) for successors in adjacency]
+
+    def holds(self, source: str, target: str) -> bool:
+        if source == target and source in self.domain:
+            return True
+        if source not in self.ids or target not in self.ids:
+            return False
+        source_id, target_id = self.ids[source], self.ids[target]
+        if self.index is not None:
+            return self.index.reachable(source_id, target_id)
+        return target_id in self.adjacency[source_id]
+
+    def successors(self, source: str) -> Iterator[str]:
+        reflexive = source in self.domain
+        if source in self.ids:
+            source_id = self.ids[source]
+            successors = self.index.successors(source_id) if self.index is not None else self.adjacency[source_id]
+            for target_id in successors:
+                if target_id == source_id:
+                    reflexive = False
+                yield self.names[target_id]
+        if reflexive:
+            yield source
+
+    def pairs(self) -> Iterator[Tuple[str, str]]:
+        for source in self.names:
+            for target in self.successors(source):
+                yield source, target
+        for source in self.domain - set(self.ids):
+            yield source, source
+
+
+class InferredRelations:
+    """
+    Relations implied by the semantics of the relationship types of an ontology.
+    Closures are computed lazily per relationship type and are never written back as relationships.
+    """
+
+    def __init__(self, ontology: "Ontology"):
+        self.ontology = ontology
+        self._relationships = relationships_by_type(ontology)
+        self._types: Dict[str, "RelationshipType"] = {
+            relationships[0].type.value.name: relationships[0].type.value
+            for relationships in self._relationships.values()
+        }
+        self._closures: Dict[str, RelationClosure] = {}
+
+        # relationships may point to the vertices of other loaded ontologies
+        self._vertices: Dict[str, "Vertex"] = dict(ontology.vertices)
+        for relationships in self._relationships.values():
+            for relationship in relationships:
+                for ref in (relationship.source, relationship.target):
+                    if ref.fulfilled:
+                        self._vertices.setdefault(ref.alias, ref.value)
+
+    @property
+    def relationship_types(self) -> List[str]:
+        return list(self._types)
+
+    def semantics(self, relationship_type: str) -> RelationshipSemantics:
+        if relationship_type not in self._types:
+            return RelationshipSemantics()
+        return relationship_semantics(self._types[relationship_type])
+
+    def _domain(self, relationship_type: "RelationshipType") -> Set[str]:
+        valid_types = [ref.value for ref in relationship_type.valid_source_types or [] if ref.fulfilled]
+        valid_types += [ref.value for ref in relationship_type.valid_target_types or [] if ref.fulfilled]
+        result = set()
+        for relationship in self._relationships.get(relationship_type.name, []):
+            result.add(relationship.source.alias)
+            result.add(relationship.target.alias)
+        if valid_types:
+            for vertex in self.ontology.vertices.values():
+                if vertex.type.fulfilled and any(t in vertex.type.value.derivation for t in valid_types):
+                    result.add(vertex.name)
+        return result
+
+    def closure(self, relationship_type: str) -> RelationClosure:
+        if relationship_type not in self._closures:
+            semantics = self.semantics(relationship_type)
+            relationships = self._relationships.get(relationship_type, [])
+            domain = self._domain(self._types[relationship_type]) if semantics.reflexive else set()
+            self._closures[relationship_type] = RelationClosure(
+                semantics, [(r.source.alias, r.target.alias) for r in relationships], domain
+            )
+        return self._closures[relationship_type]
+
+    @staticmethod
+    def _name(vertex: "Vertex | str") -> str:
+        return vertex if isinstance(vertex, str) else vertex.name
+
+    def holds(self, relationship_type: str, source: "Vertex | str", target: "Vertex | str") -> bool:
+        return self.closure(relationship_type).holds(self._name(source), self._name(target))
+
+    def successors(self, relationship_type: str, source: "Vertex | str") -> Iterator["Vertex"]:
+        for name in self.closure(relationship_type).successors(self._name(source)):
+            yield self._vertex(name)
+
+    def pairs(self, relationship_type: str) -> Iterator[Tuple["Vertex", "Vertex"]]:
+        for source, target in self.closure(relationship_type).pairs():
+            yield self._vertex(source), self._vertex(target)
+
+    def inferred_pairs(self, relationship_type: str) -> Iterator[Tuple["Vertex", "Vertex"]]:
+        closure = self.closure(relationship_type)
+        for source, target in closure.pairs():
+            if (source, target) not in closure.asserted:
+                yield self._vertex(source), self._vertex(target)
+
+    def _vertex(self, name: str) -> "Vertex":
+        return self._vertices.get(name)
+
+
+def infer_relations(ontology: "Ontology") -> InferredRelations:
+    return InferredRelations(ontology)
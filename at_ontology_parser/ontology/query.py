@@ -0,0 +1,312 @@
+"""
+Path queries over the vertices and relationships of an ontology::
+
+    for match in ontology.query("CourseElement {difficulty >= 2} -[Hierarchy]-> * <-[Agregation]- Competence"):
+        print([v.name for v in match.vertices])
+
+A query is a chain of vertex patterns joined by relationship patterns. A vertex pattern is a type name
+(matching the type and its subtypes) or ``*``, optionally followed by conditions on the ``name``, ``label``
+or the properties of the vertex. A relationship pattern is ``-[Type]->`` or ``<-[Type]-``, the type may be
+omitted (``->``, ``-[*]->``). Type names may be given without the model prefix when they are unambiguous.
+
+Queries are planned against the type and adjacency indexes of the ontology: the path is matched from the end
+with fewer candidate vertices, and the matches are yielded one by one as the path is walked depth first.
+"""
+import operator
+import re
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import FrozenSet
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+import yaml
+
+if TYPE_CHECKING:
+    from at_ontology_parser.ontology.handler import Ontology
+    from at_ontology_parser.ontology.instances.relationship import Relationship
+    from at_ontology_parser.ontology.instances.vertex import Vertex
+
+QUERY_INDEX_META_KEY = "query_index"
+
+OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<=": operator.le,
+    ">=": operator.ge,
+    "<": operator.lt,
+    ">": operator.gt,
+}
+# attributes of the vertex itself, other keys of the conditions are properties
+VERTEX_ATTRIBUTES = ("name", "label")
+# share of the candidates assumed to pass a property condition when the ends of a path are compared
+CONDITION_SELECTIVITY = 0.25
+
+_NODE_RE = re.compile(r"\s*(\*|[\w.]+)?\s*(?:\{([^}]*)\})?\s*")
+_EDGE_RE = re.compile(r"(<-\[\s*([\w.*]*)\s*\]-(?!>)|-\[\s*([\w.*]*)\s*\]->|<-(?![-\[])|->)")
+_CONDITION_RE = re.compile(r"\s*([\w.]+)\s*(!=|<=|>=|=|<|>)\s*(\"(?:[^\"\\]|\\.)*\"|'[^']*'|[^,]+?)\s*(?:,|$)")
+
+
+class QuerySyntaxError(ValueError):
+    def __init__(self, msg: str, text: str, position: int):
+        super().__init__(f"{msg} at position {position}: {text[:position]} >>> {text[position:]}")
+        self.text = text
+        self.position = position
+
+
+@dataclass(frozen=True, kw_only=True)
+class Condition:
+    key: str
+    operator: str
+    value: Any
+
+    def test(self, vertex: "Vertex") -> bool:
+        if self.key in VERTEX_ATTRIBUTES:
+            actual = getattr(vertex, self.key)
+        else:
+            props = vertex.props
+            if self.key not in props:
+                return False
+            actual = props[self.key]
+        try:
+            return OPERATORS[self.operator](actual, self.value)
+        except TypeError:
+            return False
+
+
+@dataclass(frozen=True, kw_only=True)
+class NodePattern:
+    type: Optional[str] = field(default=None)
+    conditions: Tuple[Condition, ...] = field(default=())
+
+
+@dataclass(frozen=True, kw_only=True)
+class EdgePattern:
+    type: Optional[str] = field(default=None)
+    forward: bool = field(default=True)
+
+    def reversed(self) -> "EdgePattern":
+        return EdgePattern(type=self.type, forward=not self.forward)
+
+
+@dataclass(frozen=True, kw_only=True)
+class PathQuery:
+    nodes: Tuple[NodePattern, ...]
+    edges: Tuple[EdgePattern, ...]
+
+    def reversed(self) -> "PathQuery":
+        return PathQuery(nodes=self.nodes[::-1], edges=tuple(e.reversed() for e in self.edges[::-1]))
+
+
+def _parse_conditions(text: str, body: str, offset: int) -> Tuple[Condition, ...]:
+    result = []
+    position = 0
+    while position < len(body) and body[position:].strip():
+        match = _CONDITION_RE.match(body, position)
+        if not match:
+            raise QuerySyntaxError("Bad condition", text, offset + position)
+        key, op, raw = match.groups()
+        result.append(Condition(key=key, operator=op, value=yaml.safe_load(raw)))
+        position = match.end()
+    return tuple(result)
+
+
+def _parse_node(text: str, position: int) -> Tuple[NodePattern, int]:
+    match = _NODE_RE.match(text, position)
+    type_name, body = match.groups()
+    if type_name is None and body is None:
+        raise QuerySyntaxError("Expected a vertex pattern", text, position)
+    conditions = _parse_conditions(text, body, match.start(2)) if body is not None else ()
+    return NodePattern(type=None if type_name in (None, "*") else type_name, conditions=conditions), match.end()
+
+
+def parse_query(text: str) -> PathQuery:
+    node, position = _parse_node(text, 0)
+    nodes, edges = [node], []
+    while position < len(text):
+        match = _EDGE_RE.match(text, position)
+        if not match:
+            raise QuerySyntaxError("Expected a relationship pattern", text, position)
+        arrow, backward_type, forward_type = match.groups()
+        forward = not arrow.startswith("<")
+        type_name = forward_type if forward else backward_type
+        edges.append(EdgePattern(type=None if type_name in (None, "", "*") else type_name, forward=forward))
+        node, position = _parse_node(text, match.end())
+        nodes.append(node)
+    return PathQuery(nodes=tuple(nodes), edges=tuple(edges))
+
+
+class PathMatch(NamedTuple):
+    vertices: Tuple["Vertex", ...]
+    relationships: Tuple["Relationship", ...]
+
+
+# relationships of a vertex keyed by the relationship type and every parent of it, None keys all of them
+Adjacency = Dict[str, Dict[Optional[str], List[Tuple["Relationship", "Vertex"]]]]
+
+
+class QueryIndex:
+    """Vertices by type (including subtypes) and relationships by vertex and type, built once per ontology state."""
+
+    def __init__(self, ontology: "Ontology"):
+        self.vertices: Dict[str, "Vertex"] = dict(ontology.vertices)
+        self.outgoing: Adjacency = {}
+        self.incoming: Adjacency = {}
+        self.type_names: Set[str] = set()
+
+        for relationship in ontology.relationships.values():
+            if not (relationship.type.fulfilled and relationship.source.fulfilled and relationship.target.fulfilled):
+                continue
+            source, target = relationship.source.value, relationship.target.value
+            # relationships may point to the vertices of other loaded ontologies
+            self.vertices.setdefault(source.name, source)
+            self.vertices.setdefault(target.name, target)
+            type_names = [None, *relationship.type.value.derivation_path]
+            self.type_names.update(type_names[1:])
+            for type_name in type_names:
+                self.outgoing.setdefault(source.name, {}).setdefault(type_name, []).append((relationship, target))
+                self.incoming.setdefault(target.name, {}).setdefault(type_name, []).append((relationship, source))
+
+        self.by_type: Dict[str, List["Vertex"]] = {}
+        self.vertex_types: Dict[str, FrozenSet[str]] = {}
+        for vertex in self.vertices.values():
+            type_names = vertex.type.value.derivation_path if vertex.type.fulfilled else []
+            self.vertex_types[vertex.name] = frozenset(type_names)
+            self.type_names.update(type_names)
+            for type_name in type_names:
+                self.by_type.setdefault(type_name, []).append(vertex)
+
+        self.index_type_names(self.type_names)
+
+    def index_type_names(self, type_names: Set[str]):
+        self.type_names = type_names
+        self.short_type_names: Dict[str, List[str]] = {}
+        for type_name in sorted(type_names):
+            self.short_type_names.setdefault(type_name.rsplit(".", 1)[-1], []).append(type_name)
+
+    @classmethod
+    def of(cls, ontology: "Ontology") -> "QueryIndex":
+        """The cached index of the ontology, rebuilt when vertices or relationships are added, removed or replaced."""
+        cached = ontology._meta.get(QUERY_INDEX_META_KEY)
+        # the instances are held by the cache so that their ids are not reused while compared
+        instances = (list(ontology.vertices.values()), list(ontology.relationships.values()))
+        if cached is None or any(
+            [id(obj) for obj in old] != [id(obj) for obj in new] for old, new in zip(cached[0], instances)
+        ):
+            cached = (instances, cls(ontology))
+            ontology._meta[QUERY_INDEX_META_KEY] = cached
+        return cached[1]
+
+    def resolve_type(self, name: Optional[str]) -> Optional[str]:
+        if name is None or name in self.type_names:
+            return name
+        candidates = self.short_type_names.get(name, [])
+        if len(candidates) > 1:
+            raise ValueError(f'Type name "{name}" is ambiguous: {", ".join(candidates)}')
+        # unknown types are kept, they just match nothing
+        return candidates[0] if candidates else name
+
+    def resolve(self, query: PathQuery) -> PathQuery:
+        return PathQuery(
+            nodes=tuple(NodePattern(type=self.resolve_type(n.type), conditions=n.conditions) for n in query.nodes),
+            edges=tuple(EdgePattern(type=self.resolve_type(e.type), forward=e.forward) for e in query.edges),
+        )
+
+    @staticmethod
+    def name_condition(node: NodePattern) -> Optional[str]:
+        return next((c.value for c in node.conditions if c.key == "name" and c.operator == "="), None)
+
+    def candidates(self, node: NodePattern) -> Iterable["Vertex"]:
+        name = self.name_condition(node)
+        if name is not None:
+            vertex = self.vertices.get(name)
+            return [vertex] if vertex is not None else []
+        if node.type is None:
+            return list(self.vertices.values())
+        return self.by_type.get(node.type, [])
+
+    def count(self, node: NodePattern) -> int:
+        return len(self.candidates(node))
+
+    def estimate(self, node: NodePattern) -> float:
+        return self.count(node) * CONDITION_SELECTIVITY ** sum(c.key != "name" for c in node.conditions)
+
+    def matches(self, vertex: "Vertex", node: NodePattern) -> bool:
+        if node.type is not None and node.type not in self.vertex_types.get(vertex.name, ()):
+            return False
+        return all(condition.test(vertex) for condition in node.conditions)
+
+    def neighbours(self, vertex: "Vertex", edge: EdgePattern) -> Iterable[Tuple["Relationship", "Vertex"]]:
+        adjacency = self.outgoing if edge.forward else self.incoming
+        return adjacency.get(vertex.name, {}).get(edge.type, [])
+
+
+@dataclass(kw_only=True)
+class QueryPlan:
+    """Planned query, iterate it to get the :class:`PathMatch` es lazily."""
+
+    query: PathQuery
+    index: QueryIndex = field(repr=False)
+    # the path is walked from the last vertex pattern
+    from_end: bool
+    estimates: Tuple[float, float]
+
+    @classmethod
+    def build(cls, ontology: "Ontology", query: str | PathQuery, index: Optional[QueryIndex] = None) -> "QueryPlan":
+        index = index or QueryIndex.of(ontology)
+        query = index.resolve(parse_query(query) if isinstance(query, str) else query)
+        estimates = (index.estimate(query.nodes[0]), index.estimate(query.nodes[-1]))
+        return cls(query=query, index=index, from_end=estimates[1] < estimates[0], estimates=estimates)
+
+    def explain(self) -> str:
+        start, end = ("last", "first") if self.from_end else ("first", "last")
+        return (
+            f"walk {len(self.query.edges)} relationship(s) from the {start} vertex pattern "
+            f"(~{self.estimates[self.from_end]:g} candidates) to the {end} one (~{self.estimates[not self.from_end]:g})"
+        )
+
+    def __iter__(self) -> Iterator[PathMatch]:
+        query = self.query.reversed() if self.from_end else self.query
+        nodes, edges, index = query.nodes, query.edges, self.index
+        for start in index.candidates(nodes[0]):
+            if not index.matches(start, nodes[0]):
+                continue
+            if not edges:
+                yield PathMatch(vertices=(start,), relationships=())
+                continue
+
+            vertices, relationships = [start], []
+            # a stack of the neighbour iterators of the vertices of the current path
+            stack = [iter(index.neighbours(start, edges[0]))]
+            while stack:
+                step = len(stack)
+                for relationship, vertex in stack[-1]:
+                    if index.matches(vertex, nodes[step]):
+                        break
+                else:
+                    stack.pop()
+                    if stack:
+                        vertices.pop()
+                        relationships.pop()
+                    continue
+
+                if step == len(edges):
+                    yield self._match([*vertices, vertex], [*relationships, relationship])
+                else:
+                    vertices.append(vertex)
+                    relationships.append(relationship)
+                    stack.append(iter(index.neighbours(vertex, edges[step])))
+
+    def _match(self, vertices: List["Vertex"], relationships: List["Relationship"]) -> PathMatch:
+        if self.from_end:
+            return PathMatch(vertices=tuple(reversed(vertices)), relationships=tuple(reversed(relationships)))
+        return PathMatch(vertices=tuple(vertices), relationships=tuple(relationships))
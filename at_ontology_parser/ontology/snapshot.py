@@ -0,0 +1,486 @@
+import json
+import mmap
+import struct
+from array import array
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import TYPE_CHECKING
+
+from at_ontology_parser.exceptions import Context
+from at_ontology_parser.exceptions import OntologyException
+from at_ontology_parser.model.types import ONTOLOGY_TYPES
+
+if TYPE_CHECKING:
+    from at_ontology_parser.base import Derivable
+    from at_ontology_parser.base import Instance
+    from at_ontology_parser.ontology.handler import Ontology
+
+MAGIC = b"ATOSNAP1"
+VERSION = 1
+
+# section order in the file, every section is 8 bytes aligned
+SECTIONS = [
+    "string_offsets",
+    "strings",
+    "types",
+    "vertices",
+    "relationships",
+    "type_order",
+    "vertex_order",
+    "relationship_order",
+    "csr_types",
+    "csr_offsets",
+    "csr_edges",
+    "blob",
+]
+HEADER = struct.Struct(f"<8sII{len(SECTIONS) * 2}Q")
+
+# record layouts (int64 fields)
+TYPE_FIELDS = 5  # name, section, derived_from, blob offset, blob length
+VERTEX_FIELDS = 6  # name, type, label, description, blob offset, blob length
+RELATIONSHIP_FIELDS = 8  # name, type, source, target, label, description, blob offset, blob length
+CSR_TYPE_FIELDS = 2  # relationship type, start in csr_offsets
+
+TYPE_SECTIONS = list(ONTOLOGY_TYPES.sections())
+NONE = -1
+
+
+class _SnapshotWriter:
+    def __init__(self):
+        self.strings: Dict[str, int] = {}
+        self.blob = bytearray()
+
+    def intern(self, value: Optional[str]) -> int:
+        if value is None:
+            return NONE
+        if value not in self.strings:
+            self.strings[value] = len(self.strings)
+        return self.strings[value]
+
+    def pack(self, data: Any) -> tuple[int, int]:
+        if not data:
+            return 0, 0
+        encoded = json.dumps(data, ensure_ascii=False, default=str).encode("utf-8")
+        offset = len(self.blob)
+        self.blob += encoded
+        return offset, len(encoded)
+
+    def string_sections(self) -> tuple[array, bytes]:
+        offsets = array("q", [0])
+        encoded = bytearray()
+        for value in self.strings:
+            encoded += value.encode("utf-8")
+            offsets.append(len(encoded))
+        return offsets, bytes(encoded)
+
+
+def _collect_types(ontology: "Ontology") -> List["Derivable"]:
+    from at_ontology_parser.parsing.parser import Parser
+
+    result: List["Derivable"] = []
+    for model in Parser._bypass_import_definitions(ontology)[1:]:
+        for section in TYPE_SECTIONS:
+            result += list(getattr(model, section).values())
+    return result
+
+
+def write_snapshot(ontology: "Ontology", path: str | Path) -> Path:
+    """
+    Writes a resolved ontology with the types of its imported models into a single read-only file,
+    that can be opened by many processes with :meth:`OntologySnapshot.open` sharing the same pages.
+    """
+    path = Path(path)
+    context = Context(name=ontology.name, data=None, initiator=ontology)
+    writer = _SnapshotWriter()
+
+    types = _collect_types(ontology)
+    type_index: Dict[int, int] = {id(t): i for i, t in enumerate(types)}
+
+    def get_type_index(entity: "Derivable") -> int:
+        if id(entity) not in type_index:
+            type_index[id(entity)] = len(types)
+            types.append(entity)
+        return type_index[id(entity)]
+
+    vertices: List["Instance"] = list(ontology.vertices.values())
+    vertex_index: Dict[int, int] = {id(v): i for i, v in enumerate(vertices)}
+    relationships = list(ontology.relationships.values())
+
+    for instance in vertices + relationships:
+        if not instance.type.fulfilled:
+            raise OntologyException(
+                f'Can\'t write snapshot of not resolved instance "{instance.name}"', context=instance.type.context
+            )
+
+    vertex_records = array("q")
+    for vertex in vertices:
+        vertex_records.extend(
+            [
+                writer.intern(vertex.name),
+                get_type_index(vertex.type.value),
+                writer.intern(vertex.label),
+                writer.intern(vertex.description),
+                *writer.pack(vertex._represent_properties(context.create_child(vertex.name))),
+            ]
+        )
+
+    relationship_records = array("q")
+    edges: Dict[int, List[tuple[int, int]]] = {}
+    for i, relationship in enumerate(relationships):
+        endpoints = []
+        for ref in [relationship.source, relationship.target]:
+            if not ref.fulfilled or id(ref.value) not in vertex_index:
+                raise OntologyException(
+                    f'Can\'t write snapshot of relationship "{relationship.name}" to unknown vertex "{ref.alias}"',
+                    context=ref.context,
+                )
+            endpoints.append(vertex_index[id(ref.value)])
+        relationship_type = get_type_index(relationship.type.value)
+        relationship_records.extend(
+            [
+                writer.intern(relationship.name),
+                relationship_type,
+                *endpoints,
+                writer.intern(relationship.label),
+                writer.intern(relationship.description),
+                *writer.pack(relationship._represent_properties(context.create_child(relationship.name))),
+            ]
+        )
+        edges.setdefault(relationship_type, []).append((endpoints[0], i))
+
+    csr_types, csr_offsets, csr_edges = array("q"), array("q"), array("q")
+    for relationship_type, type_edges in edges.items():
+        csr_types.extend([relationship_type, len(csr_offsets)])
+        counts = [len(csr_edges)] + [0] * len(vertices)
+        for source, _ in type_edges:
+            counts[source + 1] += 1
+        for i in range(len(vertices)):
+            counts[i + 1] += counts[i]
+        csr_offsets.extend(counts)
+        positions = counts[:-1]
+        type_csr_edges = [0] * len(type_edges)
+        for source, relationship in type_edges:
+            type_csr_edges[positions[source] - counts[0]] = relationship
+            positions[source] += 1
+        csr_edges.extend(type_csr_edges)
+
+    # types are written last, because instances and derivations may add types outside of the imported models
+    type_records = array("q")
+    for entity in types:
+        derived_from = NONE
+        if entity.derived_from is not None and entity.derived_from.fulfilled:
+            derived_from = get_type_index(entity.derived_from.value)
+        type_records.extend(
+            [
+                writer.intern(entity.name),
+                TYPE_SECTIONS.index(ONTOLOGY_TYPES.class_to_section_mapping()[entity.__class__]),
+                derived_from,
+                *writer.pack(entity.to_representation(context.create_child(entity.name))),
+            ]
+        )
+
+    string_offsets, strings = writer.string_sections()
+    names = list(writer.strings)
+
+    def name_order(records: array, fields: int) -> array:
+        count = len(records) // fields
+        return array("q", sorted(range(count), key=lambda i: names[records[i * fields]]))
+
+    data = {
+        "string_offsets": string_offsets.tobytes(),
+        "strings": strings,
+        "types": type_records.tobytes(),
+        "vertices": vertex_records.tobytes(),
+        "relationships": relationship_records.tobytes(),
+        "type_order": name_order(type_records, TYPE_FIELDS).tobytes(),
+        "vertex_order": name_order(vertex_records, VERTEX_FIELDS).tobytes(),
+        "relationship_order": name_order(relationship_records, RELATIONSHIP_FIELDS).tobytes(),
+        "csr_types": csr_types.tobytes(),
+        "csr_offsets": csr_offsets.tobytes(),
+        "csr_edges": csr_edges.tobytes(),
+        "blob": bytes(writer.blob),
+    }
+
+    positions = []
+    offset = HEADER.size
+    for section in SECTIONS:
+        offset += -offset % 8
+        positions += [offset, len(data[section])]
+        offset += len(data[section])
+
+    with open(path, "wb") as stream:
+        stream.write(HEADER.pack(MAGIC, VERSION, len(vertices), *positions))
+        for section in SECTIONS:
+            stream.write(b"\0" * (-stream.tell() % 8))
+            stream.write(data[section])
+    return path
+
+
+class TypeView:
+    __slots__ = ("_snapshot", "index")
+
+    def __init__(self, snapshot: "OntologySnapshot", index: int):
+        self._snapshot = snapshot
+        self.index = index
+
+    def _field(self, i: int) -> int:
+        return self._snapshot._types[self.index * TYPE_FIELDS + i]
+
+    @property
+    def name(self) -> str:
+        return self._snapshot.string(self._field(0))
+
+    @property
+    def section(self) -> str:
+        return TYPE_SECTIONS[self._field(1)]
+
+    @property
+    def derived_from(self) -> Optional["TypeView"]:
+        derived_from = self._field(2)
+        return None if derived_from == NONE else TypeView(self._snapshot, derived_from)
+
+    @property
+    def derivation_path(self) -> List[str]:
+        result = []
+        current = self
+        while current is not None:
+            result.insert(0, current.name)
+            current = current.derived_from
+        return result
+
+    def to_representation(self) -> Dict[str, Any]:
+        return self._snapshot.unpack(self._field(3), self._field(4)) or {}
+
+    def __eq__(self, other):
+        return isinstance(other, TypeView) and other._snapshot is self._snapshot and other.index == self.index
+
+    def __hash__(self):
+        return hash(("type", self.index))
+
+    def __repr__(self):
+        return f"TypeView(name={self.name!r})"
+
+
+class VertexView:
+    __slots__ = ("_snapshot", "index")
+
+    def __init__(self, snapshot: "OntologySnapshot", index: int):
+        self._snapshot = snapshot
+        self.index = index
+
+    def _field(self, i: int) -> int:
+        return self._snapshot._vertices[self.index * VERTEX_FIELDS + i]
+
+    @property
+    def name(self) -> str:
+        return self._snapshot.string(self._field(0))
+
+    @property
+    def type(self) -> TypeView:
+        return TypeView(self._snapshot, self._field(1))
+
+    @property
+    def label(self) -> Optional[str]:
+        return self._snapshot.string(self._field(2))
+
+    @property
+    def description(self) -> Optional[str]:
+        return self._snapshot.string(self._field(3))
+
+    @property
+    def properties(self) -> Dict[str, Any]:
+        return self._snapshot.unpack(self._field(4), self._field(5)) or {}
+
+    def __eq__(self, other):
+        return isinstance(other, VertexView) and other._snapshot is self._snapshot and other.index == self.index
+
+    def __hash__(self):
+        return hash(("vertex", self.index))
+
+    def __repr__(self):
+        return f"VertexView(name={self.name!r})"
+
+
+class RelationshipView:
+    __slots__ = ("_snapshot", "index")
+
+    def __init__(self, snapshot: "OntologySnapshot", index: int):
+        self._snapshot = snapshot
+        self.index = index
+
+    def _field(self, i: int) -> int:
+        return self._snapshot._relationships[self.index * RELATIONSHIP_FIELDS + i]
+
+    @property
+    def name(self) -> str:
+        return self._snapshot.string(self._field(0))
+
+    @property
+    def type(self) -> TypeView:
+        return TypeView(self._snapshot, self._field(1))
+
+    @property
+    def source(self) -> VertexView:
+        return VertexView(self._snapshot, self._field(2))
+
+    @property
+    def target(self) -> VertexView:
+        return VertexView(self._snapshot, self._field(3))
+
+    @property
+    def label(self) -> Optional[str]:
+        return self._snapshot.string(self._field(4))
+
+    @property
+    def description(self) -> Optional[str]:
+        return self._snapshot.string(self._field(5))
+
+    @property
+    def properties(self) -> Dict[str, Any]:
+        return self._snapshot.unpack(self._field(6), self._field(7)) or {}
+
+    def __eq__(self, other):
+        return isinstance(other, RelationshipView) and other._snapshot is self._snapshot and other.index == self.index
+
+    def __hash__(self):
+        return hash(("relationship", self.index))
+
+    def __repr__(self):
+        return f"RelationshipView(name={self.name!r})"
+
+
+class OntologySnapshot:
+    """
+    Read-only view over a file written by :func:`write_snapshot`.
+    The file is memory mapped, so all processes opening the same snapshot share its pages.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        with open(self.path, "rb") as stream:
+            self._mmap = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = memoryview(self._mmap)
+
+        magic, version, self.vertex_count, *positions = HEADER.unpack_from(self._buffer)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"File {self.path} is not an ontology snapshot of version {VERSION}")
+
+        sections = {}
+        for i, section in enumerate(SECTIONS):
+            start, end = positions[i * 2], positions[i * 2] + positions[i * 2 + 1]
+            sections[section] = self._buffer[start:end]
+
+        self._string_offsets = sections["string_offsets"].cast("q")
+        self._strings = sections["strings"]
+        self._types = sections["types"].cast("q")
+        self._vertices = sections["vertices"].cast("q")
+        self._relationships = sections["relationships"].cast("q")
+        self._type_order = sections["type_order"].cast("q")
+        self._vertex_order = sections["vertex_order"].cast("q")
+        self._relationship_order = sections["relationship_order"].cast("q")
+        self._csr_offsets = sections["csr_offsets"].cast("q")
+        self._csr_edges = sections["csr_edges"].cast("q")
+        self._blob = sections["blob"]
+
+        csr_types = sections["csr_types"].cast("q")
+        self._csr: Dict[int, int] = {
+            csr_types[i * CSR_TYPE_FIELDS]: csr_types[i * CSR_TYPE_FIELDS + 1]
+            for i in range(len(csr_types) // CSR_TYPE_FIELDS)
+        }
+        csr_types.release()
+
+    @classmethod
+    def open(cls, path: str | Path) -> "OntologySnapshot":
+        return cls(path)
+
+    def close(self):
+        for name in [
+            "_string_offsets",
+            "_strings",
+            "_types",
+            "_vertices",
+            "_relationships",
+            "_type_order",
+            "_vertex_order",
+            "_relationship_order",
+            "_csr_offsets",
+            "_csr_edges",
+            "_blob",
+            "_buffer",
+        ]:
+            view = self.__dict__.pop(name, None)
+            if view is not None:
+                view.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "OntologySnapshot":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def string(self, index: int) -> Optional[str]:
+        if index == NONE:
+            return None
+        start, end = self._string_offsets[index], self._string_offsets[index + 1]
+        return str(self._strings[start:end], "utf-8")
+
+    def unpack(self, offset: int, length: int) -> Any:
+        if not length:
+            return None
+        end = offset + length
+        return json.loads(str(self._blob[offset:end], "utf-8"))
+
+    @property
+    def types(self) -> Iterator[TypeView]:
+        return (TypeView(self, i) for i in range(len(self._types) // TYPE_FIELDS))
+
+    @property
+    def vertices(self) -> Iterator[VertexView]:
+        return (VertexView(self, i) for i in range(self.vertex_count))
+
+    @property
+    def relationships(self) -> Iterator[RelationshipView]:
+        return (RelationshipView(self, i) for i in range(len(self._relationships) // RELATIONSHIP_FIELDS))
+
+    def _find(self, order: memoryview, records: memoryview, fields: int, name: str) -> Optional[int]:
+        low, high = 0, len(order)
+        while low < high:
+            middle = (low + high) // 2
+            current = self.string(records[order[middle] * fields])
+            if current < name:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(order) and self.string(records[order[low] * fields]) == name:
+            return order[low]
+        return None
+
+    def type(self, name: str) -> Optional[TypeView]:
+        index = self._find(self._type_order, self._types, TYPE_FIELDS, name)
+        return None if index is None else TypeView(self, index)
+
+    def vertex(self, name: str) -> Optional[VertexView]:
+        index = self._find(self._vertex_order, self._vertices, VERTEX_FIELDS, name)
+        return None if index is None else VertexView(self, index)
+
+    def relationship(self, name: str) -> Optional[RelationshipView]:
+        index = self._find(self._relationship_order, self._relationships, RELATIONSHIP_FIELDS, name)
+        return None if index is None else RelationshipView(self, index)
+
+    def outgoing(self, vertex: VertexView, relationship_type: TypeView | str) -> List[RelationshipView]:
+        if isinstance(relationship_type, str):
+            relationship_type = self.type(relationship_type)
+        if relationship_type is None or relationship_type.index not in self._csr:
+            return []
+        row = self._csr[relationship_type.index] + vertex.index
+        start, end = self._csr_offsets[row], self._csr_offsets[row + 1]
+        return [RelationshipView(self, edge) for edge in self._csr_edges[start:end]]
+
+    def neighbours(self, vertex: VertexView, relationship_type: TypeView | str) -> List[VertexView]:
+        return [relationship.target for relationship in self.outgoing(vertex, relationship_type)]
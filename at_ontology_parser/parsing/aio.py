@@ -0,0 +1,140 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Optional
+from typing import TypeVar
+
+from at_ontology_parser.model import OntologyModel
+from at_ontology_parser.ontology.handler import Ontology
+from at_ontology_parser.parsing.instrumentation import PHASE_READ
+from at_ontology_parser.parsing.instrumentation import PHASE_VALIDATION
+from at_ontology_parser.parsing.instrumentation import PhaseHook
+from at_ontology_parser.parsing.instrumentation import PhaseRecord
+from at_ontology_parser.parsing.parser import Parser
+
+R = TypeVar("R")
+
+# phases that may be interrupted, only when they are not nested into another phase of the load:
+# the nested ones (e.g. reading an imported model) run after the load has registered its entities
+CANCELLABLE_PHASES = (PHASE_READ, PHASE_VALIDATION)
+
+
+class LoadCancelled(Exception):
+    pass
+
+
+@dataclass(kw_only=True)
+class AsyncParser:
+    """
+    asyncio facade of :class:`Parser`. Blocking operations run in a bounded thread pool, at most
+    ``max_concurrency`` of them are submitted at once, the other callers wait for a free slot.
+
+    A cancelled load stops at the start of its next top-level reading or validation phase of the root file,
+    before anything is registered. Once the load starts converting and registering the loaded entities
+    (including the reading of its imports) it runs to the end and its result is discarded.
+    """
+
+    parser: Parser = field(default_factory=Parser)
+    max_workers: int = field(default=4)
+    max_concurrency: Optional[int] = field(default=None)
+    executor: Optional[ThreadPoolExecutor] = field(default=None, repr=False)
+
+    _own_executor: bool = field(init=False, default=False, repr=False)
+    _semaphore: asyncio.Semaphore = field(init=False, repr=False)
+    _local: threading.local = field(init=False, repr=False, default_factory=threading.local)
+    _hook: Optional[PhaseHook] = field(init=False, default=None, repr=False)
+
+    def __post_init__(self):
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="at-ontology")
+            self._own_executor = True
+        self._semaphore = asyncio.Semaphore(self.max_concurrency or self.max_workers)
+        self._hook = self.parser.add_phase_hook(on_phase_start=self._check_cancelled, on_phase_end=self._leave_phase)
+
+    async def __aenter__(self) -> "AsyncParser":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def aclose(self):
+        if self._own_executor:
+            await asyncio.get_running_loop().run_in_executor(None, self.executor.shutdown)
+        # the parser outlives the facade, it must not keep calling the hooks of a closed one
+        if self._hook is not None:
+            self.parser.remove_phase_hook(self._hook)
+            self._hook = None
+
+    def _check_cancelled(self, phase: str, module: Optional[str]):
+        # the depth of the phases of this thread, the end hook is called even if this one raises
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        cancelled: Optional[threading.Event] = getattr(self._local, "cancelled", None)
+        if cancelled is not None and cancelled.is_set() and phase in CANCELLABLE_PHASES and not depth:
+            raise LoadCancelled(f"Load of {module} is cancelled")
+
+    def _leave_phase(self, record: PhaseRecord):
+        self._local.depth = max(getattr(self._local, "depth", 0) - 1, 0)
+
+    def _call(self, cancelled: threading.Event, func: Callable[..., R], args, kwargs) -> R:
+        if cancelled.is_set():
+            raise LoadCancelled("Cancelled before start")
+        self._local.cancelled = cancelled
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._local.cancelled = None
+
+    async def run(self, func: Callable[..., R], *args, **kwargs) -> R:
+        """Runs a blocking parser operation in the executor, waiting for a free slot first."""
+        async with self._semaphore:
+            cancelled = threading.Event()
+            future = self.executor.submit(self._call, cancelled, func, args, kwargs)
+            try:
+                return await asyncio.wrap_future(future)
+            except asyncio.CancelledError:
+                cancelled.set()
+                if not future.cancel():
+                    # the slot stays taken until the worker really stops
+                    await asyncio.wait([asyncio.wrap_future(future)])
+                raise
+
+    async def load_ontology(self, full_path: str | Path) -> Ontology:
+        return await self.run(self.parser.load_ontology, full_path)
+
+    async def load_ontology_yaml_file(self, full_path: str | Path, orig_name: Optional[str] = None) -> Ontology:
+        return await self.run(self.parser.load_ontology_yaml_file, full_path, orig_name)
+
+    async def load_ontology_archive(self, full_path: str | Path) -> Ontology:
+        return await self.run(self.parser.load_ontology_archive, full_path)
+
+    async def load_model(self, full_path: str | Path) -> OntologyModel:
+        return await self.run(self.parser.load_model, full_path)
+
+    async def load_model_yaml_file(self, full_path: str | Path, orig_name: Optional[str] = None) -> OntologyModel:
+        return await self.run(self.parser.load_model_yaml_file, full_path, orig_name)
+
+    async def load_model_archive(self, full_path: str | Path) -> OntologyModel:
+        return await self.run(self.parser.load_model_archive, full_path)
+
+    async def build_archive(self, root_handler: Ontology | OntologyModel, **kwargs: Any) -> Path:
+        return await self.run(self.parser.build_archive, root_handler, **kwargs)
+
+    async def build_delta_archive(
+        self, root_handler: Ontology | OntologyModel, base_archive: str | Path, **kwargs: Any
+    ) -> Path:
+        return await self.run(self.parser.build_delta_archive, root_handler, base_archive, **kwargs)
+
+    async def load_ontology_delta_archive(self, base_archive: str | Path, *delta_archives: str | Path) -> Ontology:
+        return await self.run(self.parser.load_ontology_delta_archive, base_archive, *delta_archives)
+
+    async def load_model_delta_archive(self, base_archive: str | Path, *delta_archives: str | Path) -> OntologyModel:
+        return await self.run(self.parser.load_model_delta_archive, base_archive, *delta_archives)
+
+    async def export_module(self, module, export_file_subpath: str | Path, export_dir: str | Path, **kwargs) -> Path:
+        return await self.run(self.parser.export_module, module, export_file_subpath, export_dir, **kwargs)
@@ -0,0 +1,270 @@
+import hashlib
+import io
+import json
+import os
+import zipfile
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+import yaml
+
+from at_ontology_parser.exceptions import Context
+from at_ontology_parser.exceptions import ImportException
+from at_ontology_parser.exceptions import LoadException
+from at_ontology_parser.model import OntologyModel
+from at_ontology_parser.model.definitions import ImportDefinition
+from at_ontology_parser.ontology.handler import Ontology
+from at_ontology_parser.parsing.instrumentation import COUNTER_FILES_OPENED
+from at_ontology_parser.parsing.instrumentation import PHASE_READ
+from at_ontology_parser.parsing.parser import ImportLoader
+from at_ontology_parser.parsing.parser import ModelModule
+from at_ontology_parser.parsing.parser import OntologyModule
+
+if TYPE_CHECKING:
+    from at_ontology_parser.parsing.parser import Parser
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+def file_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+@dataclass(kw_only=True)
+class ArchiveManifest:
+    """
+    Content hashes of the files of an archive, stored in its root as ``manifest.json``.
+    A delta archive contains only the files changed since its ``base``, but lists the hashes of all the files.
+    """
+
+    root: str
+    modules: List[str]
+    files: Dict[str, str]
+    # digest of the manifest the delta is applied to and the files removed since it
+    base: Optional[str] = field(default=None)
+    removed: List[str] = field(default_factory=list)
+
+    @property
+    def digest(self) -> str:
+        return file_hash(json.dumps(self.files, sort_keys=True).encode("utf-8"))
+
+    @classmethod
+    def scan(cls, directory: Path, root: str, modules: List[str]) -> "ArchiveManifest":
+        files = {}
+        for current, _, names in os.walk(directory):
+            for name in names:
+                path = Path(current) / name
+                subpath = path.relative_to(directory).as_posix()
+                if subpath != MANIFEST_NAME:
+                    files[subpath] = file_hash(path.read_bytes())
+        return cls(root=root, modules=sorted(modules), files=dict(sorted(files.items())))
+
+    @classmethod
+    def read(cls, archive: zipfile.ZipFile) -> Optional["ArchiveManifest"]:
+        if MANIFEST_NAME not in archive.namelist():
+            return None
+        data = json.loads(archive.read(MANIFEST_NAME))
+        return cls(
+            root=data["root"],
+            modules=data["modules"],
+            files=data["files"],
+            base=data.get("base"),
+            removed=data.get("removed", []),
+        )
+
+    def dumps(self) -> str:
+        data = {"version": MANIFEST_VERSION, "root": self.root, "modules": self.modules, "files": self.files}
+        if self.base is not None:
+            data.update(base=self.base, removed=self.removed)
+        return json.dumps(data, indent=2, ensure_ascii=False)
+
+    def write(self, directory: Path):
+        (directory / MANIFEST_NAME).write_text(self.dumps(), encoding="utf-8")
+
+
+def write_delta(directory: Path, manifest: ArchiveManifest, base: ArchiveManifest, delta_path: Path) -> Path:
+    """Zips the files of the exported ``directory`` whose hashes differ from the ``base`` manifest."""
+    delta = ArchiveManifest(
+        root=manifest.root,
+        modules=manifest.modules,
+        files=manifest.files,
+        base=base.digest,
+        removed=sorted(set(base.files) - set(manifest.files)),
+    )
+    with zipfile.ZipFile(delta_path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for subpath, digest in manifest.files.items():
+            if base.files.get(subpath) != digest:
+                archive.write(directory / subpath, subpath)
+        archive.writestr(MANIFEST_NAME, delta.dumps())
+    return delta_path
+
+
+class ArchiveOverlay:
+    """
+    Read-only view of a base archive with delta archives applied on top of it in order.
+    Files are read from the latest archive containing them, nothing is extracted.
+    """
+
+    def __init__(self, archives: List[str | Path], context: Context):
+        self.context = context
+        self.archives: List[zipfile.ZipFile] = []
+        self.sources: Dict[str, zipfile.ZipFile] = {}
+        self.manifest: Optional[ArchiveManifest] = None
+        try:
+            for path in archives:
+                self._apply(Path(path))
+        except BaseException:
+            self.close()
+            raise
+
+    def _apply(self, path: Path):
+        if not zipfile.is_zipfile(path):
+            raise LoadException(
+                "Error while loading archive overlay", context=self.context, errors=[f"Not a zip archive: {path}"]
+            )
+        archive = zipfile.ZipFile(path, "r")
+        self.archives.append(archive)
+        manifest = ArchiveManifest.read(archive)
+        if manifest is None:
+            raise LoadException(
+                "Error while loading archive overlay", context=self.context, errors=[f"No {MANIFEST_NAME} in {path}"]
+            )
+        if self.manifest is not None and manifest.base != self.manifest.digest:
+            raise LoadException(
+                "Error while loading archive overlay",
+                context=self.context,
+                errors=[f"Delta {path} is not built against the preceding archives"],
+            )
+
+        for subpath in manifest.removed:
+            self.sources.pop(subpath, None)
+        members = set(archive.namelist())
+        self.sources.update({subpath: archive for subpath in manifest.files if subpath in members})
+        missing = set(manifest.files) - set(self.sources)
+        if missing:
+            raise LoadException(
+                "Error while loading archive overlay",
+                context=self.context,
+                errors=[f"Files missing from {path} and its base: {sorted(missing)}"],
+            )
+        self.manifest = manifest
+
+    def __contains__(self, subpath: str) -> bool:
+        return subpath in self.sources
+
+    def read(self, subpath: str) -> bytes:
+        data = self.sources[subpath].read(subpath)
+        if file_hash(data) != self.manifest.files[subpath]:
+            raise LoadException(
+                "Error while loading archive overlay", context=self.context, errors=[f"Hash mismatch of {subpath}"]
+            )
+        return data
+
+    def open(self, subpath: str) -> io.IOBase:
+        # the same modes as Parser.open_file_auto_mode
+        data = self.read(subpath)
+        try:
+            return io.StringIO(data.decode("utf-8"))
+        except UnicodeDecodeError:
+            return io.BytesIO(data)
+
+    def close(self):
+        for archive in self.archives:
+            archive.close()
+
+    def __enter__(self) -> "ArchiveOverlay":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ArchiveImportLoader(ImportLoader):
+    """Resolves the imports of the modules loaded from an :class:`ArchiveOverlay` mounted at a virtual ``root``."""
+
+    def __init__(self, parser: "Parser", overlay: ArchiveOverlay, root: Path):
+        self.parser = parser
+        self.overlay = overlay
+        self.root = root.resolve()
+
+    def subpath(self, full_path: Path) -> Optional[str]:
+        try:
+            return full_path.resolve().relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+
+    def resolve_import(
+        self, source_module: ModelModule | OntologyModule, import_def: ImportDefinition, context: Context
+    ) -> ModelModule:
+        import_path = source_module.full_path.parent / import_def.file
+        subpath = self.subpath(import_path)
+        if subpath is None or subpath not in self.overlay:
+            raise ImportException(
+                f'Error while loading ontology or ontology model: File not found in archive "{import_def.file}"',
+                context=context,
+            )
+        loaded_module = self.parser.get_module_by_path(import_path)
+        if loaded_module:
+            return loaded_module
+
+        model = self.parser.load_ontology_model_data(
+            self.read(subpath), orig_name=str(import_path), full_path=import_path, context=context
+        )
+        module = self.parser.get_module_by_model(model)
+        self.load_artifacts(module)
+        model._built = True
+        module._built = True
+        return module
+
+    def read(self, subpath: str):
+        with self.parser.phase(PHASE_READ, subpath):
+            self.parser.stats.count(COUNTER_FILES_OPENED)
+            return yaml.safe_load(self.overlay.read(subpath))
+
+    def _load_artifacts(self, module: ModelModule | OntologyModule):
+        # the files of the module directory and its subdirectories, except the modules and the directories
+        # of the other modules, so a module in the archive root doesn't take the artifacts of the nested ones
+        directory = self.subpath(module.full_path.parent)
+        prefix = "" if directory in (None, ".") else directory + "/"
+        modules = set(self.overlay.manifest.modules)
+        nested = {
+            other.rpartition("/")[0] + "/"
+            for other in modules
+            if other.startswith(prefix) and "/" in other.removeprefix(prefix)
+        }
+        result = {}
+        for subpath in self.overlay.manifest.files:
+            if not subpath.startswith(prefix) or subpath in modules:
+                continue
+            if any(subpath.startswith(other_directory) for other_directory in nested):
+                continue
+            self.parser.stats.count(COUNTER_FILES_OPENED)
+            result[Path(subpath.removeprefix(prefix))] = self.overlay.open(subpath)
+        module.artifacts = result
+
+
+def load_overlay(parser: "Parser", archives: List[str | Path], ontology: bool) -> Ontology | OntologyModel:
+    """Loads the root module of a base archive with delta archives applied on top of it, see :class:`ArchiveOverlay`."""
+    with ArchiveOverlay(archives, context=parser.root_context) as overlay:
+        root = parser.temp_dir / "overlay" / str(uuid4())
+        loader = ArchiveImportLoader(parser, overlay, root)
+        full_path = root / overlay.manifest.root
+        with parser._lock:
+            parser.import_loaders.insert(0, loader)
+            try:
+                data = loader.read(overlay.manifest.root)
+                if ontology:
+                    handler = parser.load_ontology_data(data, orig_name=str(full_path), full_path=full_path)
+                else:
+                    handler = parser.load_ontology_model_data(data, orig_name=str(full_path), full_path=full_path)
+                parser.finalize_references()
+            finally:
+                parser.import_loaders.remove(loader)
+        return handler
@@ -0,0 +1,326 @@
+import csv
+import io
+import json
+from dataclasses import dataclass
+from dataclasses import field
+from itertools import islice
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import TYPE_CHECKING
+
+from at_ontology_parser.base import Instance
+from at_ontology_parser.exceptions import Context
+from at_ontology_parser.exceptions import LoadException
+from at_ontology_parser.exceptions import OntologyException
+from at_ontology_parser.model.definitions import PropertyDefinition
+from at_ontology_parser.model.types import RelationshipType
+from at_ontology_parser.model.types import VertexType
+from at_ontology_parser.ontology.assignments import PropertyAssignment
+from at_ontology_parser.ontology.handler import Ontology
+from at_ontology_parser.ontology.instances import Relationship
+from at_ontology_parser.ontology.instances import Vertex
+from at_ontology_parser.parsing.instrumentation import COUNTER_REFERENCES_CREATED
+from at_ontology_parser.parsing.instrumentation import COUNTER_REFERENCES_DEFERRED
+from at_ontology_parser.parsing.instrumentation import PHASE_BULK_LOAD
+from at_ontology_parser.parsing.models.ontology.assignments.property_assignment import (
+    get_property_definition_from_type,
+)
+from at_ontology_parser.reference import BaseReference
+from at_ontology_parser.reference import OntologyReference
+from at_ontology_parser.reference import OwnerFeatureReference
+
+if TYPE_CHECKING:
+    from at_ontology_parser.parsing.parser import Parser
+
+
+@dataclass(kw_only=True)
+class ColumnMapping:
+    """
+    Describes which columns of a row hold the instance fields.
+    Property columns are either listed explicitly in ``properties`` (property alias -> column)
+    or recognized by ``property_prefix`` (column ``properties.code`` -> property ``code``).
+    """
+
+    name: str = "name"
+    type: str = "type"
+    label: Optional[str] = "label"
+    description: Optional[str] = "description"
+    source: str = "source"
+    target: str = "target"
+    properties: Optional[Dict[str, str]] = None
+    property_prefix: Optional[str] = "properties."
+
+    def property_columns(self, row: Dict[str, Any]) -> Dict[str, str]:
+        if self.properties is not None:
+            return self.properties
+        if not self.property_prefix:
+            return {}
+        prefix_len = len(self.property_prefix)
+        return {column[prefix_len:]: column for column in row if column.startswith(self.property_prefix)}
+
+
+def parse_csv_value(value: str) -> Any:
+    if value.startswith("[") or value.startswith("{"):
+        try:
+            return json.loads(value)
+        except ValueError:
+            pass
+    return value
+
+
+def iter_csv_rows(stream: io.IOBase, **kwargs) -> Iterator[Dict[str, Any]]:
+    for row in csv.DictReader(stream, **kwargs):
+        yield {key: parse_csv_value(value) for key, value in row.items() if value is not None and value != ""}
+
+
+def iter_ndjson_rows(stream: io.IOBase) -> Iterator[Dict[str, Any]]:
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+@dataclass(kw_only=True)
+class BulkLoader:
+    """
+    Creates vertices and relationships of an already loaded ontology directly from tabular rows,
+    bypassing YAML and pydantic validation. References of the created instances are not requested
+    on creation: they are collected and resolved in a single pass by :meth:`finalize`.
+    """
+
+    parser: "Parser"
+    ontology: Ontology
+    mapping: ColumnMapping = field(default_factory=ColumnMapping)
+    batch_size: int = field(default=10000)
+    context: Context = field(init=False, repr=False)
+
+    _references: List[BaseReference] = field(init=False, repr=False, default_factory=list)
+    _feature_references: List[BaseReference] = field(init=False, repr=False, default_factory=list)
+
+    def __post_init__(self):
+        module = self.parser.get_module_by_ontology(self.ontology)
+        if not module:
+            raise OntologyException(
+                "Can't bulk load instances into ontology that is not contained in loaded modules",
+                context=self.parser.root_context.create_child(self.ontology.name),
+            )
+        # detached from the parser, so created references are not requested immediately
+        self.context = Context(name=module.orig_name, data=None, initiator=self.ontology)
+
+    def __enter__(self) -> "BulkLoader":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.finalize()
+
+    @staticmethod
+    def _batches(rows: Iterable[Dict[str, Any]], batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+        iterator = iter(rows)
+        while batch := list(islice(iterator, batch_size)):
+            yield batch
+
+    def load_vertices(self, rows: Iterable[Dict[str, Any]], mapping: Optional[ColumnMapping] = None) -> int:
+        return self._load(rows, "vertices", self._create_vertex, mapping or self.mapping)
+
+    def load_relationships(self, rows: Iterable[Dict[str, Any]], mapping: Optional[ColumnMapping] = None) -> int:
+        return self._load(rows, "relationships", self._create_relationship, mapping or self.mapping)
+
+    def load_vertices_csv(self, source: str | Path | io.IOBase, mapping: Optional[ColumnMapping] = None, **kwargs):
+        with self._open(source) as stream:
+            return self.load_vertices(iter_csv_rows(stream, **kwargs), mapping=mapping)
+
+    def load_relationships_csv(
+        self, source: str | Path | io.IOBase, mapping: Optional[ColumnMapping] = None, **kwargs
+    ) -> int:
+        with self._open(source) as stream:
+            return self.load_relationships(iter_csv_rows(stream, **kwargs), mapping=mapping)
+
+    def load_vertices_ndjson(self, source: str | Path | io.IOBase, mapping: Optional[ColumnMapping] = None) -> int:
+        with self._open(source) as stream:
+            return self.load_vertices(iter_ndjson_rows(stream), mapping=mapping)
+
+    def load_relationships_ndjson(self, source: str | Path | io.IOBase, mapping: Optional[ColumnMapping] = None) -> int:
+        with self._open(source) as stream:
+            return self.load_relationships(iter_ndjson_rows(stream), mapping=mapping)
+
+    @staticmethod
+    def _open(source: str | Path | io.IOBase) -> io.IOBase:
+        if isinstance(source, io.IOBase):
+            source.seek(0)
+            # the caller owns the stream, so it must survive the with-statement
+            return _NonClosing(source)
+        return open(source, "r", encoding="utf-8", newline="")
+
+    def _load(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        section: str,
+        create: Callable[[Dict[str, Any], Context, ColumnMapping], Instance],
+        mapping: ColumnMapping,
+    ) -> int:
+        with self.parser._lock, self.parser.phase(PHASE_BULK_LOAD, self.context.name):
+            return self._load_batches(rows, section, create, mapping)
+
+    def _load_batches(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        section: str,
+        create: Callable[[Dict[str, Any], Context, ColumnMapping], Instance],
+        mapping: ColumnMapping,
+    ) -> int:
+        section_context = self.context.create_child(section)
+        target: Dict[str, Instance] = getattr(self.ontology, section)
+        errors = []
+        count = 0
+        row_number = 0
+
+        for batch in self._batches(rows, self.batch_size):
+            created: Dict[str, Instance] = {}
+            for row in batch:
+                name = row.get(mapping.name)
+                row_context = section_context.create_child(
+                    name if name else row_number, row if self.parser.retain_context_data else None
+                )
+                row_number += 1
+                if not name:
+                    errors.append(
+                        OntologyException(f'Missing "{mapping.name}" column', context=row_context).represent()
+                    )
+                    continue
+                if name in target or name in created:
+                    errors.append(OntologyException(f'Duplicate name "{name}"', context=row_context).represent())
+                    continue
+                try:
+                    created[name] = create(row, row_context, mapping)
+                except OntologyException as e:
+                    errors.append(e.represent())
+
+            for name, instance in created.items():
+                instance.owner = self.ontology
+                instance._built = True
+                self.parser.register_instance(instance, self.context)
+            target.update(created)
+            count += len(created)
+
+        if errors:
+            raise LoadException(
+                f"Error while bulk loading ontology {section}: Invalid data",
+                context=section_context,
+                errors=errors,
+            )
+        return count
+
+    def _require(self, row: Dict[str, Any], column: str, context: Context) -> Any:
+        value = row.get(column)
+        if value is None or value == "":
+            raise OntologyException(f'Missing "{column}" column', context=context)
+        return value
+
+    def _create_reference(self, reference_type, alias: str, context: Context, owner: Instance):
+        ref = reference_type(alias=alias, context=context)
+        ref.owner = owner
+        self._references.append(ref)
+        return ref
+
+    def _create_properties(self, instance: Instance, row: Dict[str, Any], context: Context, mapping: ColumnMapping):
+        properties_context = context.create_child("properties")
+        result = []
+        for alias, column in mapping.property_columns(row).items():
+            if column not in row:
+                continue
+            values = row[column]
+            if isinstance(values, list):
+                value_contexts = [(value, properties_context.create_child(i, value)) for i, value in enumerate(values)]
+            else:
+                value_contexts = [(values, properties_context)]
+
+            for value, value_context in value_contexts:
+                assignment = PropertyAssignment(value=value, definition=None)
+                assignment.owner = instance
+                assignment.definition = OwnerFeatureReference[PropertyDefinition, Instance].create(
+                    alias,
+                    context=value_context.create_child(alias, value, initiator=assignment),
+                    feature_getter=get_property_definition_from_type,
+                    owner=assignment,
+                )
+                assignment._built = True
+                self._feature_references.append(assignment.definition)
+                result.append(assignment)
+        return result
+
+    def _create_vertex(self, row: Dict[str, Any], context: Context, mapping: ColumnMapping) -> Vertex:
+        type_alias = self._require(row, mapping.type, context)
+        vertex = Vertex(
+            name=row[mapping.name],
+            label=row.get(mapping.label) if mapping.label else None,
+            description=row.get(mapping.description) if mapping.description else None,
+            type=None,
+            artifacts=[],
+        )
+        vertex.type = self._create_reference(
+            OntologyReference[VertexType], type_alias, context.create_child("type", type_alias, vertex), vertex
+        )
+        vertex.properties = self._create_properties(vertex, row, context, mapping)
+        return vertex
+
+    def _create_relationship(self, row: Dict[str, Any], context: Context, mapping: ColumnMapping) -> Relationship:
+        type_alias = self._require(row, mapping.type, context)
+        source = self._require(row, mapping.source, context)
+        target = self._require(row, mapping.target, context)
+        relationship = Relationship(
+            name=row[mapping.name],
+            label=row.get(mapping.label) if mapping.label else None,
+            description=row.get(mapping.description) if mapping.description else None,
+            type=None,
+            source=None,
+            target=None,
+            artifacts=[],
+        )
+        relationship.type = self._create_reference(
+            OntologyReference[RelationshipType],
+            type_alias,
+            context.create_child("type", type_alias, relationship),
+            relationship,
+        )
+        relationship.source = self._create_reference(
+            OntologyReference[Vertex], source, context.create_child("source", source, relationship), relationship
+        )
+        relationship.target = self._create_reference(
+            OntologyReference[Vertex], target, context.create_child("target", target, relationship), relationship
+        )
+        relationship.properties = self._create_properties(relationship, row, context, mapping)
+        return relationship
+
+    def finalize(self) -> bool:
+        """
+        Hands all collected references to the parser and resolves them in one pass.
+        Instance references go first, so property definitions can be found through the resolved types.
+        """
+        # all the collected references are deferred by construction
+        deferred = len(self._references) + len(self._feature_references)
+        self.parser.stats.count(COUNTER_REFERENCES_CREATED, deferred)
+        self.parser.stats.count(COUNTER_REFERENCES_DEFERRED, deferred)
+        with self.parser._lock:
+            self.parser._requested_references.extend(self._references)
+            self.parser._requested_references.extend(self._feature_references)
+            self._references = []
+            self._feature_references = []
+            return self.parser.finalize_references(self.context)
+
+
+class _NonClosing:
+    def __init__(self, stream: io.IOBase):
+        self.stream = stream
+
+    def __enter__(self) -> io.IOBase:
+        return self.stream
+
+    def __exit__(self, *args):
+        pass
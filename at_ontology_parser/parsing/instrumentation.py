@@ -0,0 +1,207 @@
+import cProfile
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+# names of the phases reported by the parser
+PHASE_READ = "read"
+PHASE_VALIDATION = "validation"
+PHASE_TO_INTERNAL = "to_internal"
+PHASE_IMPORTS = "imports"
+PHASE_ARTIFACTS = "artifacts"
+PHASE_FINALIZE = "finalize_references"
+PHASE_BULK_LOAD = "bulk_load"
+
+# names of the counters reported by the parser
+COUNTER_ENTITIES = "entities"
+COUNTER_REFERENCES_CREATED = "references_created"
+COUNTER_REFERENCES_DEFERRED = "references_deferred"
+COUNTER_FILES_OPENED = "files_opened"
+COUNTER_IMPORTS_DEFERRED = "imports_deferred"
+
+
+@dataclass(kw_only=True)
+class PhaseStats:
+    """
+    Accumulated statistics of a phase. Wall time and peak memory include nested phases,
+    counters are attributed to the innermost running phase only.
+    """
+
+    calls: int = field(default=0)
+    wall_time: float = field(default=0.0)
+    peak_memory: int = field(default=0)
+    counters: Dict[str, int] = field(default_factory=dict)
+
+    def add(self, record: "PhaseRecord"):
+        self.calls += 1
+        self.wall_time += record.wall_time
+        self.peak_memory = max(self.peak_memory, record.peak_memory)
+        for counter, value in record.counters.items():
+            self.counters[counter] = self.counters.get(counter, 0) + value
+
+    def represent(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "wall_time": self.wall_time,
+            "peak_memory": self.peak_memory,
+            "counters": dict(self.counters),
+        }
+
+
+@dataclass(kw_only=True)
+class PhaseRecord:
+    """A single finished run of a phase, passed to ``on_phase_end`` hooks."""
+
+    phase: str
+    module: Optional[str] = field(default=None)
+    wall_time: float = field(default=0.0)
+    peak_memory: int = field(default=0)
+    counters: Dict[str, int] = field(default_factory=dict)
+
+    _started: float = field(default=0.0, repr=False)
+    _running_peak: int = field(default=0, repr=False)
+    # the overlaps counter of _LOADING_THREADS when the memory sampling started, None if it didn't
+    _sampled_since: Optional[int] = field(default=None, repr=False)
+
+
+@dataclass(kw_only=True)
+class PhaseHook:
+    on_phase_start: Optional[Callable[[str, Optional[str]], Any]] = field(default=None)
+    on_phase_end: Optional[Callable[[PhaseRecord], Any]] = field(default=None)
+
+
+class _LoadingThreads:
+    """
+    Threads running phases in the process. The traced peak of ``tracemalloc`` is process-wide,
+    so it is attributed to a phase only while no other thread runs phases.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        # incremented whenever a thread starts loading while another one is loading
+        self.overlaps = 0
+
+    def enter(self):
+        with self.lock:
+            self.active += 1
+            if self.active > 1:
+                self.overlaps += 1
+
+    def leave(self):
+        with self.lock:
+            self.active -= 1
+
+    def sampling(self) -> Optional[int]:
+        """The overlaps counter to compare with at the end of the phase, None if other threads are loading."""
+        with self.lock:
+            return self.overlaps if self.active == 1 else None
+
+    def sampled_alone(self, since: Optional[int]) -> bool:
+        with self.lock:
+            return since is not None and self.active == 1 and self.overlaps == since
+
+
+_LOADING_THREADS = _LoadingThreads()
+
+
+@dataclass(kw_only=True)
+class LoadStats:
+    """
+    Statistics accumulated by a parser over all its loads: per phase, per module and phase and global counters.
+    Peak memory is collected only while ``tracemalloc`` is tracing. The traced peak is process-wide, so it is
+    collected only for the phases that run while no other thread runs phases, the others report no peak.
+    Phases are nested per thread, the accumulated statistics are shared by all the threads.
+    """
+
+    phases: Dict[str, PhaseStats] = field(default_factory=dict)
+    modules: Dict[str, Dict[str, PhaseStats]] = field(default_factory=dict)
+    counters: Dict[str, int] = field(default_factory=dict)
+    _local: threading.local = field(default_factory=threading.local, repr=False, compare=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def _stack(self) -> List[PhaseRecord]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def count(self, counter: str, value: int = 1):
+        with self._lock:
+            self.counters[counter] = self.counters.get(counter, 0) + value
+        stack = self._stack
+        if stack:
+            counters = stack[-1].counters
+            counters[counter] = counters.get(counter, 0) + value
+
+    def start(self, phase: str, module: Optional[str] = None) -> PhaseRecord:
+        if not self._stack:
+            _LOADING_THREADS.enter()
+        record = PhaseRecord(phase=phase, module=module, _started=time.perf_counter())
+        if tracemalloc.is_tracing():
+            record._sampled_since = _LOADING_THREADS.sampling()
+        if record._sampled_since is not None:
+            peak = tracemalloc.get_traced_memory()[1]
+            # the peak is reset for the nested phase, so the parent phase keeps what it has reached so far
+            if self._stack:
+                self._stack[-1]._running_peak = max(self._stack[-1]._running_peak, peak)
+            tracemalloc.reset_peak()
+        self._stack.append(record)
+        return record
+
+    def end(self) -> PhaseRecord:
+        record = self._stack.pop()
+        record.wall_time = time.perf_counter() - record._started
+        if tracemalloc.is_tracing() and _LOADING_THREADS.sampled_alone(record._sampled_since):
+            record.peak_memory = max(record._running_peak, tracemalloc.get_traced_memory()[1])
+            if self._stack:
+                self._stack[-1]._running_peak = max(self._stack[-1]._running_peak, record.peak_memory)
+        if not self._stack:
+            _LOADING_THREADS.leave()
+
+        with self._lock:
+            self.phases.setdefault(record.phase, PhaseStats()).add(record)
+            if record.module is not None:
+                self.modules.setdefault(record.module, {}).setdefault(record.phase, PhaseStats()).add(record)
+        return record
+
+    def reset(self):
+        with self._lock:
+            self.phases = {}
+            self.modules = {}
+            self.counters = {}
+
+    def represent(self) -> Dict[str, Any]:
+        return {
+            "phases": {phase: stats.represent() for phase, stats in self.phases.items()},
+            "modules": {
+                module: {phase: stats.represent() for phase, stats in phases.items()}
+                for module, phases in self.modules.items()
+            },
+            "counters": dict(self.counters),
+        }
+
+
+@contextmanager
+def profile(output: Optional[str | Path] = None, sort_by: str = "cumulative") -> Iterator[cProfile.Profile]:
+    """Runs the wrapped code under ``cProfile`` and dumps the stats into ``output``, if it is given."""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        if output is not None:
+            pstats.Stats(profiler).sort_stats(sort_by).dump_stats(str(output))
@@ -0,0 +1,113 @@
+import re
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Any
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+import yaml
+
+from at_ontology_parser.exceptions import Context
+from at_ontology_parser.model.types import ONTOLOGY_TYPES
+
+if TYPE_CHECKING:
+    from at_ontology_parser.model.definitions import ImportDefinition
+    from at_ontology_parser.parsing.parser import ModelModule
+    from at_ontology_parser.parsing.parser import OntologyModule
+
+INDEXED_SECTIONS = (*ONTOLOGY_TYPES.sections(), "imports")
+
+_SECTION_RE = re.compile(r"^([\w-]+)\s*:\s*(.*?)\s*$")
+
+
+def _unquote(value: str) -> str:
+    value = value.strip()
+    if len(value) > 1 and value[0] == value[-1] and value[0] in "'\"":
+        return value[1:-1]
+    return value
+
+
+def _inline_value(line: str) -> Any:
+    try:
+        return yaml.safe_load(line)
+    except yaml.YAMLError:
+        return None
+
+
+def scan_module(full_path: Path) -> Tuple[Set[str], List[str]]:
+    """
+    Type names and import files of a model file found by scanning the keys of its top-level sections line by line,
+    without parsing the YAML. The result is a hint: names written in an unusual style may be missed.
+    """
+    names: Set[str] = set()
+    imports: List[str] = []
+    section: Optional[str] = None
+    indent: Optional[int] = None
+
+    with open(full_path, "r", encoding="utf-8") as stream:
+        for line in stream:
+            stripped = line.strip()
+            if not stripped or stripped.startswith("#"):
+                continue
+            current_indent = len(line) - len(line.lstrip())
+
+            # block sequences may be written without indentation
+            if current_indent == 0 and not (section == "imports" and stripped.startswith("- ")):
+                match = _SECTION_RE.match(line)
+                section = match.group(1) if match and match.group(1) in INDEXED_SECTIONS else None
+                indent = None
+                if section and match.group(2) and not match.group(2).startswith("#"):
+                    value = (_inline_value(line) or {}).get(section)
+                    if section == "imports":
+                        imports += [_import_file(item) for item in value or [] if item]
+                    elif isinstance(value, dict):
+                        names.update(value)
+                    section = None
+                continue
+
+            if section is None:
+                continue
+            if indent is None:
+                indent = current_indent
+            if current_indent != indent:
+                continue
+
+            if section == "imports":
+                if stripped.startswith("- "):
+                    imports.append(_import_file(stripped[2:]))
+            else:
+                names.add(_unquote(stripped.split(":", 1)[0]))
+    return names, [i for i in imports if i]
+
+
+def _import_file(item: Any) -> Optional[str]:
+    # "- file.yml" or "- alias: file.yml"
+    if isinstance(item, dict):
+        return str(next(iter(item.values()), "")) or None
+    item = str(item)
+    if ":" in item and not item.startswith(("'", '"')):
+        return _unquote(item.split(":", 1)[1]) or None
+    return _unquote(item) or None
+
+
+@dataclass(kw_only=True)
+class PendingImport:
+    """Model file found in the imports, that is parsed only when its types are needed, see ``Parser.lazy_imports``."""
+
+    full_path: Path
+    orig_name: Optional[str]
+    names: Set[str] = field(repr=False)
+    imports: List[str] = field(repr=False)
+    # the modules waiting for the model, with the import definitions and their contexts
+    importers: List[Tuple["ModelModule | OntologyModule", "ImportDefinition", Context]] = field(
+        default_factory=list, repr=False
+    )
+
+    @classmethod
+    def scan(cls, full_path: Path, orig_name: Optional[str]) -> "PendingImport":
+        names, imports = scan_module(full_path)
+        return cls(full_path=full_path, orig_name=orig_name, names=names, imports=imports)
@@ -0,0 +1,265 @@
+import gc
+import sys
+import types
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Mapping
+from typing import Set
+
+from pydantic import BaseModel
+
+from at_ontology_parser.base import OntologyBase
+from at_ontology_parser.exceptions import Context
+from at_ontology_parser.ontology.assignments import ArtifactAssignment
+from at_ontology_parser.ontology.assignments import PropertyAssignment
+from at_ontology_parser.reference import AbstractReference
+
+KIND_CONTEXT = "context"
+KIND_REFERENCE = "reference"
+KIND_ASSIGNMENT = "assignment"
+KIND_PYDANTIC = "pydantic"
+KIND_ENTITY = "entity"
+KIND_OTHER = "other"
+
+# objects shared by the whole interpreter, they are neither counted nor walked into
+_SKIPPED_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    types.CodeType,
+    types.FrameType,
+)
+
+
+def object_kind(obj: Any) -> str:
+    if isinstance(obj, Context):
+        return KIND_CONTEXT
+    if isinstance(obj, AbstractReference):
+        return KIND_REFERENCE
+    if isinstance(obj, (PropertyAssignment, ArtifactAssignment)):
+        return KIND_ASSIGNMENT
+    if isinstance(obj, BaseModel):
+        return KIND_PYDANTIC
+    if isinstance(obj, OntologyBase):
+        return KIND_ENTITY
+    return KIND_OTHER
+
+
+def class_name(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+@dataclass(kw_only=True)
+class Footprint:
+    count: int = field(default=0)
+    size: int = field(default=0)
+
+    def add(self, size: int, count: int = 1):
+        self.count += count
+        self.size += size
+
+    def represent(self) -> Dict[str, int]:
+        return {"count": self.count, "size": self.size}
+
+
+@dataclass(kw_only=True)
+class ModuleFootprint:
+    """
+    Deep size of a module: every object reachable from it that was not reached before from another module.
+    The instance ``__dict__`` is accounted to the class of the instance.
+    """
+
+    name: str
+    total: Footprint = field(default_factory=Footprint)
+    classes: Dict[str, Footprint] = field(default_factory=dict)
+    kinds: Dict[str, Footprint] = field(default_factory=dict)
+
+    def add(self, obj: Any, size: int):
+        self.total.add(size)
+        self.classes.setdefault(class_name(obj.__class__), Footprint()).add(size)
+        self.kinds.setdefault(object_kind(obj), Footprint()).add(size)
+
+    def represent(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            **self.total.represent(),
+            "classes": {name: f.represent() for name, f in _by_size(self.classes)},
+            "kinds": {name: f.represent() for name, f in _by_size(self.kinds)},
+        }
+
+
+@dataclass(kw_only=True)
+class MemoryReport:
+    modules: List[ModuleFootprint] = field(default_factory=list)
+
+    @property
+    def total(self) -> Footprint:
+        return _merge(m.total for m in self.modules)
+
+    @property
+    def classes(self) -> Dict[str, Footprint]:
+        return _merge_dicts(m.classes for m in self.modules)
+
+    @property
+    def kinds(self) -> Dict[str, Footprint]:
+        return _merge_dicts(m.kinds for m in self.modules)
+
+    def module(self, name: str) -> ModuleFootprint:
+        return next(m for m in self.modules if m.name == name)
+
+    def represent(self) -> Dict[str, Any]:
+        return {
+            **self.total.represent(),
+            "kinds": {name: f.represent() for name, f in _by_size(self.kinds)},
+            "classes": {name: f.represent() for name, f in _by_size(self.classes)},
+            "modules": [m.represent() for m in sorted(self.modules, key=lambda m: -m.total.size)],
+        }
+
+
+def _by_size(footprints: Dict[str, Footprint]):
+    return sorted(footprints.items(), key=lambda item: -item[1].size)
+
+
+def _merge(footprints: Iterable[Footprint]) -> Footprint:
+    result = Footprint()
+    for footprint in footprints:
+        result.add(footprint.size, footprint.count)
+    return result
+
+
+def _merge_dicts(dicts: Iterable[Dict[str, Footprint]]) -> Dict[str, Footprint]:
+    result: Dict[str, Footprint] = {}
+    for footprints in dicts:
+        for name, footprint in footprints.items():
+            result.setdefault(name, Footprint()).add(footprint.size, footprint.count)
+    return result
+
+
+def root_owner(obj: OntologyBase, cache: Dict[int, Any]) -> Any:
+    chain = []
+    while id(obj) not in cache and getattr(obj, "owner", None) is not None:
+        chain.append(obj)
+        obj = obj.owner
+    root = cache.get(id(obj), obj)
+    for item in chain:
+        cache[id(item)] = root
+    return root
+
+
+def walk(root: Any, footprint: ModuleFootprint, seen: Set[int], roots: Set[int], owners: Dict[int, Any]):
+    """
+    Accounts every object reachable from ``root`` and not contained in ``seen`` to ``footprint``.
+    Ontology objects owned by another of the ``roots`` are left to that root, whatever references them.
+    """
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, _SKIPPED_TYPES):
+            continue
+        if isinstance(obj, OntologyBase):
+            owner = root_owner(obj, owners)
+            if owner is not root and id(owner) in roots:
+                continue
+        seen.add(id(obj))
+        size = sys.getsizeof(obj)
+        referents = gc.get_referents(obj)
+
+        instance_dict = getattr(obj, "__dict__", None)
+        if type(instance_dict) is dict and id(instance_dict) not in seen:
+            seen.add(id(instance_dict))
+            size += sys.getsizeof(instance_dict)
+            referents = list(instance_dict.values()) + [r for r in referents if r is not instance_dict]
+
+        footprint.add(obj, size)
+        stack.extend(referents)
+
+
+def memory_report(roots: Dict[str, Any]) -> MemoryReport:
+    """
+    Walks the objects reachable from ``roots`` (name -> object) in order. Ontology objects are accounted
+    to the root on top of their ``owner`` chain, other objects shared by several roots to the first one reaching them.
+    """
+    seen: Set[int] = set()
+    owners: Dict[int, Any] = {}
+    root_ids = {id(root) for root in roots.values()}
+    report = MemoryReport()
+    for name, root in roots.items():
+        footprint = ModuleFootprint(name=name)
+        walk(root, footprint, seen, root_ids, owners)
+        report.modules.append(footprint)
+    return report
+
+
+def iter_contexts(roots: Iterable[Any]) -> Iterator[Context]:
+    """
+    Yields contexts reachable from ``roots`` through ontology objects and builtin containers.
+    Contexts are not walked into, their parents are reached with :meth:`Context.compact`.
+    """
+    seen: Set[int] = set()
+    stack = list(roots)
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if isinstance(obj, Context):
+            yield obj
+        elif isinstance(obj, OntologyBase):
+            stack.extend(vars(obj).values())
+        elif isinstance(obj, Mapping):
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+
+
+def compact_contexts(roots: Iterable[Any]) -> int:
+    count = 0
+    for context in iter_contexts(roots):
+        context.compact()
+        count += 1
+    return count
+
+
+def owned_contexts(modules: Iterable[OntologyBase]) -> List[Context]:
+    """The contexts of the modules and of the objects they own, see :func:`iter_owned`."""
+    result = []
+    for module in modules:
+        for obj in iter_owned(module):
+            context = getattr(obj, "context", None)
+            if isinstance(context, Context):
+                result.append(context)
+    return result
+
+
+# back-pointers, contexts and links to other modules, they are not followed by iter_owned
+_NOT_OWNED_FIELDS = frozenset({"owner", "context", "parser", "_resolved_imports", "_meta"})
+
+
+def iter_owned(root: OntologyBase) -> Iterator[OntologyBase]:
+    """
+    Yields ``root`` and the ontology objects it contains through its fields, lists and dicts.
+    The values of references are not walked into, so the objects of other modules are never reached.
+    """
+    seen: Set[int] = set()
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if isinstance(obj, OntologyBase):
+            yield obj
+            if not isinstance(obj, AbstractReference):
+                stack.extend(value for name, value in vars(obj).items() if name not in _NOT_OWNED_FIELDS)
+        # lazy mappings, e.g. of stored ontologies, would load everything, only builtin containers are walked
+        elif type(obj) is dict:
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
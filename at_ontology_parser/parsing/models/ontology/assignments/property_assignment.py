@@ -19,7 +19,11 @@ def get_property_definition_from_type(
     owner: PropertyAssignment, ref: OwnerFeatureReference[PropertyDefinition, Instance]
 ) -> PropertyDefinition:
     if owner._built and owner.has_owner and isinstance(owner.owner, Instance) and owner.owner.type.fulfilled:
-        return owner.owner.type.value.properties.get(ref.alias)
+        # properties are inherited from the parent types
+        for instancable in reversed(owner.owner.type.value.derivation):
+            definition = (instancable.properties or {}).get(ref.alias)
+            if definition is not None:
+                return definition
 
 
 class PreliminaryPropertyAssignmentModel(OntoParseModel):
@@ -2,7 +2,10 @@ import io
 import os
 import shutil
 import tarfile
+import threading
+import tracemalloc
 import zipfile
+from contextlib import contextmanager
 from dataclasses import dataclass
 from dataclasses import field
 from pathlib import Path
@@ -12,8 +15,10 @@ from typing import Callable
 from typing import Dict
 from typing import ForwardRef
 from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Set
 from typing import Tuple
 from typing import Type
 from uuid import uuid4
@@ -33,8 +38,35 @@ from at_ontology_parser.model.definitions import ImportDefinition
 from at_ontology_parser.model.types import ONTOLOGY_TYPES
 from at_ontology_parser.ontology.handler import Ontology
 from at_ontology_parser.ontology.instances import ONTOLOGY_INSTANCES
+from at_ontology_parser.parsing.bulk import BulkLoader
+from at_ontology_parser.parsing.bulk import ColumnMapping
+from at_ontology_parser.parsing.instrumentation import COUNTER_ENTITIES
+from at_ontology_parser.parsing.instrumentation import COUNTER_FILES_OPENED
+from at_ontology_parser.parsing.instrumentation import COUNTER_IMPORTS_DEFERRED
+from at_ontology_parser.parsing.instrumentation import COUNTER_REFERENCES_CREATED
+from at_ontology_parser.parsing.instrumentation import COUNTER_REFERENCES_DEFERRED
+from at_ontology_parser.parsing.instrumentation import LoadStats
+from at_ontology_parser.parsing.instrumentation import PHASE_ARTIFACTS
+from at_ontology_parser.parsing.instrumentation import PHASE_FINALIZE
+from at_ontology_parser.parsing.instrumentation import PHASE_IMPORTS
+from at_ontology_parser.parsing.instrumentation import PHASE_READ
+from at_ontology_parser.parsing.instrumentation import PHASE_TO_INTERNAL
+from at_ontology_parser.parsing.instrumentation import PHASE_VALIDATION
+from at_ontology_parser.parsing.instrumentation import PhaseHook
+from at_ontology_parser.parsing.instrumentation import PhaseRecord
+from at_ontology_parser.parsing.instrumentation import profile
+from at_ontology_parser.parsing.lazy import PendingImport
+from at_ontology_parser.parsing.memory import compact_contexts
+from at_ontology_parser.parsing.memory import iter_owned
+from at_ontology_parser.parsing.memory import memory_report
+from at_ontology_parser.parsing.memory import MemoryReport
+from at_ontology_parser.parsing.memory import owned_contexts
 from at_ontology_parser.parsing.models.model.handler import OntologyModelModel
 from at_ontology_parser.parsing.models.ontology.handler import OntologyHandlerModel
+from at_ontology_parser.parsing.shared import overlay
+from at_ontology_parser.parsing.shared import SharedModelLayer
+from at_ontology_parser.parsing.symbols import SymbolTable
+from at_ontology_parser.parsing.usages import UsageIndex
 from at_ontology_parser.reference import BaseReference
 from at_ontology_parser.reference import OntologyReference
 from at_ontology_parser.reference import OwnerFeatureReference
@@ -48,12 +80,15 @@ class ModelModule(OntologyBase):
     parser: "Parser"
     artifacts: Dict[Path, io.IOBase] = field(init=False, repr=False, default_factory=dict)
     context: Context = field(repr=False)
+    symbols: SymbolTable = field(init=False, repr=False, default_factory=SymbolTable)
 
     def resolve_imports(self, context: Context, import_loaders: List["ImportLoader"]):
         self.model.owner = self
         resolved_imports: List[Tuple["ImportDefinition", "OntologyModel", "ModelModule"]] = []
         errors = []
         for i, import_def in enumerate(self.model.imports):
+            if self.parser._defer_import(self, import_def, context.create_child(i, import_def, self)):
+                continue
             success = False
             for import_loader in import_loaders:
                 try:
@@ -73,6 +108,7 @@ class ModelModule(OntologyBase):
                     errors=errors,
                 )
         self.model._resolved_imports = resolved_imports
+        self.symbols.link(resolved_imports)
 
 
 @dataclass(kw_only=True)
@@ -83,12 +119,15 @@ class OntologyModule(OntologyBase):
     parser: "Parser"
     artifacts: Dict[Path, io.IOBase] = field(init=False, repr=False, default_factory=dict)
     context: Context = field(repr=False)
+    symbols: SymbolTable = field(init=False, repr=False, default_factory=SymbolTable)
 
     def resolve_imports(self, context: Context, import_loaders: List["ImportLoader"]):
         self.ontology.owner = self
         resolved_imports: List[Tuple["ImportDefinition", "OntologyModel", "ModelModule"]] = []
         errors = []
         for i, import_def in enumerate(self.ontology.imports):
+            if self.parser._defer_import(self, import_def, context.create_child(i, import_def, self)):
+                continue
             success = False
             for import_loader in import_loaders:
                 try:
@@ -108,6 +147,7 @@ class OntologyModule(OntologyBase):
                     errors=errors,
                 )
         self.ontology._resolved_imports = resolved_imports
+        self.symbols.link(resolved_imports)
 
 
 class ImportLoader:
@@ -130,8 +170,10 @@ class ImportLoader:
             import_path = dir_path / import_path
             orig_name = None
 
-        if isinstance(source_module, ModelModule) and str(import_path) in source_module.parser._modules:
-            return source_module.parser.modules[str(import_path)]
+        # the same file may be imported by different relative paths, both from models and ontologies
+        loaded_module = source_module.parser.get_module_by_path(import_path)
+        if loaded_module:
+            return loaded_module
 
         if not import_path.exists():
             raise ImportException(
@@ -151,17 +193,23 @@ class ImportLoader:
         return module
 
     def load_artifacts(self, module: ModelModule):
+        with module.parser.phase(PHASE_ARTIFACTS, module.orig_name):
+            self._load_artifacts(module)
+
+    def _load_artifacts(self, module: ModelModule):
         if module.full_path.exists():
             all_imports = (
-                [Path(m.full_path) for m in module.parser.ontology_modules.values()]
-                + [Path(m.full_path) for m in module.parser.modules.values()]
-                + module.parser._bypass_imports(model=module.model, parent_path=module.full_path)
+                {Path(m.full_path) for m in module.parser.ontology_modules.values()}
+                | {Path(m.full_path) for m in module.parser.modules.values()}
+                | set(module.parser._bypass_imports(model=module.model, parent_path=module.full_path))
+                | {p.full_path for p in module.parser._pending_imports.values()}
             )
             result = {}
             for directory, _, files in os.walk(module.full_path.parent):
                 for file in files:
                     file_path = Path(directory) / file
                     if file_path not in all_imports:
+                        module.parser.stats.count(COUNTER_FILES_OPENED)
                         result[file_path.relative_to(module.full_path.parent)] = module.parser.open_file_auto_mode(
                             file_path
                         )
@@ -182,17 +230,59 @@ class Parser(OntologyBase):
 
     _modules: Dict[str, ModelModule] = field(init=False, repr=False)
     _ontology_modules: Dict[str, OntologyModule] = field(init=False, repr=False)
+    # lookup indexes of the modules above, maintained by _add_module / _remove_module
+    _modules_by_orig_name: Dict[str, List[ModelModule]] = field(init=False, repr=False)
+    _ontology_modules_by_orig_name: Dict[str, List[OntologyModule]] = field(init=False, repr=False)
+    _modules_by_path: Dict[Path, ModelModule | OntologyModule] = field(init=False, repr=False)
+    _modules_by_handler: Dict[int, ModelModule | OntologyModule] = field(init=False, repr=False)
+    _import_closures: Dict[int, Tuple[OntologyModel | Ontology, List[OntologyModel | Ontology]]] = field(
+        init=False, repr=False
+    )
+
+    # imported model files found but not parsed yet, keyed by the resolved path, see lazy_imports
+    _pending_imports: Dict[Path, PendingImport] = field(init=False, repr=False)
+    # fulfilled references by the objects they point to, see assign_reference
+    usages: UsageIndex = field(init=False, repr=False)
+
+    stats: LoadStats = field(init=False, repr=False)
+    track_memory: bool = field(default=False, repr=False)
+    # contexts keep the parsed data (pydantic models, raw dicts) only for debugging, errors need just the path
+    retain_context_data: bool = field(default=True, repr=False)
+    # imported models are parsed only when the references can't be resolved without them, see _finalize_references
+    lazy_imports: bool = field(default=False, repr=False)
+    # frozen model modules shared with other parsers, this parser only adds its own modules on top of them
+    shared_layer: Optional[SharedModelLayer] = field(default=None, repr=False)
+    # the layer shared with the forks, frozen on the first fork and reset when the modules change
+    _fork_layer: Optional[SharedModelLayer] = field(init=False, default=None, repr=False, compare=False)
+    # guards registries, modules and requested references: reading and validation run outside of it
+    _lock: threading.RLock = field(init=False, repr=False, compare=False, default_factory=threading.RLock)
+    _phase_hooks: List[PhaseHook] = field(init=False, repr=False)
 
     def __post_init__(self):
         self.root_context = Context(name="parser", data=None, initiator=self, parser=self)
         self._modules = {}
         self._ontology_modules = {}
+        self._modules_by_orig_name = {}
+        self._ontology_modules_by_orig_name = {}
+        self._modules_by_path = {}
+        self._modules_by_handler = {}
+        self._import_closures = {}
+        self._pending_imports = {}
         self.ontology_model_model_class = OntologyModelModel
         self.ontology_handler_model_class = OntologyHandlerModel
         self.import_loaders = [ImportLoader(self)]
         self._registered_types = {section: {} for section in ONTOLOGY_TYPES.sections()}
+        if self.shared_layer is not None:
+            self._modules = overlay(self.shared_layer.modules)
+            self._modules_by_orig_name = overlay(self.shared_layer.modules_by_orig_name)
+            self._modules_by_path = overlay(self.shared_layer.modules_by_path)
+            self._modules_by_handler = overlay(self.shared_layer.modules_by_handler)
+            self._registered_types = self.shared_layer.registered_types_overlay(ONTOLOGY_TYPES.sections())
         self._registered_instances = {section: {} for section in ONTOLOGY_INSTANCES.sections()}
         self._requested_references = []
+        self.usages = UsageIndex(parent=self.shared_layer.usages if self.shared_layer is not None else None)
+        self.stats = LoadStats()
+        self._phase_hooks = []
 
         with TemporaryDirectory() as temp_dir:
             self._temp_dir = temp_dir
@@ -209,25 +299,300 @@ class Parser(OntologyBase):
     def ontology_modules(self) -> Dict[str, OntologyModule]:
         return self._ontology_modules
 
+    @staticmethod
+    def _module_handler(module: ModelModule | OntologyModule) -> OntologyModel | Ontology:
+        return module.model if isinstance(module, ModelModule) else module.ontology
+
+    def _add_module(self, module: ModelModule | OntologyModule):
+        if isinstance(module, ModelModule):
+            modules, by_orig_name = self._modules, self._modules_by_orig_name
+        else:
+            modules, by_orig_name = self._ontology_modules, self._ontology_modules_by_orig_name
+        key = str(module.full_path)
+        previous = modules.get(key)
+        if previous is not None:
+            # the handlers importing the replaced module still refer to it, so it stays indexed by handler
+            self._unindex_orig_name(by_orig_name, previous)
+
+        modules[key] = module
+        # a new list is set, so a list of the shared layer is never changed in place
+        by_orig_name[module.orig_name] = [*by_orig_name.get(module.orig_name, []), module]
+        self._modules_by_path[module.full_path.resolve()] = module
+        self._modules_by_handler[id(self._module_handler(module))] = module
+        self._clear_import_closures()
+        self._fork_layer = None
+
+    def _clear_import_closures(self):
+        self._import_closures.clear()
+        # the flattened closures of the symbol tables are rebuilt on the next lookup
+        SymbolTable.invalidate()
+
+    @staticmethod
+    def _unindex_orig_name(by_orig_name: Dict[str, List[Any]], module: ModelModule | OntologyModule):
+        # modules are dataclasses, so they are compared by identity rather than by fields
+        same_name = [m for m in by_orig_name.get(module.orig_name, []) if m is not module]
+        if same_name:
+            by_orig_name[module.orig_name] = same_name
+        else:
+            by_orig_name.pop(module.orig_name, None)
+
+    def _remove_module(self, module: ModelModule | OntologyModule):
+        if isinstance(module, ModelModule):
+            modules, by_orig_name = self._modules, self._modules_by_orig_name
+        else:
+            modules, by_orig_name = self._ontology_modules, self._ontology_modules_by_orig_name
+        if self.shared_layer is not None and self.shared_layer.contains(module):
+            raise OntologyException("Can't remove a module of the shared layer", context=module.context)
+        modules.pop(str(module.full_path), None)
+
+        self._unindex_orig_name(by_orig_name, module)
+        resolved_path = module.full_path.resolve()
+        if self._modules_by_path.get(resolved_path) is module:
+            del self._modules_by_path[resolved_path]
+        if self._modules_by_handler.get(id(self._module_handler(module))) is module:
+            del self._modules_by_handler[id(self._module_handler(module))]
+        self._clear_import_closures()
+        self._fork_layer = None
+
     def get_module_by_orig_name(self, orig_name: str) -> Optional[ModelModule]:
-        return next(iter([m for m in self.modules.values() if m.orig_name == orig_name]), None)
+        return next(iter(self._modules_by_orig_name.get(orig_name, [])), None)
 
     def get_ontology_module_by_orig_name(self, orig_name: str) -> Optional[OntologyModule]:
-        return next(iter([m for m in self.ontology_modules.values() if m.orig_name == orig_name]), None)
+        return next(iter(self._ontology_modules_by_orig_name.get(orig_name, [])), None)
+
+    def get_module_by_path(self, full_path: str | Path) -> Optional[ModelModule | OntologyModule]:
+        return self._modules_by_path.get(Path(full_path).resolve())
 
     def get_module_by_model(self, model: OntologyModel) -> Optional[ModelModule]:
-        return next(iter([m for m in self.modules.values() if m.model is model]), None)
+        module = self._modules_by_handler.get(id(model))
+        if isinstance(module, ModelModule) and module.model is model:
+            return module
+        return None
 
     def get_module_by_ontology(self, ontology: Ontology) -> Optional[OntologyModule]:
-        return next(iter([m for m in self.ontology_modules.values() if m.ontology is ontology]), None)
+        module = self._modules_by_handler.get(id(ontology))
+        if isinstance(module, OntologyModule) and module.ontology is ontology:
+            return module
+        return None
+
+    def import_closure(self, handler: OntologyModel | Ontology) -> List[OntologyModel | Ontology]:
+        """The handler followed by all its direct and transitive imports, memoised until the modules change."""
+        self.load_pending_imports()
+        cached = self._import_closures.get(id(handler))
+        if cached is None or cached[0] is not handler:
+            cached = (handler, self._bypass_import_definitions(handler))
+            self._import_closures[id(handler)] = cached
+        return list(cached[1])
+
+    def add_phase_hook(
+        self,
+        on_phase_start: Optional[Callable[[str, Optional[str]], Any]] = None,
+        on_phase_end: Optional[Callable[[PhaseRecord], Any]] = None,
+    ) -> PhaseHook:
+        hook = PhaseHook(on_phase_start=on_phase_start, on_phase_end=on_phase_end)
+        self._phase_hooks.append(hook)
+        return hook
+
+    def remove_phase_hook(self, hook: PhaseHook):
+        self._phase_hooks.remove(hook)
+
+    @contextmanager
+    def phase(self, name: str, module: Optional[str] = None) -> Iterator[PhaseRecord]:
+        """
+        Measures a load phase into :attr:`stats` and notifies the phase hooks.
+        With ``track_memory`` enabled ``tracemalloc`` is started for the outermost phase, if it is not tracing yet.
+        """
+        started_tracing = self.track_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        record = self.stats.start(name, module)
+        try:
+            # a failing start hook (e.g. a cancellation check) still closes the phase and stops tracing
+            for hook in self._phase_hooks:
+                if hook.on_phase_start:
+                    hook.on_phase_start(name, module)
+            yield record
+        finally:
+            self.stats.end()
+            if started_tracing:
+                tracemalloc.stop()
+            for hook in self._phase_hooks:
+                if hook.on_phase_end:
+                    hook.on_phase_end(record)
+
+    def profile(self, output: Optional[str | Path] = None, sort_by: str = "cumulative"):
+        """
+        Wraps loads in ``cProfile``, the stats are dumped into ``output`` on exit::
+
+            with parser.profile("load.prof"):
+                parser.load_ontology(path)
+        """
+        return profile(output, sort_by=sort_by)
+
+    def memory_report(self) -> MemoryReport:
+        """
+        Deep sizes of the loaded modules (keyed by full path) attributed per class and per object kind.
+        Objects reachable only through the parser itself (e.g. unresolved references) are reported as ``<parser>``.
+        """
+        roots: Dict[str, Any] = {}
+        roots.update(self._modules)
+        roots.update(self._ontology_modules)
+        roots["<parser>"] = self
+        return memory_report(roots)
+
+    def freeze(self) -> SharedModelLayer:
+        """Freezes the loaded model modules into a layer to share with new parsers, see :class:`SharedModelLayer`."""
+        self.load_pending_imports()
+        return SharedModelLayer.freeze(self)
+
+    def fork(self) -> "Parser":
+        """
+        New parser that sees the model modules and types of this one without copying them, see :meth:`freeze`.
+        Instances, ontology modules and pending references of the fork are its own.
+        """
+        with self._lock:
+            if self._fork_layer is None:
+                self._fork_layer = self.freeze()
+            layer = self._fork_layer
+
+        result = Parser(
+            shared_layer=layer,
+            track_memory=self.track_memory,
+            retain_context_data=self.retain_context_data,
+            lazy_imports=self.lazy_imports,
+        )
+        result.ontology_model_model_class = self.ontology_model_model_class
+        result.ontology_handler_model_class = self.ontology_handler_model_class
+        result.import_loaders = list(self.import_loaders)
+        return result
+
+    def compact(self) -> int:
+        """
+        Releases the parse-time data kept by the contexts of the loaded modules and references.
+        Returns the number of compacted contexts.
+        The modules of the shared layer are immutable, a parser attached to it compacts only its own modules.
+        """
+        if self.shared_layer is None:
+            return compact_contexts([self])
+        # the shared modules are reachable from the own ones through references, imports and owners,
+        # so only the objects owned by the own modules are walked
+        own_modules = [*self._modules.maps[0].values(), *self._ontology_modules.values()]
+        roots = owned_contexts(own_modules) + [ref.context for ref in self._requested_references]
+        return compact_contexts(roots)
+
+    def unload(
+        self, module: ModelModule | OntologyModule, unused_imports: bool = False
+    ) -> List[ModelModule | OntologyModule]:
+        """
+        Removes the module from the parser with its registered types and instances, pending references and artifacts.
+        References of the other modules to its entities are requested again, so they are resolved by another module
+        or reported by the next finalization. Model modules imported by loaded modules can't be unloaded.
+        With ``unused_imports`` the imported model modules that are not imported by other modules any more
+        are unloaded as well. Returns the unloaded modules.
+        """
+        with self._lock:
+            if self.get_module_by_path(module.full_path) is not module:
+                raise OntologyException(f'Module "{module.orig_name}" is not loaded', context=module.context)
+            importers = [m.orig_name for m in self._importers(module)]
+            if importers:
+                raise OntologyException(
+                    f'Can\'t unload module "{module.orig_name}" imported by {", ".join(importers)}',
+                    context=module.context,
+                )
+            self._remove_module(module)
+
+            handler = self._module_handler(module)
+            owned = {id(obj): obj for obj in iter_owned(handler)}
+            owned[id(module)] = module
+            self._unregister(owned.values())
+            self._requested_references = [ref for ref in self._requested_references if id(ref) not in owned]
+            for obj in owned.values():
+                if isinstance(obj, BaseReference) and obj.value is not None:
+                    self.usages.remove(obj, obj.value)
+            self._invalidate_references(owned)
+
+            for pending in self._pending_imports.values():
+                pending.importers = [importer for importer in pending.importers if importer[0] is not module]
+            for artifact in module.artifacts.values():
+                artifact.close()
+            module.artifacts = {}
+            # the cycles of the module are broken, so it is freed without waiting for the garbage collector
+            handler.owner = None
+            module.symbols = SymbolTable()
+
+            unloaded = [module]
+            if unused_imports:
+                for _, _, imported in handler._resolved_imports or []:
+                    if (
+                        self.get_module_by_path(imported.full_path) is imported
+                        and not self._importers(imported)
+                        and not (self.shared_layer is not None and self.shared_layer.contains(imported))
+                    ):
+                        unloaded += self.unload(imported, unused_imports=True)
+            return unloaded
+
+    def _importers(self, module: ModelModule | OntologyModule) -> List[ModelModule | OntologyModule]:
+        return [
+            m
+            for m in [*self._modules.values(), *self._ontology_modules.values()]
+            if any(imported is module for _, _, imported in self._module_handler(m)._resolved_imports or [])
+        ]
+
+    def _unregister(self, objects: Iterable[OntologyBase]):
+        type_sections = ONTOLOGY_TYPES.class_to_section_mapping()
+        instance_sections = ONTOLOGY_INSTANCES.class_to_section_mapping()
+        for obj in objects:
+            if obj.__class__ in type_sections:
+                registered = self._registered_types[type_sections[obj.__class__]]
+            elif obj.__class__ in instance_sections:
+                registered = self._registered_instances[instance_sections[obj.__class__]]
+            else:
+                continue
+            if registered.get(obj.name) is obj:
+                del registered[obj.name]
+                if obj.__class__ in type_sections:
+                    self._restore_type(type_sections[obj.__class__], obj.name)
+
+    def _restore_type(self, section: str, name: str):
+        # the type of the same name declared by the latest loaded module takes the place of the unloaded one
+        for module in reversed(list(self._modules.values())):
+            declared = module.symbols.types[section].get(name)
+            if declared is not None:
+                self._registered_types[section][name] = declared
+                return
+
+    def _invalidate_references(self, owned: Dict[int, Any]):
+        for target in owned.values():
+            for reference in self.usages.discard(target):
+                reference.value = None
+                if not self.assign_reference(reference):
+                    self._requested_references.append(reference)
+        for module in [*self._modules.values(), *self._ontology_modules.values()]:
+            # the contexts of the modules loaded by an import of the unloaded module point to it
+            context = module.context
+            while context is not None:
+                if id(context.initiator) in owned or id(context.data) in owned:
+                    context.initiator = None
+                    context.data = None
+                context = context.parent
 
     def register_type(self, type: Derivable, context: Context):
         section = ONTOLOGY_TYPES.class_to_section_mapping().get(type.__class__)
         self._registered_types[section][type.name] = type
+        module = type.owner.owner if type.has_owner else None
+        if isinstance(module, ModelModule):
+            module.symbols.declare(section, type)
+        self.stats.count(COUNTER_ENTITIES)
 
     def register_instance(self, instance: Instance, context: Context):
         section = ONTOLOGY_INSTANCES.class_to_section_mapping().get(instance.__class__)
         self._registered_instances[section][instance.name] = instance
+        self.stats.count(COUNTER_ENTITIES)
+
+    def bulk_loader(
+        self, ontology: Ontology, mapping: Optional[ColumnMapping] = None, batch_size: int = 10000
+    ) -> BulkLoader:
+        return BulkLoader(parser=self, ontology=ontology, mapping=mapping or ColumnMapping(), batch_size=batch_size)
 
     def load_ontology_model_data(
         self,
@@ -241,7 +606,8 @@ class Parser(OntologyBase):
         full_path = Path(full_path)
 
         try:
-            ontology_model_model = self.ontology_model_model_class(**data)
+            with self.phase(PHASE_VALIDATION, str(orig_name)):
+                ontology_model_model = self.ontology_model_model_class(**data)
         except ValidationError as e:
             raise LoadException(
                 "Error while loading ontology model: Invalid data",
@@ -257,12 +623,15 @@ class Parser(OntologyBase):
             context=context,
         )
 
-        ontology_model = ontology_model_model.to_internal(context=context, owner=module)
-        module.model = ontology_model
+        with self._lock:
+            with self.phase(PHASE_TO_INTERNAL, module.orig_name):
+                ontology_model = ontology_model_model.to_internal(context=context, owner=module)
+            module.model = ontology_model
 
-        self._modules[str(full_path)] = module
+            self._add_module(module)
 
-        module.resolve_imports(context=context, import_loaders=self.import_loaders)
+            with self.phase(PHASE_IMPORTS, module.orig_name):
+                module.resolve_imports(context=context, import_loaders=self.import_loaders)
 
         return ontology_model
 
@@ -289,15 +658,19 @@ class Parser(OntologyBase):
                         context=context,
                         errors=["Expected orig_name provided while loading from IOBase"],
                     )
-            if not isinstance(full_path, io.IOBase):
-                with open(full_path, "r", encoding="utf-8") as file:
-                    data = yaml.safe_load(file)
-            else:
-                full_path.seek(0)
-                data = yaml.safe_load(full_path)
-            result = self.load_ontology_model_data(data, orig_name, full_path, context=context)
-            if finalize:
-                self.finalize_references()
+            with self.phase(PHASE_READ, str(orig_name)):
+                if not isinstance(full_path, io.IOBase):
+                    self.stats.count(COUNTER_FILES_OPENED)
+                    with open(full_path, "r", encoding="utf-8") as file:
+                        data = yaml.safe_load(file)
+                else:
+                    full_path.seek(0)
+                    data = yaml.safe_load(full_path)
+            # the references requested by the load are finalized before another thread can request its own ones
+            with self._lock:
+                result = self.load_ontology_model_data(data, orig_name, full_path, context=context)
+                if finalize:
+                    self.finalize_references()
             return result
         except yaml.YAMLError as e:
             raise LoadException(
@@ -318,7 +691,8 @@ class Parser(OntologyBase):
         full_path = Path(full_path)
 
         try:
-            ontology_handler_model = self.ontology_handler_model_class(**data)
+            with self.phase(PHASE_VALIDATION, str(orig_name)):
+                ontology_handler_model = self.ontology_handler_model_class(**data)
         except ValidationError as e:
             raise LoadException(
                 "Error while loading ontology: Invalid data",
@@ -334,11 +708,14 @@ class Parser(OntologyBase):
             context=context,
         )
 
-        ontology = ontology_handler_model.to_internal(context=context, owner=module)
-        module.ontology = ontology
+        with self._lock:
+            with self.phase(PHASE_TO_INTERNAL, module.orig_name):
+                ontology = ontology_handler_model.to_internal(context=context, owner=module)
+            module.ontology = ontology
 
-        module.resolve_imports(context=context, import_loaders=self.import_loaders)
-        self._ontology_modules[str(full_path)] = module
+            with self.phase(PHASE_IMPORTS, module.orig_name):
+                module.resolve_imports(context=context, import_loaders=self.import_loaders)
+            self._add_module(module)
 
         return ontology
 
@@ -364,14 +741,17 @@ class Parser(OntologyBase):
                         context=context,
                         errors=["Expected orig_name provided while loading from IOBase"],
                     )
-            if not isinstance(full_path, io.IOBase):
-                with open(full_path, "r", encoding="utf-8") as file:
-                    data = yaml.safe_load(file)
-            else:
-                full_path.seek(0)
-                data = yaml.safe_load(full_path)
-            result = self.load_ontology_data(data, orig_name, full_path, context=context)
-            self.finalize_references()
+            with self.phase(PHASE_READ, str(orig_name)):
+                if not isinstance(full_path, io.IOBase):
+                    self.stats.count(COUNTER_FILES_OPENED)
+                    with open(full_path, "r", encoding="utf-8") as file:
+                        data = yaml.safe_load(file)
+                else:
+                    full_path.seek(0)
+                    data = yaml.safe_load(full_path)
+            with self._lock:
+                result = self.load_ontology_data(data, orig_name, full_path, context=context)
+                self.finalize_references()
             return result
         except yaml.YAMLError as e:
             raise LoadException(
@@ -460,42 +840,201 @@ class Parser(OntologyBase):
 
         return result
 
+    def load_model_delta_archive(self, base_archive: str | Path, *delta_archives: str | Path) -> OntologyModel:
+        """Loads the model of the base archive with the delta archives applied in order, without extracting them."""
+        from at_ontology_parser.parsing.archive import load_overlay
+
+        return load_overlay(self, [base_archive, *delta_archives], ontology=False)
+
+    def load_ontology_delta_archive(self, base_archive: str | Path, *delta_archives: str | Path) -> Ontology:
+        """Loads the ontology of the base archive with the delta archives applied in order, without extracting them."""
+        from at_ontology_parser.parsing.archive import load_overlay
+
+        return load_overlay(self, [base_archive, *delta_archives], ontology=True)
+
     def _bypass_imports(
-        self, model: OntologyModel, parent_path: Path, skip_non_path: bool = True, _watched: List[OntologyModel] = None
+        self,
+        model: OntologyModel,
+        parent_path: Path,
+        skip_non_path: bool = True,
+        _watched: Set[Tuple[int, Path]] = None,
+        _result: Dict[Path, None] = None,
     ) -> List[Path]:
-        result: List[Path] = []
-        _watched = _watched or []
-        if model not in _watched:
-            current_watched = _watched + [model]
+        # an insertion ordered dict keeps the order of the paths with constant time membership checks
+        result: Dict[Path, None] = {} if _result is None else _result
+        _watched = set() if _watched is None else _watched
+        # the found paths depend only on the model and the parent path, so every pair is visited once
+        if (id(model), parent_path) not in _watched:
+            _watched.add((id(model), parent_path))
             for import_def in model.imports:
                 import_path = Path(import_def.file)
                 if import_path.is_absolute():
-                    result.append(import_path)
+                    result[import_path] = None
                     continue
                 full_import_path = parent_path / import_path
                 if not full_import_path.exists() and skip_non_path:
                     continue
 
-                if full_import_path not in result:
-                    result.append(full_import_path)
+                result[full_import_path] = None
 
                 imported_model = model.get_resolved_import(import_def)
-                result += [
-                    f
-                    for f in Parser._bypass_imports(
-                        imported_model,
-                        parent_path=import_path,
-                        _watched=current_watched,
-                    )
-                    if f not in result
-                ]
-        return result
+                if imported_model is None:
+                    # a pending import, see lazy_imports
+                    continue
+                Parser._bypass_imports(
+                    imported_model,
+                    parent_path=import_path,
+                    _watched=_watched,
+                    _result=result,
+                )
+        return list(result)
+
+    def _defer_import(
+        self, source_module: ModelModule | OntologyModule, import_def: ImportDefinition, context: Context
+    ) -> bool:
+        """
+        Postpones the import in ``lazy_imports`` mode, if the imported model is not loaded yet.
+        The paths are resolved the same way as :meth:`ImportLoader.resolve_import` does.
+        """
+        if not self.lazy_imports:
+            return False
+        if isinstance(source_module, ModelModule) and self.get_module_by_orig_name(import_def.file):
+            return False
+        import_path = Path(import_def.file)
+        orig_name = import_path
+        if not import_path.is_absolute():
+            import_path = source_module.full_path.parent / import_path
+            orig_name = None
+        if self.get_module_by_path(import_path) or not import_path.exists():
+            # missing files are reported by the import loaders
+            return False
+
+        pending = self._discover_import(import_path, orig_name)
+        pending.importers.append((source_module, import_def, context))
+        self.stats.count(COUNTER_IMPORTS_DEFERRED)
+        return True
+
+    def _discover_import(self, import_path: Path, orig_name: Optional[Path]) -> PendingImport:
+        """Scans the names of the imported model and of its not loaded imports, see :func:`scan_module`."""
+        resolved_path = import_path.resolve()
+        pending = self._pending_imports.get(resolved_path)
+        if pending is None:
+            pending = PendingImport.scan(import_path, orig_name)
+            # registered before the nested imports, so cyclic imports are scanned once
+            self._pending_imports[resolved_path] = pending
+            for file in pending.imports:
+                nested_path = Path(file)
+                nested_orig_name = nested_path
+                if not nested_path.is_absolute():
+                    nested_path = import_path.parent / nested_path
+                    nested_orig_name = None
+                if nested_path.exists() and not self.get_module_by_path(nested_path):
+                    self._discover_import(nested_path, nested_orig_name)
+        return pending
+
+    def _load_pending_import(self, pending: PendingImport) -> OntologyModel:
+        context = pending.importers[0][2] if pending.importers else self.root_context
+        model = self.load_model_yaml_file(
+            full_path=pending.full_path, orig_name=pending.orig_name, context=context, finalize=False
+        )
+        # dropped only once loaded, a failed or cancelled load leaves the import pending
+        self._pending_imports.pop(pending.full_path.resolve(), None)
+        module = self.get_module_by_model(model)
+        ImportLoader(self).load_artifacts(module)
+        model._built = True
+        module._built = True
+
+        # nested imports found only by scanning have no importers, they are linked when their importers are loaded
+        for source_module, import_def, _ in pending.importers:
+            handler = self._module_handler(source_module)
+            positions = {id(d): i for i, d in enumerate(handler.imports)}
+            handler._resolved_imports = sorted(
+                [*(handler._resolved_imports or []), (import_def, model, module)],
+                key=lambda resolved: positions.get(id(resolved[0]), len(positions)),
+            )
+            source_module.symbols.link(handler._resolved_imports)
+        self._clear_import_closures()
+        return model
+
+    def _load_required_imports(self):
+        """
+        Loads the pending imports declaring the aliases of the unresolved references, until the references are
+        resolved. When no pending import declares them, all the remaining ones are loaded.
+        """
+        while self._pending_imports:
+            # aliased names are declared in the pending modules without the alias prefixes
+            unresolved = {
+                name
+                for ref in self._requested_references
+                if not ref.fulfilled
+                for name in self._alias_suffixes(ref.alias)
+            }
+            if not unresolved:
+                return
+            required = [p for p in self._pending_imports.values() if not p.names.isdisjoint(unresolved)]
+            for pending in required or list(self._pending_imports.values()):
+                if pending.full_path.resolve() in self._pending_imports:
+                    self._load_pending_import(pending)
+            self._assign_requested_references()
+
+    def load_pending_imports(self) -> int:
+        """Loads all the imports postponed in ``lazy_imports`` mode. Returns the number of the loaded models."""
+        with self._lock:
+            loaded = 0
+            while self._pending_imports:
+                self._load_pending_import(next(iter(self._pending_imports.values())))
+                loaded += 1
+            if loaded:
+                self.finalize_references()
+            return loaded
 
     def request_reference(self, reference: BaseReference):
+        self.stats.count(COUNTER_REFERENCES_CREATED)
         if not self.assign_reference(reference):
+            self.stats.count(COUNTER_REFERENCES_DEFERRED)
             self._requested_references.append(reference)
 
-    def assign_reference(self, reference: BaseReference) -> bool:
+    @staticmethod
+    def _reference_handler(reference: BaseReference) -> Optional[OntologyModel | Ontology]:
+        """The model or ontology of a module the reference is declared in, found by its context."""
+        context = reference.context
+        while context is not None:
+            if isinstance(context.initiator, (OntologyModel, Ontology)):
+                handler = context.initiator
+                return handler if isinstance(handler.owner, (ModelModule, OntologyModule)) else None
+            context = context.parent
+        return None
+
+    def _lookup_type(self, section: str, reference: BaseReference) -> Optional[Derivable]:
+        handler = self._reference_handler(reference)
+        if handler is None:
+            return self._registered_types.get(section, {}).get(reference.alias)
+        found = handler.owner.symbols.lookup(section, reference.alias)
+        # a module importing nothing is resolved against all the loaded models, the others only against
+        # their import closure: the global table may hold a type of another version
+        if found is None and not handler.imports:
+            found = self._registered_types.get(section, {}).get(reference.alias)
+        return found
+
+    @staticmethod
+    def _alias_suffixes(alias: str) -> Iterator[str]:
+        yield alias
+        while "." in alias:
+            alias = alias.split(".", 1)[1]
+            yield alias
+
+    def assign_reference(self, reference: BaseReference, track_usage: bool = True) -> bool:
+        """Resolves the reference, the fulfilled references are recorded into :attr:`usages` if ``track_usage``."""
+        previous = reference.value
+        fulfilled = self._assign_reference(reference)
+        if track_usage and reference.value is not previous:
+            if previous is not None:
+                self.usages.remove(reference, previous)
+            if reference.value is not None:
+                self.usages.add(reference)
+        return fulfilled
+
+    def _assign_reference(self, reference: BaseReference) -> bool:
         if isinstance(reference, OntologyReference):
             for t in reference.types:
                 cls = t
@@ -504,9 +1043,9 @@ class Parser(OntologyBase):
                     cls = ONTOLOGY_TYPES.class_mapping().get(name)
                 section = ONTOLOGY_TYPES.class_to_section_mapping().get(cls)
                 if section:
-                    registered = self._registered_types.get(section, {})
-                    if reference.alias in registered:
-                        reference.value = registered[reference.alias]
+                    found = self._lookup_type(section, reference)
+                    if found is not None:
+                        reference.value = found
                         return reference.fulfilled
                 cls = t
                 if isinstance(t, ForwardRef) or t.__class__ is ForwardRef:
@@ -533,10 +1072,19 @@ Check, that reference is created by classmethod {reference.__class__.__name__}.c
         return reference.fulfilled
 
     def finalize_references(self, context: "Context" = None) -> bool:
-        context = context or self.root_context
+        with self._lock, self.phase(PHASE_FINALIZE):
+            return self._finalize_references(context)
+
+    def _assign_requested_references(self):
         for ref in self._requested_references:
             if not ref.fulfilled:
                 self.assign_reference(ref)
+
+    def _finalize_references(self, context: "Context" = None) -> bool:
+        context = context or self.root_context
+        self._assign_requested_references()
+        if self._pending_imports:
+            self._load_required_imports()
         self._requested_references = [ref for ref in self._requested_references if not ref.finalize()]
         errors: List[OntologyException] = []
         for ref in self._requested_references:
@@ -587,42 +1135,93 @@ Check, that reference is created by classmethod {reference.__class__.__name__}.c
         return Path("/".join(name.split(".")) + "/types.mdl.yml")
 
     @staticmethod
-    def _bypass_import_definitions(
-        handler: Ontology | OntologyModel, _watched: List[OntologyModel | Ontology] = None
-    ) -> List[OntologyModel]:
+    def _bypass_import_definitions(handler: Ontology | OntologyModel) -> List[OntologyModel]:
+        """The handler and its imports in depth-first preorder, every handler once."""
         result = []
-        _watched = _watched or []
+        watched: Set[int] = set()
+        stack = [handler]
+        while stack:
+            current = stack.pop()
+            if id(current) in watched:
+                continue
+            watched.add(id(current))
+            result.append(current)
+            stack.extend(reversed([imported for _, imported, _ in current._resolved_imports or []]))
+        return result
 
-        def includes_object(iterable: Iterable, obj: Any) -> bool:
-            for item in iterable:
-                if obj is item:
-                    return True
-            return False
+    def build_archive(
+        self,
+        root_handler: Ontology | OntologyModel,
+        skip_modules: List[ModelModule | str] = None,
+        export_dir: str | Path = None,
+        module_subpath_generator: Callable[[ModelModule], Path] = None,
+        clear_after: bool = True,
+    ) -> Path:
+        from at_ontology_parser.parsing.archive import ArchiveManifest
 
-        if not includes_object(_watched, handler):
-            result.append(handler)
-            current_watched = _watched + [handler]
-            for import_def in handler.imports:
-                imported_model = handler.get_resolved_import(import_def)
-                result += [
-                    t
-                    for t in Parser._bypass_import_definitions(imported_model, _watched=current_watched)
-                    if not includes_object(result, t)
-                ]
+        export_dir = Path(export_dir or self.temp_dir / f"export/{str(uuid4())}/")
+        tree_dir, archive_name, module_subpaths = self._export_tree(
+            root_handler, skip_modules, export_dir, module_subpath_generator
+        )
+        ArchiveManifest.scan(tree_dir, "types.yml", module_subpaths).write(tree_dir)
 
-        return result
+        csar_path = shutil.make_archive(export_dir / archive_name, "zip", tree_dir)
 
-    def build_archive(
+        if clear_after:
+            shutil.rmtree(tree_dir)
+
+        return Path(csar_path)
+
+    def build_delta_archive(
         self,
         root_handler: Ontology | OntologyModel,
+        base_archive: str | Path,
         skip_modules: List[ModelModule | str] = None,
         export_dir: str | Path = None,
         module_subpath_generator: Callable[[ModelModule], Path] = None,
         clear_after: bool = True,
     ) -> Path:
+        """
+        Builds an archive with only the modules and artifacts changed since the ``base_archive``
+        (built by :meth:`build_archive` or by this method), compared by the content hashes of its manifest.
+        The delta is loaded on top of its base by :meth:`load_ontology_delta_archive`.
+        """
+        from at_ontology_parser.parsing.archive import ArchiveManifest
+        from at_ontology_parser.parsing.archive import write_delta
+
+        base_archive = Path(base_archive)
+        base = None
+        if zipfile.is_zipfile(base_archive):
+            with zipfile.ZipFile(base_archive, "r") as zip_ref:
+                base = ArchiveManifest.read(zip_ref)
+        if base is None:
+            raise OntologyException(
+                "Can't build delta archive. The base archive has no manifest",
+                context=self.root_context.create_child(str(base_archive)),
+            )
+
+        export_dir = Path(export_dir or self.temp_dir / f"export/{str(uuid4())}/")
+        tree_dir, archive_name, module_subpaths = self._export_tree(
+            root_handler, skip_modules, export_dir, module_subpath_generator
+        )
+        manifest = ArchiveManifest.scan(tree_dir, "types.yml", module_subpaths)
+
+        delta_path = write_delta(tree_dir, manifest, base, export_dir / f"{archive_name}.delta.zip")
+
+        if clear_after:
+            shutil.rmtree(tree_dir)
+
+        return delta_path
+
+    def _export_tree(
+        self,
+        root_handler: Ontology | OntologyModel,
+        skip_modules: Optional[List[ModelModule | str]],
+        export_dir: Path,
+        module_subpath_generator: Optional[Callable[[ModelModule], Path]],
+    ) -> Tuple[Path, str, List[str]]:
+        """Exports the handler and its imports into a new directory, returns it, the archive name and module paths."""
         module_subpath_generator = module_subpath_generator or self.default_module_subpath_generator
-        export_dir = export_dir or self.temp_dir / f"export/{str(uuid4())}/"
-        export_dir = Path(export_dir)
         skip_modules = skip_modules or []
         skip_modules = [
             self.get_module_by_orig_name(m, ignore_version=True) if isinstance(m, str) else m
@@ -643,24 +1242,27 @@ Check, that reference is created by classmethod {reference.__class__.__name__}.c
                 context=self.root_context.create_child(root_handler),
             )
 
-        imported_models = self._bypass_import_definitions(root_handler)[1:]
-        skip_models = [m.model for m in skip_modules]
-        imported_modules = [self.get_module_by_model(m) for m in imported_models if m not in skip_models]
+        imported_models = self.import_closure(root_handler)[1:]
+        skip_models = {id(m.model) for m in skip_modules}
+        imported_modules = [self.get_module_by_model(m) for m in imported_models if id(m) not in skip_models]
 
-        export_uuid = str(uuid4())
+        tree_dir = export_dir / str(uuid4())
 
         self.export_module(
             root_module,
             "types.yml",
-            export_dir / export_uuid,
+            tree_dir,
             skip_modules,
             module_subpath_generator=module_subpath_generator,
         )
+        module_subpaths = ["types.yml"]
         for module in imported_modules:
+            module_subpath = module_subpath_generator(module)
+            module_subpaths.append(Path(module_subpath).as_posix())
             self.export_module(
                 module,
-                module_subpath_generator(module),
-                export_dir / export_uuid,
+                module_subpath,
+                tree_dir,
                 skip_modules,
                 module_subpath_generator,
             )
@@ -675,12 +1277,7 @@ Check, that reference is created by classmethod {reference.__class__.__name__}.c
         if archive_name.endswith(".yaml"):
             archive_name = archive_name[:-5]
 
-        csar_path = shutil.make_archive(export_dir / archive_name, "zip", export_dir / export_uuid)
-
-        if clear_after:
-            shutil.rmtree(export_dir / export_uuid)
-
-        return Path(csar_path)
+        return tree_dir, archive_name, module_subpaths
 
     def export_module(
         self,
@@ -695,6 +1292,7 @@ Check, that reference is created by classmethod {reference.__class__.__name__}.c
         skip_modules = [self.get_module_by_orig_name(m) if isinstance(m, str) else m for m in skip_modules]
         export_file_subpath = Path(export_file_subpath)
         export_dir = Path(export_dir)
+        self.load_pending_imports()
 
         if isinstance(module, ModelModule):
             handler = module.model
@@ -0,0 +1,88 @@
+from collections import ChainMap
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+from typing import Dict
+from typing import Mapping
+from typing import Optional
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+from at_ontology_parser.base import Derivable
+from at_ontology_parser.exceptions import OntologyException
+from at_ontology_parser.model import OntologyModel
+from at_ontology_parser.parsing.usages import UsageIndex
+from at_ontology_parser.reference import BaseReference
+
+if TYPE_CHECKING:
+    from at_ontology_parser.parsing.parser import ModelModule
+    from at_ontology_parser.parsing.parser import Parser
+
+
+def _freeze(mapping: Mapping) -> MappingProxyType:
+    return MappingProxyType(dict(mapping))
+
+
+def _declared_in_model(reference: BaseReference) -> bool:
+    # the references of the ontologies loaded by the frozen parser are not shared
+    owner = reference.owner
+    while owner is not None and not isinstance(owner, OntologyModel):
+        owner = owner.owner
+    return owner is not None
+
+
+def overlay(shared: Mapping) -> ChainMap:
+    """Copy-on-write view of a shared mapping: reads fall through to it, writes go to a private dict."""
+    return ChainMap({}, shared)
+
+
+@dataclass(frozen=True, kw_only=True)
+class SharedModelLayer:
+    """
+    Read-only snapshot of the model modules loaded by a parser, with their registered types and lookup indexes.
+    Parsers created with ``Parser(shared_layer=layer)`` see the shared modules and types as if they had loaded
+    them, their own modules, types and instances are added on top of the layer without changing it.
+
+    The shared entities themselves are not copied and must not be modified by the attached parsers.
+    """
+
+    modules: Mapping[str, "ModelModule"]
+    registered_types: Mapping[str, Mapping[str, Derivable]]
+    modules_by_orig_name: Mapping[str, Tuple["ModelModule", ...]] = field(repr=False)
+    modules_by_path: Mapping[Path, "ModelModule"] = field(repr=False)
+    modules_by_handler: Mapping[int, "ModelModule"] = field(repr=False)
+    usages: Optional[UsageIndex] = field(default=None, repr=False)
+
+    @classmethod
+    def freeze(cls, parser: "Parser") -> "SharedModelLayer":
+        """Freezes all the model modules of the parser, their references must be resolved."""
+        with parser._lock:
+            if parser._requested_references:
+                raise OntologyException(
+                    "Can't freeze modules with unresolved references, finalize the references first",
+                    context=parser.root_context,
+                )
+            modules = dict(parser._modules)
+            module_ids = {id(m) for m in modules.values()}
+            return cls(
+                modules=_freeze(modules),
+                registered_types=_freeze({s: _freeze(types) for s, types in parser._registered_types.items()}),
+                modules_by_orig_name=_freeze(
+                    {name: tuple(ms) for name, ms in parser._modules_by_orig_name.items() if ms}
+                ),
+                modules_by_path=_freeze(
+                    {path: m for path, m in parser._modules_by_path.items() if id(m) in module_ids}
+                ),
+                modules_by_handler=_freeze(
+                    {handler: m for handler, m in parser._modules_by_handler.items() if id(m) in module_ids}
+                ),
+                usages=parser.usages.copy(_declared_in_model),
+            )
+
+    def contains(self, module: Any) -> bool:
+        return self.modules_by_handler.get(id(getattr(module, "model", None))) is module
+
+    def registered_types_overlay(self, sections) -> Dict[str, ChainMap]:
+        return {section: overlay(self.registered_types.get(section, {})) for section in sections}
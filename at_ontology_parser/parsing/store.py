@@ -0,0 +1,691 @@
+"""
+SQLite store of parsed models and ontologies::
+
+    with OntologyStore("ontologies.db") as store:
+        store.save_ontology(ontology, parser)
+
+    store = OntologyStore("ontologies.db")
+    ontology = store.open_ontology("test-ontology")
+    ontology.vertices["Vertex1"].props.questions
+
+Models are stored whole and loaded eagerly, they are small. Vertices, relationships and their property assignments
+are stored as rows and an opened ontology materialises them on access: the last ``cache_size`` accessed instances
+of a section are kept, older ones are dropped as soon as nothing else refers to them. Artifacts are not stored.
+"""
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Generic
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import TextIO
+from typing import Tuple
+from weakref import WeakValueDictionary
+
+import yaml
+
+from at_ontology_parser.base import Instance
+from at_ontology_parser.exceptions import Context
+from at_ontology_parser.exceptions import ImportException
+from at_ontology_parser.exceptions import OntologyException
+from at_ontology_parser.model import OntologyModel
+from at_ontology_parser.model.definitions import ImportDefinition
+from at_ontology_parser.model.definitions import PropertyDefinition
+from at_ontology_parser.model.types import ONTOLOGY_TYPES
+from at_ontology_parser.model.types import RelationshipType
+from at_ontology_parser.model.types import VertexType
+from at_ontology_parser.ontology.assignments import PropertyAssignment
+from at_ontology_parser.ontology.handler import Ontology
+from at_ontology_parser.ontology.instances import Relationship
+from at_ontology_parser.ontology.instances import Vertex
+from at_ontology_parser.ontology.query import EdgePattern
+from at_ontology_parser.ontology.query import NodePattern
+from at_ontology_parser.ontology.query import PathQuery
+from at_ontology_parser.ontology.query import QueryIndex
+from at_ontology_parser.ontology.query import QueryPlan
+from at_ontology_parser.parsing.models.ontology.assignments.property_assignment import (
+    get_property_definition_from_type,
+)
+from at_ontology_parser.parsing.parser import ImportLoader
+from at_ontology_parser.parsing.parser import ModelModule
+from at_ontology_parser.parsing.parser import OntologyModule
+from at_ontology_parser.parsing.parser import Parser
+from at_ontology_parser.reference import OntologyReference
+from at_ontology_parser.reference import OwnerFeatureReference
+from at_ontology_parser.reference import T
+
+MODEL = "model"
+ONTOLOGY = "ontology"
+DEFAULT_CACHE_SIZE = 10000
+# rows fetched at once while streaming a section
+BATCH_SIZE = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS modules (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    orig_name TEXT NOT NULL,
+    full_path TEXT NOT NULL UNIQUE,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS modules_name ON modules (kind, name);
+
+CREATE TABLE IF NOT EXISTS imports (
+    module_id INTEGER NOT NULL REFERENCES modules (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    alias TEXT,
+    file TEXT NOT NULL,
+    imported_id INTEGER REFERENCES modules (id) ON DELETE SET NULL,
+    PRIMARY KEY (module_id, position)
+);
+
+CREATE TABLE IF NOT EXISTS types (
+    id INTEGER PRIMARY KEY,
+    module_id INTEGER NOT NULL REFERENCES modules (id) ON DELETE CASCADE,
+    section TEXT NOT NULL,
+    name TEXT NOT NULL,
+    derived_from TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS types_name ON types (name);
+CREATE INDEX IF NOT EXISTS types_derived_from ON types (derived_from);
+
+CREATE TABLE IF NOT EXISTS vertices (
+    id INTEGER PRIMARY KEY,
+    module_id INTEGER NOT NULL REFERENCES modules (id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    label TEXT,
+    description TEXT,
+    metadata TEXT,
+    UNIQUE (module_id, name)
+);
+CREATE INDEX IF NOT EXISTS vertices_type ON vertices (module_id, type);
+
+CREATE TABLE IF NOT EXISTS relationships (
+    id INTEGER PRIMARY KEY,
+    module_id INTEGER NOT NULL REFERENCES modules (id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    source TEXT NOT NULL,
+    target TEXT NOT NULL,
+    label TEXT,
+    description TEXT,
+    metadata TEXT,
+    UNIQUE (module_id, name)
+);
+CREATE INDEX IF NOT EXISTS relationships_type ON relationships (module_id, type);
+CREATE INDEX IF NOT EXISTS relationships_source ON relationships (module_id, source, type);
+CREATE INDEX IF NOT EXISTS relationships_target ON relationships (module_id, target, type);
+
+CREATE TABLE IF NOT EXISTS property_assignments (
+    module_id INTEGER NOT NULL REFERENCES modules (id) ON DELETE CASCADE,
+    section TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    property TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (module_id, section, owner, position)
+);
+CREATE INDEX IF NOT EXISTS property_assignments_property ON property_assignments (module_id, section, property);
+"""
+
+INSTANCE_SECTIONS = ("vertices", "relationships")
+
+
+def _dumps(value: Any) -> Optional[str]:
+    return None if value is None else json.dumps(value, ensure_ascii=False, default=str)
+
+
+def _loads(value: Optional[str]) -> Any:
+    return None if value is None else json.loads(value)
+
+
+def _store_path(full_path: str | Path) -> str:
+    return str(Path(full_path).resolve())
+
+
+@dataclass(kw_only=True)
+class StoredReference(OntologyReference, Generic[T]):
+    """Reference resolved by ``resolver`` on the first access of its value."""
+
+    resolver: Optional[Callable[[str], Any]] = field(init=False, default=None, repr=False)
+    _value: Optional[T] = field(init=False, default=None, repr=False)
+
+    @property
+    def value(self) -> Optional[T]:
+        if self._value is None and self.resolver is not None:
+            self._value = self.resolver(self.alias)
+        return self._value
+
+    @value.setter
+    def value(self, value: Optional[T]):
+        self._value = value
+
+
+class StoreImportLoader(ImportLoader):
+    """Resolves imports with the modules of the store, by the path the importing module was stored with."""
+
+    def __init__(self, store: "OntologyStore", *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.store = store
+
+    def resolve_import(
+        self, source_module: ModelModule | OntologyModule, import_def: ImportDefinition, context: Context
+    ) -> ModelModule:
+        import_path = Path(import_def.file)
+        if not import_path.is_absolute():
+            import_path = source_module.full_path.parent / import_path
+
+        loaded_module = source_module.parser.get_module_by_path(import_path)
+        if loaded_module:
+            return loaded_module
+
+        row = self.store._module_row(MODEL, full_path=_store_path(import_path))
+        if row is None:
+            raise ImportException(
+                f'Error while loading ontology or ontology model: Module "{import_def.file}" is not stored',
+                context=context,
+            )
+        model = source_module.parser.load_ontology_model_data(
+            _loads(row["data"]), orig_name=row["orig_name"], full_path=row["full_path"], context=context
+        )
+        module = source_module.parser.get_module_by_model(model)
+        model._built = True
+        module._built = True
+        return module
+
+
+class StoredInstances(Mapping):
+    """
+    Read-only mapping of the vertices or relationships of a stored ontology, materialised on access.
+    The instances stay identical while they are referenced, see the module docstring for the caching.
+    """
+
+    def __init__(self, ontology: "LazyOntology", section: str, cache_size: int):
+        self.ontology = ontology
+        self.section = section
+        self.cache_size = cache_size
+        self._recent: OrderedDict[str, Instance] = OrderedDict()
+        self._alive: WeakValueDictionary[str, Instance] = WeakValueDictionary()
+        self._lock = threading.RLock()
+
+    @property
+    def store(self) -> "OntologyStore":
+        return self.ontology.store
+
+    def _remember(self, instance: Instance) -> Instance:
+        with self._lock:
+            self._alive[instance.name] = instance
+            self._recent[instance.name] = instance
+            self._recent.move_to_end(instance.name)
+            while len(self._recent) > self.cache_size:
+                self._recent.popitem(last=False)
+        return instance
+
+    def select(self, where: str = "", params: Sequence[Any] = ()) -> Iterator[Instance]:
+        """Streams the instances of the rows matching the SQL condition, in the stored order."""
+        sql = f"SELECT * FROM {self.section} WHERE module_id = ?"
+        if where:
+            sql += f" AND ({where})"
+        for rows in self.store._batches(sql + " ORDER BY id", (self.ontology.module_id, *params)):
+            yield from self._materialise(rows)
+
+    def _materialise(self, rows: List[sqlite3.Row]) -> List[Instance]:
+        result = []
+        missing = []
+        for row in rows:
+            instance = self._alive.get(row["name"])
+            result.append(instance)
+            if instance is None:
+                missing.append(row)
+
+        if missing:
+            properties: Dict[str, List[sqlite3.Row]] = {}
+            for property_rows in self.store._batches(
+                f"SELECT * FROM property_assignments WHERE module_id = ? AND section = ? "
+                f"AND owner IN ({', '.join('?' * len(missing))}) ORDER BY owner, position",
+                (self.ontology.module_id, self.section, *(row["name"] for row in missing)),
+            ):
+                for property_row in property_rows:
+                    properties.setdefault(property_row["owner"], []).append(property_row)
+            created = {
+                row["name"]: self.ontology._create_instance(row, properties.get(row["name"], [])) for row in missing
+            }
+            result = [instance or created[row["name"]] for instance, row in zip(result, rows)]
+        return [self._remember(instance) for instance in result]
+
+    def __getitem__(self, name: str) -> Instance:
+        instance = self._alive.get(name)
+        if instance is not None:
+            return self._remember(instance)
+        for instance in self.select("name = ?", (name,)):
+            return instance
+        raise KeyError(name)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._alive or bool(
+            self.store._fetch(
+                f"SELECT 1 FROM {self.section} WHERE module_id = ? AND name = ?", (self.ontology.module_id, name)
+            )
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        sql = f"SELECT name FROM {self.section} WHERE module_id = ? ORDER BY id"
+        for rows in self.store._batches(sql, (self.ontology.module_id,)):
+            for row in rows:
+                yield row["name"]
+
+    def __len__(self) -> int:
+        sql = f"SELECT COUNT(*) FROM {self.section} WHERE module_id = ?"
+        return self.store._fetch(sql, (self.ontology.module_id,))[0][0]
+
+    def values(self) -> Iterator[Instance]:
+        return self.select()
+
+    def items(self) -> Iterator[Tuple[str, Instance]]:
+        for instance in self.select():
+            yield instance.name, instance
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.section!r}, cached={len(self._recent)})"
+
+
+@dataclass(kw_only=True)
+class LazyOntology(Ontology):
+    """
+    Ontology opened with :meth:`OntologyStore.open_ontology`. ``vertices`` and ``relationships`` are
+    :class:`StoredInstances`, the instances are not registered in the parser, relationship ends are resolved
+    on first access, and queries use the indexes of the store.
+    """
+
+    store: "OntologyStore" = field(init=False, repr=False)
+    module_id: int = field(init=False, repr=False)
+    parser: Parser = field(init=False, repr=False)
+    _context: Context = field(init=False, repr=False)
+
+    @classmethod
+    def create(cls, store: "OntologyStore", row: sqlite3.Row, parser: Parser, cache_size: int) -> "LazyOntology":
+        data = _loads(row["data"])
+        result = cls(name=row["name"], label=data.get("label"), description=data.get("description"))
+        result.store = store
+        result.module_id = row["id"]
+        result.parser = parser
+        # detached from the parser, so the references of the instances are never requested
+        result._context = Context(name=row["orig_name"], initiator=result)
+        result.vertices = StoredInstances(result, "vertices", cache_size)
+        result.relationships = StoredInstances(result, "relationships", cache_size)
+        for import_row in store._fetch("SELECT * FROM imports WHERE module_id = ? ORDER BY position", (row["id"],)):
+            import_def = ImportDefinition(file=import_row["file"], alias=import_row["alias"])
+            import_def.owner = result
+            import_def._built = True
+            result.imports.append(import_def)
+        return result
+
+    def _reference(self, reference_type, alias: str, context: Context, owner: Instance):
+        reference = reference_type(alias=alias, context=context)
+        reference.owner = owner
+        return reference
+
+    def _resolve_vertex(self, name: str) -> Optional[Vertex]:
+        # relationships may point to the vertices of other loaded ontologies
+        return self.vertices.get(name) or self.parser._registered_instances["vertices"].get(name)
+
+    def _create_instance(self, row: sqlite3.Row, property_rows: List[sqlite3.Row]) -> Instance:
+        section = "vertices" if "source" not in row.keys() else "relationships"
+        context = self._context.create_child(section).create_child(row["name"])
+        fields = dict(
+            name=row["name"],
+            label=row["label"],
+            description=row["description"],
+            metadata=_loads(row["metadata"]),
+            type=None,
+            artifacts=[],
+        )
+        if section == "vertices":
+            instance = Vertex(**fields)
+            type_reference = OntologyReference[VertexType]
+        else:
+            instance = Relationship(**fields, source=None, target=None)
+            type_reference = OntologyReference[RelationshipType]
+            for end in ("source", "target"):
+                reference = self._reference(StoredReference[Vertex], row[end], context.create_child(end), instance)
+                reference.resolver = self._resolve_vertex
+                setattr(instance, end, reference)
+        instance.type = self._reference(type_reference, row["type"], context.create_child("type"), instance)
+        # the materialised instances are evicted from the cache, so they are not kept alive by the usage index
+        self.parser.assign_reference(instance.type, track_usage=False)
+
+        instance.properties = []
+        properties_context = context.create_child("properties")
+        for property_row in property_rows:
+            assignment = PropertyAssignment(value=_loads(property_row["value"]), definition=None)
+            assignment.owner = instance
+            assignment._built = True
+            assignment.definition = OwnerFeatureReference[PropertyDefinition, Instance].create(
+                property_row["property"],
+                context=properties_context.create_child(property_row["property"], initiator=assignment),
+                feature_getter=get_property_definition_from_type,
+                owner=assignment,
+            )
+            self.parser.assign_reference(assignment.definition, track_usage=False)
+            instance.properties.append(assignment)
+
+        instance.owner = self
+        instance._built = True
+        return instance
+
+    def query(self, query: str | PathQuery) -> QueryPlan:
+        return QueryPlan.build(self, query, index=StoreQueryIndex(self))
+
+    def _to_repr(self, context, minify=True, exclude_name=True, with_restricted=False):
+        result = super()._to_repr(context, minify, exclude_name, with_restricted=with_restricted)
+        for section in INSTANCE_SECTIONS:
+            section_context = context.create_child(section)
+            represented = {
+                name: instance.to_representation(
+                    section_context.create_child(name), minify=minify, exclude_name=exclude_name
+                )
+                for name, instance in getattr(self, section).items()
+            }
+            result.pop(section, None)
+            if represented:
+                result[section] = represented
+        return result
+
+    def write_yaml(self, stream: TextIO):
+        """Writes the ontology as YAML instance by instance, so the whole representation is never built."""
+        context = self._context
+        header = {"name": self.name, "label": self.label, "description": self.description}
+        header = {key: value for key, value in header.items() if value is not None}
+        header["imports"] = [i.to_representation(context) for i in self.imports]
+        yaml.safe_dump(header, stream, allow_unicode=True, sort_keys=False)
+        for section in INSTANCE_SECTIONS:
+            instances = getattr(self, section)
+            if not len(instances):
+                continue
+            stream.write(f"{section}:\n")
+            section_context = context.create_child(section)
+            for name, instance in instances.items():
+                data = {name: instance.to_representation(section_context.create_child(name))}
+                text = yaml.safe_dump(data, allow_unicode=True, sort_keys=False)
+                stream.write("".join(f"  {line}" for line in text.splitlines(keepends=True)))
+
+
+class StoreQueryIndex(QueryIndex):
+    """:class:`QueryIndex` answering with SQL over the store instead of indexing all the instances in memory."""
+
+    def __init__(self, ontology: LazyOntology):
+        self.ontology = ontology
+        self.store = ontology.store
+        registered_types = ontology.parser._registered_types
+        self.children: Dict[str, List[str]] = {}
+        for section in ONTOLOGY_TYPES.sections():
+            for type in registered_types[section].values():
+                if type.derived_from is not None and type.derived_from.fulfilled:
+                    self.children.setdefault(type.derived_from.value.name, []).append(type.name)
+        self.index_type_names({name for section in registered_types.values() for name in section})
+
+    def subtypes(self, type_name: str) -> List[str]:
+        result = [type_name]
+        for name in result:
+            result += self.children.get(name, [])
+        return result
+
+    def _type_condition(self, type_name: Optional[str]) -> Tuple[str, List[str]]:
+        if type_name is None:
+            return "", []
+        subtypes = self.subtypes(type_name)
+        return f"type IN ({', '.join('?' * len(subtypes))})", subtypes
+
+    def candidates(self, node: NodePattern) -> Iterable[Vertex]:
+        name = self.name_condition(node)
+        if name is not None:
+            vertex = self.ontology.vertices.get(name)
+            return [vertex] if vertex is not None else []
+        return self.ontology.vertices.select(*self._type_condition(node.type))
+
+    def count(self, node: NodePattern) -> int:
+        if self.name_condition(node) is not None:
+            return int(self.name_condition(node) in self.ontology.vertices)
+        where, params = self._type_condition(node.type)
+        sql = "SELECT COUNT(*) FROM vertices WHERE module_id = ?" + (f" AND {where}" if where else "")
+        return self.store._fetch(sql, (self.ontology.module_id, *params))[0][0]
+
+    def matches(self, vertex: Vertex, node: NodePattern) -> bool:
+        if node.type is not None and (not vertex.type.fulfilled or node.type not in vertex.type.value.derivation_path):
+            return False
+        return all(condition.test(vertex) for condition in node.conditions)
+
+    def neighbours(self, vertex: Vertex, edge: EdgePattern) -> Iterator[Tuple[Relationship, Vertex]]:
+        end, other = ("source", "target") if edge.forward else ("target", "source")
+        where, params = self._type_condition(edge.type)
+        condition = f"{end} = ?" + (f" AND {where}" if where else "")
+        for relationship in self.ontology.relationships.select(condition, (vertex.name, *params)):
+            reference = getattr(relationship, other)
+            if reference.fulfilled:
+                yield relationship, reference.value
+
+
+class OntologyStore:
+    """SQLite database of models and ontologies, see the module docstring."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._lock = threading.RLock()
+        with self._lock, self._connection:
+            self._connection.executescript(SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "OntologyStore":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _fetch(self, sql: str, params: Sequence[Any] = ()) -> List[sqlite3.Row]:
+        with self._lock:
+            return self._connection.execute(sql, params).fetchall()
+
+    def _batches(self, sql: str, params: Sequence[Any] = ()) -> Iterator[List[sqlite3.Row]]:
+        with self._lock:
+            cursor = self._connection.execute(sql, params)
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(BATCH_SIZE)
+            if not rows:
+                return
+            yield rows
+
+    def _module_row(self, kind: str, name: Optional[str] = None, full_path: Optional[str] = None):
+        if full_path is not None:
+            rows = self._fetch("SELECT * FROM modules WHERE kind = ? AND full_path = ?", (kind, full_path))
+        else:
+            rows = self._fetch("SELECT * FROM modules WHERE kind = ? AND name = ? ORDER BY id DESC", (kind, name))
+        return rows[0] if rows else None
+
+    def module_names(self, kind: str = ONTOLOGY) -> List[str]:
+        return [row["name"] for row in self._fetch("SELECT name FROM modules WHERE kind = ? ORDER BY id", (kind,))]
+
+    def _insert_module(self, kind: str, module: ModelModule | OntologyModule, name: str, data: Dict[str, Any]) -> int:
+        full_path = _store_path(module.full_path)
+        # the rows of the replaced module are deleted by the foreign keys
+        self._connection.execute("DELETE FROM modules WHERE full_path = ?", (full_path,))
+        cursor = self._connection.execute(
+            "INSERT INTO modules (kind, name, orig_name, full_path, data) VALUES (?, ?, ?, ?, ?)",
+            (kind, name, module.orig_name, full_path, _dumps(data)),
+        )
+        return cursor.lastrowid
+
+    def _insert_imports(self, module_id: int, handler: OntologyModel | Ontology):
+        for position, (import_def, _, imported) in enumerate(handler._resolved_imports or []):
+            imported_row = self._connection.execute(
+                "SELECT id FROM modules WHERE full_path = ?", (_store_path(imported.full_path),)
+            ).fetchone()
+            self._connection.execute(
+                "INSERT INTO imports (module_id, position, alias, file, imported_id) VALUES (?, ?, ?, ?, ?)",
+                (module_id, position, import_def.alias, import_def.file, imported_row[0] if imported_row else None),
+            )
+
+    def _save_model(self, module: ModelModule) -> int:
+        model = module.model
+        context = module.context.create_child(module.orig_name)
+        data = {"name": model.name, **model.to_representation(context)}
+        module_id = self._insert_module(MODEL, module, model.name, data)
+        self._connection.executemany(
+            "INSERT INTO types (module_id, section, name, derived_from, data) VALUES (?, ?, ?, ?, ?)",
+            [
+                (
+                    module_id,
+                    section,
+                    type.name,
+                    type.derived_from.alias if type.derived_from is not None else None,
+                    _dumps(type.to_representation(context.create_child(section).create_child(type.name))),
+                )
+                for section in ONTOLOGY_TYPES.sections()
+                for type in getattr(model, section).values()
+            ],
+        )
+        return module_id
+
+    def save_model(self, module: ModelModule) -> int:
+        """Stores a loaded model module with the modules it imports, returns the id of the module."""
+        return self._save_models(module.parser, [module])[module.model._uuid]
+
+    def _save_models(self, parser: Parser, modules: List[ModelModule]) -> Dict[str, int]:
+        handlers = {}
+        for module in modules:
+            for handler in parser.import_closure(module.model):
+                handlers[handler._uuid] = handler
+        result = {}
+        with self._lock, self._connection:
+            for uuid, handler in handlers.items():
+                result[uuid] = self._save_model(parser.get_module_by_model(handler))
+            for uuid, handler in handlers.items():
+                self._insert_imports(result[uuid], handler)
+        return result
+
+    def save_ontology(self, ontology: Ontology, parser: Parser) -> int:
+        """Stores a loaded ontology with the models it imports, replacing the ones stored with the same paths."""
+        module = parser.get_module_by_ontology(ontology)
+        if module is None:
+            raise OntologyException(
+                "Can't store ontology that is not contained in loaded modules",
+                context=parser.root_context.create_child(ontology.name),
+            )
+        imported = [parser.get_module_by_model(m) for _, m, _ in ontology._resolved_imports or []]
+        self._save_models(parser, imported)
+
+        context = module.context.create_child(module.orig_name)
+        data = {"label": ontology.label, "description": ontology.description}
+        with self._lock, self._connection:
+            module_id = self._insert_module(ONTOLOGY, module, ontology.name, data)
+            self._insert_imports(module_id, ontology)
+            self._connection.executemany(
+                "INSERT INTO vertices (module_id, name, type, label, description, metadata) VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (module_id, v.name, v.type.alias, v.label, v.description, _dumps(v.metadata))
+                    for v in ontology.vertices.values()
+                ],
+            )
+            self._connection.executemany(
+                "INSERT INTO relationships (module_id, name, type, source, target, label, description, metadata) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        module_id,
+                        r.name,
+                        r.type.alias,
+                        r.source.alias,
+                        r.target.alias,
+                        r.label,
+                        r.description,
+                        _dumps(r.metadata),
+                    )
+                    for r in ontology.relationships.values()
+                ],
+            )
+            for section in INSTANCE_SECTIONS:
+                section_context = context.create_child(section)
+                self._connection.executemany(
+                    "INSERT INTO property_assignments (module_id, section, owner, position, property, value) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            module_id,
+                            section,
+                            instance.name,
+                            position,
+                            assignment.definition.alias,
+                            _dumps(assignment.to_representation(section_context.create_child(instance.name))),
+                        )
+                        for instance in getattr(ontology, section).values()
+                        for position, assignment in enumerate(instance.properties or [])
+                    ],
+                )
+        return module_id
+
+    def attach(self, parser: Parser) -> Parser:
+        """Makes the parser resolve imports with the stored modules first."""
+        if not any(isinstance(loader, StoreImportLoader) and loader.store is self for loader in parser.import_loaders):
+            parser.import_loaders.insert(0, StoreImportLoader(self, parser))
+        return parser
+
+    def load_model(self, name: str, parser: Optional[Parser] = None) -> OntologyModel:
+        """Loads a stored model with its imports into the parser."""
+        parser = self.attach(parser or Parser())
+        row = self._module_row(MODEL, name=name)
+        if row is None:
+            raise OntologyException(f'Model "{name}" is not stored in {self.path}', context=parser.root_context)
+        with parser._lock:
+            module = parser.get_module_by_path(row["full_path"])
+            if module is not None:
+                return module.model
+            model = parser.load_ontology_model_data(
+                _loads(row["data"]), orig_name=row["orig_name"], full_path=row["full_path"]
+            )
+            parser.finalize_references()
+        return model
+
+    def open_ontology(
+        self, name: str, parser: Optional[Parser] = None, cache_size: int = DEFAULT_CACHE_SIZE
+    ) -> LazyOntology:
+        """Opens a stored ontology, its imported models are loaded into the parser."""
+        parser = self.attach(parser or Parser())
+        row = self._module_row(ONTOLOGY, name=name)
+        if row is None:
+            raise OntologyException(f'Ontology "{name}" is not stored in {self.path}', context=parser.root_context)
+
+        ontology = LazyOntology.create(self, row, parser, cache_size)
+        module = OntologyModule(
+            ontology=ontology,
+            orig_name=row["orig_name"],
+            full_path=Path(row["full_path"]),
+            parser=parser,
+            context=parser.root_context,
+        )
+        with parser._lock:
+            module.resolve_imports(context=parser.root_context, import_loaders=parser.import_loaders)
+            parser._add_module(module)
+            parser.finalize_references()
+        ontology._built = True
+        module._built = True
+        return ontology
@@ -0,0 +1,93 @@
+from collections import deque
+from dataclasses import dataclass
+from dataclasses import field
+from typing import ClassVar
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+from at_ontology_parser.base import Derivable
+from at_ontology_parser.model.types import ONTOLOGY_TYPES
+
+if TYPE_CHECKING:
+    from at_ontology_parser.model import OntologyModel
+    from at_ontology_parser.model.definitions import ImportDefinition
+    from at_ontology_parser.parsing.parser import ModelModule
+
+
+@dataclass(kw_only=True)
+class SymbolTable:
+    """
+    Types declared by a module and the tables of its imports, keyed by the import aliases.
+    A name is looked up in the module itself, ``alias.Name`` in the imported module of the alias
+    and any other name in the import closure, so models with the same type names may be loaded into one parser.
+    """
+
+    # bumped whenever the imports of any table change, the flattened closures built before are dropped
+    generation: ClassVar[int] = 0
+
+    types: Dict[str, Dict[str, Derivable]] = field(
+        default_factory=lambda: {section: {} for section in ONTOLOGY_TYPES.sections()}, repr=False
+    )
+    aliases: Dict[str, "SymbolTable"] = field(default_factory=dict, repr=False)
+    imports: List["SymbolTable"] = field(default_factory=list, repr=False)
+    # the imports are linked after the module is converted, until then only its own types are known
+    linked: bool = field(default=False)
+    # the types of the import closure per section, the nearest import wins; built on the first lookup
+    _closure: Dict[str, Dict[str, Derivable]] = field(default_factory=dict, repr=False)
+    _closure_generation: int = field(default=-1, repr=False)
+
+    @classmethod
+    def invalidate(cls):
+        cls.generation += 1
+
+    def declare(self, section: str, type: Derivable):
+        self.types[section][type.name] = type
+
+    def link(self, resolved_imports: List[Tuple["ImportDefinition", "OntologyModel", "ModelModule"]]):
+        self.aliases = {}
+        self.imports = []
+        for import_def, _, module in resolved_imports:
+            if import_def.alias:
+                self.aliases[import_def.alias] = module.symbols
+            self.imports.append(module.symbols)
+        self.linked = True
+        self.invalidate()
+
+    def _closure_types(self, section: str) -> Dict[str, Derivable]:
+        if self._closure_generation != SymbolTable.generation:
+            self._closure = {}
+            self._closure_generation = SymbolTable.generation
+        found = self._closure.get(section)
+        if found is None:
+            # breadth-first, so the nearest import wins; models may import each other
+            found = {}
+            visited = {id(self)}
+            queue = deque(self.imports)
+            while queue:
+                imported = queue.popleft()
+                if id(imported) in visited:
+                    continue
+                visited.add(id(imported))
+                for name, type in imported.types[section].items():
+                    found.setdefault(name, type)
+                queue.extend(imported.imports)
+            self._closure[section] = found
+        return found
+
+    def lookup(self, section: str, name: str) -> Optional[Derivable]:
+        found = self.types[section].get(name)
+        if found is not None or not self.linked:
+            return found
+
+        # aliases are single segments, so every nested alias costs one more dict lookup
+        alias, _, rest = name.partition(".")
+        if rest and alias in self.aliases:
+            found = self.aliases[alias].lookup(section, rest)
+            if found is not None:
+                return found
+            # type names are prefixed too, the alias may be the same as the prefix of the full name
+
+        return self._closure_types(section).get(name)
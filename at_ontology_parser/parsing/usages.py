@@ -0,0 +1,87 @@
+from collections import deque
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from at_ontology_parser.base import Derivable
+from at_ontology_parser.base import Instance
+from at_ontology_parser.base import OntologyBase
+from at_ontology_parser.reference import BaseReference
+
+
+def referrer(reference: BaseReference) -> Optional[OntologyBase]:
+    """The type or instance declaring the reference, e.g. the vertex type of a property definition type."""
+    owner = reference.owner
+    while owner is not None and not isinstance(owner, (Derivable, Instance)):
+        owner = owner.owner
+    return owner or reference.owner
+
+
+@dataclass(kw_only=True)
+class UsageIndex:
+    """
+    Fulfilled references keyed by the objects they point to, maintained by ``Parser.assign_reference``.
+    The index of a parser attached to a shared layer falls through to the frozen index of the layer.
+    """
+
+    parent: Optional["UsageIndex"] = field(default=None, repr=False)
+    # id of the target -> id of the reference -> reference, the inner dicts keep the order of the assignments
+    _usages: Dict[int, Dict[int, BaseReference]] = field(init=False, repr=False, default_factory=dict)
+
+    def __len__(self) -> int:
+        return sum(len(references) for references in self._usages.values()) + (len(self.parent) if self.parent else 0)
+
+    def add(self, reference: BaseReference):
+        self._usages.setdefault(id(reference.value), {})[id(reference)] = reference
+
+    def remove(self, reference: BaseReference, target: OntologyBase):
+        references = self._usages.get(id(target))
+        if references is not None:
+            references.pop(id(reference), None)
+            if not references:
+                del self._usages[id(target)]
+
+    def discard(self, target: OntologyBase) -> List[BaseReference]:
+        """Forgets the references to the target, returns them."""
+        return list(self._usages.pop(id(target), {}).values())
+
+    def references(self, target: OntologyBase) -> List[BaseReference]:
+        """The fulfilled references pointing to the target."""
+        result = self.parent.references(target) if self.parent else []
+        result += [ref for ref in self._usages.get(id(target), {}).values() if ref.value is target]
+        return result
+
+    def referrers(self, target: OntologyBase) -> List[OntologyBase]:
+        """The types and instances referencing the target, each once."""
+        result = {}
+        for reference in self.references(target):
+            owner = referrer(reference)
+            if owner is not None:
+                result.setdefault(id(owner), owner)
+        return list(result.values())
+
+    def impact(self, target: OntologyBase) -> List[OntologyBase]:
+        """
+        The types and instances depending on the target directly or transitively, in breadth-first order:
+        subtypes, types with properties of a data type, instances of the types and relationships of the vertices.
+        """
+        result: Dict[int, OntologyBase] = {}
+        queue = deque([target])
+        while queue:
+            for owner in self.referrers(queue.popleft()):
+                if owner is not target and id(owner) not in result:
+                    result[id(owner)] = owner
+                    queue.append(owner)
+        return list(result.values())
+
+    def copy(self, predicate: Optional[Callable[[BaseReference], bool]] = None) -> "UsageIndex":
+        """Flat copy of the index and of its parents with the references matching the predicate."""
+        result = self.parent.copy(predicate) if self.parent else UsageIndex()
+        for target_id, references in self._usages.items():
+            selected = {key: ref for key, ref in references.items() if predicate is None or predicate(ref)}
+            if selected:
+                result._usages.setdefault(target_id, {}).update(selected)
+        return result
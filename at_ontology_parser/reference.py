@@ -1,6 +1,6 @@
+import threading
 from dataclasses import dataclass
 from dataclasses import field
-from types import GenericAlias
 from types import UnionType
 from typing import Any
 from typing import Callable
@@ -25,7 +25,13 @@ OWNER = TypeVar("OWNER", bound=OntologyBase)
 
 
 class OntologyRefMeta(type):
+    """
+    ``Reference[Type]`` returns a subclass of the reference class specialised with the types,
+    so the generic types are never shared between specialisations. Subclasses are created once and cached.
+    """
+
     _generic_types = None
+    _specialisations_lock = threading.Lock()
 
     def __getitem__(cls, key: Union[TypeVar, Tuple[TypeVar]]):
         args = key if isinstance(key, tuple) else (key,)
@@ -34,8 +40,25 @@ class OntologyRefMeta(type):
                 """Allowed only to use OntologyReference[Type] like OntologyReference[VertexType]
 or OntologyReference[Union[VertexTemplate, VertexType]]"""
             )
-        cls._generic_types = args
-        return GenericAlias(cls, args)
+        specialisations = cls.__dict__.get("_specialisations")
+        specialised = specialisations.get(args) if specialisations is not None else None
+        if specialised is None:
+            with OntologyRefMeta._specialisations_lock:
+                if "_specialisations" not in cls.__dict__:
+                    cls._specialisations = {}
+                specialised = cls._specialisations.get(args)
+                if specialised is None:
+                    specialised = OntologyRefMeta(
+                        cls.__name__,
+                        (cls,),
+                        {
+                            "__module__": cls.__module__,
+                            "__qualname__": cls.__qualname__,
+                            "_generic_types": args,
+                        },
+                    )
+                    cls._specialisations[args] = specialised
+        return specialised
 
 
 def with_metaclass(meta):
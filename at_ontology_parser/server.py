@@ -0,0 +1,352 @@
+"""
+Local query server keeping the loaded models and ontologies in memory::
+
+    at-ontology serve ontologies/ --model models/base.mdl.yml --port 8765
+
+    GET /status
+    GET /types/<type name>
+    GET /types/<type name>/subtypes?transitive=1
+    GET /vertices/<vertex name>
+    GET /vertices/<vertex name>/neighbours?direction=out|in|both&type=<relationship type name>
+    GET /validate?path=<ontology file or archive>
+
+The watched files are polled for changes, a changed ontology is reloaded on top of the already loaded models,
+a changed model reloads everything. A failed reload keeps the previous state and is reported by ``/status``.
+"""
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from dataclasses import field
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from urllib.parse import parse_qs
+from urllib.parse import unquote
+from urllib.parse import urlsplit
+
+from at_ontology_parser.base import Derivable
+from at_ontology_parser.cli import error_representation
+from at_ontology_parser.model.types import ONTOLOGY_TYPES
+from at_ontology_parser.ontology.instances.relationship import Relationship
+from at_ontology_parser.ontology.instances.vertex import Vertex
+from at_ontology_parser.parsing.parser import Parser
+
+DIRECTIONS = ("out", "in", "both")
+
+# (modification time, size) of a watched file, None when it is removed
+FileState = Optional[Tuple[int, int]]
+
+
+def file_state(path: Path) -> FileState:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def module_files(parser: Parser, own_only: bool = False) -> Dict[Path, FileState]:
+    modules = [*parser.modules.values(), *parser.ontology_modules.values()]
+    if own_only and parser.shared_layer is not None:
+        modules = [m for m in modules if not parser.shared_layer.contains(m)]
+    return {m.full_path: file_state(m.full_path) for m in modules}
+
+
+@dataclass(kw_only=True)
+class Snapshot:
+    """
+    Loaded state answering the queries. A reload builds a new snapshot and swaps it as a whole,
+    so the requests in flight keep reading the previous one.
+    """
+
+    models: Parser
+    # fork of the models with the ontologies and the models only they import
+    ontologies: Parser
+    model_files: Dict[Path, FileState] = field(repr=False)
+    ontology_files: Dict[Path, FileState] = field(repr=False)
+    subtypes: Dict[str, List[Derivable]] = field(repr=False)
+    outgoing: Dict[str, List[Relationship]] = field(repr=False)
+    incoming: Dict[str, List[Relationship]] = field(repr=False)
+    loaded_at: float
+
+    @classmethod
+    def build(cls, models: Parser, ontology_paths: List[Path]) -> "Snapshot":
+        ontologies = models.fork()
+        for path in ontology_paths:
+            ontologies.load_ontology(path)
+
+        subtypes: Dict[str, List[Derivable]] = {}
+        for section in ONTOLOGY_TYPES.sections():
+            for type in ontologies._registered_types[section].values():
+                if type.derived_from is not None and type.derived_from.fulfilled:
+                    subtypes.setdefault(type.derived_from.value.name, []).append(type)
+
+        outgoing: Dict[str, List[Relationship]] = {}
+        incoming: Dict[str, List[Relationship]] = {}
+        for relationship in ontologies._registered_instances["relationships"].values():
+            outgoing.setdefault(relationship.source.alias, []).append(relationship)
+            incoming.setdefault(relationship.target.alias, []).append(relationship)
+
+        return cls(
+            models=models,
+            ontologies=ontologies,
+            model_files=module_files(models),
+            ontology_files={
+                **{path: file_state(path) for path in ontology_paths},
+                **module_files(ontologies, own_only=True),
+            },
+            subtypes=subtypes,
+            outgoing=outgoing,
+            incoming=incoming,
+            loaded_at=time.time(),
+        )
+
+
+@dataclass(kw_only=True)
+class OntologyService:
+    """Queries over the models and ontologies loaded once, see the module docstring for the HTTP interface."""
+
+    model_paths: List[Path] = field(default_factory=list)
+    ontology_paths: List[Path] = field(default_factory=list)
+
+    snapshot: Snapshot = field(init=False, repr=False)
+    reloads: int = field(init=False, default=0)
+    last_error: Optional[Dict[str, Any]] = field(init=False, default=None, repr=False)
+    _reload_lock: threading.Lock = field(init=False, repr=False, compare=False, default_factory=threading.Lock)
+
+    def __post_init__(self):
+        self.model_paths = [Path(p) for p in self.model_paths]
+        self.ontology_paths = [Path(p) for p in self.ontology_paths]
+        self.snapshot = Snapshot.build(self.load_models(), self.ontology_paths)
+
+    def load_models(self) -> Parser:
+        parser = Parser()
+        for path in self.model_paths:
+            parser.load_model(path)
+        return parser
+
+    @staticmethod
+    def changed(files: Dict[Path, FileState]) -> bool:
+        return any(file_state(path) != state for path, state in files.items())
+
+    def reload_if_changed(self) -> bool:
+        """Rebuilds the snapshot if a loaded file changed, returns whether it was replaced."""
+        with self._reload_lock:
+            snapshot = self.snapshot
+            models_changed = self.changed(snapshot.model_files)
+            if not models_changed and not self.changed(snapshot.ontology_files):
+                return False
+            try:
+                models = self.load_models() if models_changed else snapshot.models
+                self.snapshot = Snapshot.build(models, self.ontology_paths)
+            except Exception as e:
+                self.last_error = error_representation(e)
+                # the failed files are retried only after they change again
+                snapshot.model_files = module_files(snapshot.models)
+                snapshot.ontology_files = {path: file_state(path) for path in snapshot.ontology_files}
+                return False
+            self.reloads += 1
+            self.last_error = None
+            return True
+
+    def get_type(self, name: str) -> Optional[Derivable]:
+        registered_types = self.snapshot.ontologies._registered_types
+        for section in ONTOLOGY_TYPES.sections():
+            if name in registered_types[section]:
+                return registered_types[section][name]
+        return None
+
+    def subtypes(self, name: str, transitive: bool = False) -> List[Derivable]:
+        snapshot = self.snapshot
+        result = []
+        stack = list(reversed(snapshot.subtypes.get(name, [])))
+        while stack:
+            type = stack.pop()
+            result.append(type)
+            if transitive:
+                stack.extend(reversed(snapshot.subtypes.get(type.name, [])))
+        return result
+
+    def get_vertex(self, name: str) -> Optional[Vertex]:
+        return self.snapshot.ontologies._registered_instances["vertices"].get(name)
+
+    def neighbours(
+        self, name: str, direction: str = "out", relationship_type: Optional[str] = None
+    ) -> List[Tuple[str, Relationship]]:
+        """``(direction, relationship)`` pairs of the relationships of the vertex."""
+        if direction not in DIRECTIONS:
+            raise ValueError(f'Unknown direction "{direction}", expected one of {", ".join(DIRECTIONS)}')
+        snapshot = self.snapshot
+        result = []
+        if direction in ("out", "both"):
+            result += [("out", r) for r in snapshot.outgoing.get(name, [])]
+        if direction in ("in", "both"):
+            result += [("in", r) for r in snapshot.incoming.get(name, [])]
+        if relationship_type is not None:
+            result = [(d, r) for d, r in result if r.type.alias == relationship_type]
+        return result
+
+    def validate(self, path: str | Path) -> Dict[str, Any]:
+        """Loads an ontology on top of the loaded models without keeping it."""
+        started = time.perf_counter()
+        result: Dict[str, Any] = {"path": str(path)}
+        try:
+            ontology = self.snapshot.models.fork().load_ontology(path)
+            result.update(ok=True, name=ontology.name, vertices=len(ontology.vertices or {}))
+        except Exception as e:
+            result.update(ok=False, error=error_representation(e))
+        result["time"] = time.perf_counter() - started
+        return result
+
+    def status(self) -> Dict[str, Any]:
+        snapshot = self.snapshot
+        return {
+            "models": sorted(str(p) for p in snapshot.model_files),
+            "ontologies": sorted(str(p) for p in snapshot.ontology_files),
+            "vertices": len(snapshot.ontologies._registered_instances["vertices"]),
+            "relationships": len(snapshot.ontologies._registered_instances["relationships"]),
+            "loaded_at": snapshot.loaded_at,
+            "reloads": self.reloads,
+            "last_error": self.last_error,
+        }
+
+
+def represent_type(type: Derivable) -> Dict[str, Any]:
+    return {
+        "name": type.name,
+        "section": ONTOLOGY_TYPES.class_to_section_mapping().get(type.__class__),
+        "label": type.label,
+        "description": type.description,
+        "model": type.owner.name if type.owner is not None else None,
+        "derivation": type.derivation_path,
+    }
+
+
+def represent_vertex(vertex: Vertex) -> Dict[str, Any]:
+    return {
+        "name": vertex.name,
+        "label": vertex.label,
+        "description": vertex.description,
+        "type": vertex.type.alias,
+        "ontology": vertex.owner.name if vertex.owner is not None else None,
+        "properties": vertex.props.as_dict(),
+    }
+
+
+def represent_neighbour(direction: str, relationship: Relationship) -> Dict[str, Any]:
+    return {
+        "direction": direction,
+        "relationship": relationship.name,
+        "type": relationship.type.alias,
+        "vertex": (relationship.target if direction == "out" else relationship.source).alias,
+    }
+
+
+class QueryError(Exception):
+    def __init__(self, status: HTTPStatus, msg: str):
+        super().__init__(msg)
+        self.status = status
+
+
+class QueryHandler(BaseHTTPRequestHandler):
+    server: "QueryServer"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        parts = [unquote(part) for part in url.path.split("/") if part]
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        try:
+            body = self.route(parts, query)
+            status = HTTPStatus.OK
+        except QueryError as e:
+            body, status = {"msg": str(e)}, e.status
+        except ValueError as e:
+            body, status = {"msg": str(e)}, HTTPStatus.BAD_REQUEST
+
+        data = json.dumps(body, ensure_ascii=False, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def route(self, parts: List[str], query: Dict[str, str]) -> Any:
+        service = self.server.service
+        match parts:
+            case ["status"]:
+                return service.status()
+            case ["types", name]:
+                return represent_type(self.found(service.get_type(name), "Type", name))
+            case ["types", name, "subtypes"]:
+                self.found(service.get_type(name), "Type", name)
+                transitive = query.get("transitive", "0").lower() in ("1", "true", "yes")
+                return [represent_type(t) for t in service.subtypes(name, transitive=transitive)]
+            case ["vertices", name]:
+                return represent_vertex(self.found(service.get_vertex(name), "Vertex", name))
+            case ["vertices", name, "neighbours"]:
+                self.found(service.get_vertex(name), "Vertex", name)
+                neighbours = service.neighbours(name, query.get("direction", "out"), query.get("type"))
+                return [represent_neighbour(direction, r) for direction, r in neighbours]
+            case ["validate"]:
+                if "path" not in query:
+                    raise ValueError('The "path" parameter is required')
+                return service.validate(query["path"])
+        raise QueryError(HTTPStatus.NOT_FOUND, f"Unknown query {self.path}")
+
+    @staticmethod
+    def found(value: Any, kind: str, name: str) -> Any:
+        if value is None:
+            raise QueryError(HTTPStatus.NOT_FOUND, f'{kind} "{name}" is not found')
+        return value
+
+    def log_message(self, format: str, *args: Any):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class QueryServer(ThreadingHTTPServer):
+    """
+    HTTP server of an :class:`OntologyService`, bound to localhost by default.
+    While serving, a watcher thread checks the loaded files every ``reload_interval`` seconds (0 disables it).
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        service: OntologyService,
+        address: Tuple[str, int] = ("127.0.0.1", 8765),
+        reload_interval: float = 1.0,
+        verbose: bool = False,
+    ):
+        super().__init__(address, QueryHandler)
+        self.service = service
+        self.reload_interval = reload_interval
+        self.verbose = verbose
+        self._stopped = threading.Event()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def serve_forever(self, poll_interval: float = 0.5):
+        self._stopped.clear()
+        if self.reload_interval:
+            threading.Thread(target=self._watch, name="at-ontology-reload", daemon=True).start()
+        try:
+            super().serve_forever(poll_interval)
+        finally:
+            self._stopped.set()
+
+    def _watch(self):
+        while not self._stopped.wait(self.reload_interval):
+            self.service.reload_if_changed()
@@ -0,0 +1,123 @@
+"""
+Benchmarks of the parser on synthetic ontologies.
+
+    python tests/benchmarks/run_benchmarks.py --scales small medium --repeat 3 --output bench.json
+    python tests/benchmarks/run_benchmarks.py --scales small --compare bench.json
+
+Results are written as JSON: one record per (scale, operation) with the min/median/max wall time in seconds.
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+
+import yaml
+from synthetic import generate
+from synthetic import root_model_path
+from synthetic import SCALES
+from synthetic import SyntheticSpec
+
+from at_ontology_parser.parsing.parser import Parser
+
+
+def _time(operation: Callable[[], Any], setup: Callable[[], Any] = None, repeat: int = 3) -> Dict[str, float]:
+    timings: List[float] = []
+    for _ in range(repeat):
+        args = setup() if setup else None
+        started = time.perf_counter()
+        operation(args) if setup else operation()
+        timings.append(time.perf_counter() - started)
+    return {"min": min(timings), "median": statistics.median(timings), "max": max(timings), "repeat": repeat}
+
+
+def run_scale(scale: str, spec: SyntheticSpec, repeat: int) -> List[Dict[str, Any]]:
+    with tempfile.TemporaryDirectory() as directory:
+        ontology_path = generate(spec, directory)
+        model_path = root_model_path(spec, directory)
+        with open(ontology_path, "r", encoding="utf-8") as stream:
+            ontology_data = yaml.safe_load(stream)
+
+        def loaded_ontology_data(_=None):
+            parser = Parser()
+            parser.load_ontology_data(ontology_data, str(ontology_path), ontology_path)
+            return parser
+
+        def loaded_ontology(_=None):
+            parser = Parser()
+            return parser, parser.load_ontology_yaml_file(ontology_path)
+
+        def built_archive(_=None):
+            parser, ontology = loaded_ontology()
+            return parser.build_archive(ontology, export_dir=Path(directory) / "export")
+
+        results = {
+            "load_model_yaml_file": _time(lambda: Parser().load_model_yaml_file(model_path), repeat=repeat),
+            "load_ontology_yaml_file": _time(lambda: Parser().load_ontology_yaml_file(ontology_path), repeat=repeat),
+            "finalize_references": _time(lambda parser: parser.finalize_references(), loaded_ontology_data, repeat),
+            "to_representation": _time(
+                lambda loaded: loaded[1].to_representation(loaded[0].root_context), loaded_ontology, repeat
+            ),
+            "build_archive": _time(
+                lambda loaded: loaded[0].build_archive(loaded[1], export_dir=Path(directory) / "export"),
+                loaded_ontology,
+                repeat,
+            ),
+            "archive_reload": _time(lambda archive: Parser().load_ontology(archive), built_archive, repeat),
+        }
+    return [{"scale": scale, "operation": operation, **timing} for operation, timing in results.items()]
+
+
+def compare(current: List[Dict[str, Any]], baseline: List[Dict[str, Any]]) -> List[str]:
+    baseline_index = {(r["scale"], r["operation"]): r for r in baseline}
+    lines = []
+    for record in current:
+        base = baseline_index.get((record["scale"], record["operation"]))
+        if base:
+            ratio = record["median"] / base["median"] if base["median"] else float("inf")
+            lines.append(
+                f"{record['scale']:>8} {record['operation']:<24} "
+                f"{base['median']:.4f}s -> {record['median']:.4f}s ({ratio:.2f}x)"
+            )
+    return lines
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", nargs="+", default=["small", "medium"], choices=list(SCALES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="write results as JSON to the file instead of stdout")
+    parser.add_argument("--compare", type=Path, help="JSON results of a previous run to compare with")
+    args = parser.parse_args(argv)
+
+    records = []
+    for scale in args.scales:
+        spec = SyntheticSpec(**{**SCALES[scale].as_dict(), "seed": args.seed})
+        records += [{**record, "spec": spec.as_dict()} for record in run_scale(scale, spec, args.repeat)]
+
+    document = {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": records,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(document, indent=2), encoding="utf-8")
+    else:
+        print(json.dumps(document, indent=2))
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))["results"]
+        print("\n".join(compare(records, baseline)), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,213 @@
+"""
+Seeded generator of synthetic models and ontologies.
+
+The generated tree looks like::
+
+    <directory>/
+        synthetic.ont.yml
+        models/
+            base/model.mdl.yml
+            model-0/model.mdl.yml
+            model-0/artifacts/...
+            ...
+
+Every ``model-i`` imports the base model and up to ``import_fan_out`` previous models.
+The ontology imports the last model, so loading it pulls the whole model set.
+"""
+import random
+import string
+from dataclasses import asdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+
+import yaml
+
+BASE_DATA_TYPES = {
+    "Synthetic.data_types.Root": {"label": "Root data type"},
+    "Synthetic.data_types.String": {"derived_from": "Synthetic.data_types.Root", "object_schema": {"type": "string"}},
+    "Synthetic.data_types.Integer": {
+        "derived_from": "Synthetic.data_types.Root",
+        "object_schema": {"type": "integer"},
+    },
+}
+BASE_VERTEX_TYPE = "Synthetic.vertex_types.Root"
+BASE_RELATIONSHIP_TYPE = "Synthetic.relationship_types.Root"
+
+
+@dataclass(kw_only=True)
+class SyntheticSpec:
+    seed: int = 0
+    models: int = 3
+    import_fan_out: int = 1
+    vertex_types_per_model: int = 10
+    relationship_types_per_model: int = 3
+    derivation_depth: int = 3
+    properties_per_type: int = 3
+    vertices: int = 100
+    relationships: int = 200
+    properties_per_vertex: int = 2
+    artifacts_per_model: int = 0
+    artifact_size: int = 1024
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+SCALES = {
+    "small": SyntheticSpec(models=2, vertices=100, relationships=200),
+    "medium": SyntheticSpec(
+        models=5, import_fan_out=2, vertex_types_per_model=20, vertices=2000, relationships=5000, artifacts_per_model=2
+    ),
+    "large": SyntheticSpec(
+        models=10,
+        import_fan_out=3,
+        vertex_types_per_model=40,
+        derivation_depth=5,
+        vertices=20000,
+        relationships=50000,
+        artifacts_per_model=5,
+        artifact_size=64 * 1024,
+    ),
+}
+
+
+def _write_yaml(path: Path, data: Dict[str, Any]):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as stream:
+        yaml.safe_dump(data, stream, allow_unicode=True, sort_keys=False)
+
+
+def _properties(count: int, prefix: str) -> Dict[str, Any]:
+    return {
+        f"{prefix}{i}": {
+            "type": "Synthetic.data_types.Integer" if i % 2 else "Synthetic.data_types.String",
+            "allows_multiple": i % 3 == 2,
+        }
+        for i in range(count)
+    }
+
+
+def _model(spec: SyntheticSpec, index: int, rnd: random.Random) -> tuple[Dict[str, Any], List[str], List[str]]:
+    prefix = f"Synthetic{index}"
+    vertex_types: Dict[str, Any] = {}
+    leaf_types: List[str] = []
+    for i in range(spec.vertex_types_per_model):
+        # chains of derived types: every derivation_depth-th type starts a new chain
+        depth = i % spec.derivation_depth
+        parent = BASE_VERTEX_TYPE if depth == 0 else f"{prefix}.vertex_types.T{i - 1}"
+        name = f"{prefix}.vertex_types.T{i}"
+        vertex_types[name] = {
+            "derived_from": parent,
+            "label": f"Vertex type {i}",
+            "properties": _properties(spec.properties_per_type, "p"),
+        }
+        leaf_types.append(name)
+
+    relationship_types = {
+        f"{prefix}.relationship_types.R{i}": {
+            "derived_from": BASE_RELATIONSHIP_TYPE,
+            "valid_source_types": rnd.sample(leaf_types, min(2, len(leaf_types))),
+            "valid_target_types": rnd.sample(leaf_types, min(2, len(leaf_types))),
+            "properties": _properties(1, "w"),
+        }
+        for i in range(spec.relationship_types_per_model)
+    }
+
+    # several imports of one module must have distinct aliases
+    imports = [{"base": "../base/model.mdl.yml"}]
+    previous = list(range(index))
+    for j in rnd.sample(previous, min(spec.import_fan_out, len(previous))):
+        imports.append({f"model_{j}": f"../model-{j}/model.mdl.yml"})
+
+    data = {
+        "name": f"synthetic-model-{index}",
+        "imports": imports,
+        "vertex_types": vertex_types,
+        "relationship_types": relationship_types,
+    }
+    return data, leaf_types, list(relationship_types)
+
+
+def _value(rnd: random.Random, prop: str) -> Any:
+    if int(prop[1:]) % 2:
+        return rnd.randint(0, 10**6)
+    return "".join(rnd.choices(string.ascii_letters, k=12))
+
+
+def root_model_path(spec: SyntheticSpec, directory: str | Path) -> Path:
+    directory = Path(directory)
+    if spec.models:
+        return directory / f"models/model-{spec.models - 1}/model.mdl.yml"
+    return directory / "models/base/model.mdl.yml"
+
+
+def generate(spec: SyntheticSpec, directory: str | Path) -> Path:
+    """Writes the synthetic model set and ontology into ``directory`` and returns the ontology path."""
+    rnd = random.Random(spec.seed)
+    directory = Path(directory)
+    models_dir = directory / "models"
+
+    _write_yaml(
+        models_dir / "base/model.mdl.yml",
+        {
+            "name": "synthetic-base",
+            "data_types": BASE_DATA_TYPES,
+            "vertex_types": {BASE_VERTEX_TYPE: {"label": "Root vertex type"}},
+            "relationship_types": {BASE_RELATIONSHIP_TYPE: {"label": "Root relationship type"}},
+        },
+    )
+
+    vertex_types: List[str] = []
+    relationship_types: List[str] = []
+    for index in range(spec.models):
+        data, model_vertex_types, model_relationship_types = _model(spec, index, rnd)
+        _write_yaml(models_dir / f"model-{index}/model.mdl.yml", data)
+        vertex_types += model_vertex_types
+        relationship_types += model_relationship_types
+
+        for a in range(spec.artifacts_per_model):
+            artifact = models_dir / f"model-{index}/artifacts/artifact-{a}.bin"
+            artifact.parent.mkdir(parents=True, exist_ok=True)
+            artifact.write_bytes(rnd.randbytes(spec.artifact_size))
+
+    # the ontology reaches the whole model set through the last model (and the base model)
+    root_model = root_model_path(spec, directory).relative_to(directory).as_posix()
+
+    property_count = min(spec.properties_per_vertex, spec.properties_per_type)
+    vertex_names = [f"V{i}" for i in range(spec.vertices)]
+    reachable_vertex_types = [t for t in vertex_types if t.startswith(f"Synthetic{spec.models - 1}.")] or [
+        BASE_VERTEX_TYPE
+    ]
+    vertices = {}
+    for name in vertex_names:
+        properties = {}
+        for p in range(property_count):
+            prop = f"p{p}"
+            properties[prop] = [_value(rnd, prop), _value(rnd, prop)] if p % 3 == 2 else _value(rnd, prop)
+        vertices[name] = {"type": rnd.choice(reachable_vertex_types), "properties": properties}
+
+    reachable_relationship_types = [t for t in relationship_types if t.startswith(f"Synthetic{spec.models - 1}.")] or [
+        BASE_RELATIONSHIP_TYPE
+    ]
+    relationships = {}
+    for i in range(spec.relationships if vertex_names else 0):
+        relationships[f"R{i}"] = {
+            "type": rnd.choice(reachable_relationship_types),
+            "source": rnd.choice(vertex_names),
+            "target": rnd.choice(vertex_names),
+        }
+
+    ontology_path = directory / "synthetic.ont.yml"
+    _write_yaml(
+        ontology_path,
+        {
+            "name": "synthetic-ontology",
+            "imports": [root_model],
+            "vertices": vertices,
+            "relationships": relationships,
+        },
+    )
+    return ontology_path
@@ -0,0 +1,36 @@
+from run_benchmarks import run_scale
+from synthetic import generate
+from synthetic import SyntheticSpec
+
+from at_ontology_parser.parsing.parser import Parser
+
+TINY = SyntheticSpec(models=2, vertex_types_per_model=4, vertices=20, relationships=30, artifacts_per_model=1)
+
+
+def test_generator_is_seeded(tmp_path):
+    first = generate(TINY, tmp_path / "first").read_text(encoding="utf-8")
+    second = generate(TINY, tmp_path / "second").read_text(encoding="utf-8")
+    other = generate(SyntheticSpec(**{**TINY.as_dict(), "seed": 1}), tmp_path / "other").read_text(encoding="utf-8")
+    assert first == second
+    assert first != other
+
+
+def test_generated_ontology_loads(tmp_path):
+    ontology = Parser().load_ontology(generate(TINY, tmp_path))
+    assert len(ontology.vertices) == 20 and len(ontology.relationships) == 30
+    vertex = ontology.vertices["V0"]
+    assert vertex.type.value.derivation_path[0] == "Synthetic.vertex_types.Root"
+    assert all(p.definition.fulfilled for p in vertex.properties)
+
+
+def test_benchmark_records():
+    records = run_scale("tiny", TINY, repeat=1)
+    assert [r["operation"] for r in records] == [
+        "load_model_yaml_file",
+        "load_ontology_yaml_file",
+        "finalize_references",
+        "to_representation",
+        "build_archive",
+        "archive_reload",
+    ]
+    assert all(r["min"] <= r["median"] <= r["max"] for r in records)
@@ -0,0 +1,75 @@
+from pathlib import Path
+
+import pytest
+
+from at_ontology_parser.parsing.parser import Parser
+
+fixtures_dir = Path(__file__).parent / "fixtures"
+
+HIERARCHY = "CourceDiscipline.relationship_types.Hierarchy"
+AGREGATION = "CourceDiscipline.relationship_types.Agregation"
+
+
+def load_graph_ontology(parser: Parser, edges: dict, name: str = "graph-ontology", vertices: dict = None):
+    """
+    Loads an ontology importing the course-discipline model from relationships given as
+    ``{relationship_name: (relationship_type, source, target)}``.
+    """
+    vertex_names = {v for _, source, target in edges.values() for v in (source, target)}
+    vertices = vertices or {}
+    for vertex_name in vertex_names:
+        vertices.setdefault(vertex_name, {"type": "CourceDiscipline.vertex_types.CourseElement"})
+    ontology = parser.load_ontology_data(
+        {
+            "name": name,
+            "imports": ["course-discipline-types.mdl.yml"],
+            "vertices": dict(sorted(vertices.items())),
+            "relationships": {
+                rel_name: {"type": rel_type, "source": source, "target": target}
+                for rel_name, (rel_type, source, target) in edges.items()
+            },
+        },
+        orig_name=f"{name}.ont.yml",
+        full_path=fixtures_dir / f"yaml/{name}.ont.yml",
+    )
+    parser.finalize_references()
+    return ontology
+
+
+@pytest.fixture
+def graph_ontology():
+    return load_graph_ontology(
+        Parser(),
+        {
+            "AB": (HIERARCHY, "A", "B"),
+            "AC": (HIERARCHY, "A", "C"),
+            "CD": (HIERARCHY, "C", "D"),
+            "DA": (AGREGATION, "D", "A"),
+        },
+        vertices={
+            "K": {
+                "type": "CourceDiscipline.vertex_types.Competence",
+                "properties": {"code": "UK-1", "description": "Компетенция"},
+            }
+        },
+    )
+
+
+def load_semantics_ontology(parser: Parser, edges: dict, name: str = "semantics-ontology"):
+    """Loads an ontology of the semantics model from ``{relationship_name: (type_suffix, source, target)}``."""
+    vertex_names = sorted({v for _, source, target in edges.values() for v in (source, target)})
+    ontology = parser.load_ontology_data(
+        {
+            "name": name,
+            "imports": ["semantics-types.mdl.yml"],
+            "vertices": {v: {"type": "Semantics.vertex_types.Node"} for v in vertex_names},
+            "relationships": {
+                rel_name: {"type": f"Semantics.relationship_types.{rel_type}", "source": source, "target": target}
+                for rel_name, (rel_type, source, target) in edges.items()
+            },
+        },
+        orig_name=f"{name}.ont.yml",
+        full_path=fixtures_dir / f"yaml/{name}.ont.yml",
+    )
+    parser.finalize_references()
+    return ontology
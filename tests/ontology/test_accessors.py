@@ -0,0 +1,91 @@
+import pytest
+
+from at_ontology_parser.accessors import accessor_class
+from at_ontology_parser.accessors import PropertyAccessor
+from at_ontology_parser.parsing.parser import Parser
+
+MODEL = """
+name: accessors
+data_types:
+  Accessors.data_types.String:
+    object_schema:
+      type: string
+vertex_types:
+  Accessors.vertex_types.Base:
+    properties:
+      code:
+        type: Accessors.data_types.String
+        allows_multiple: false
+        default: none
+      class:
+        type: Accessors.data_types.String
+        allows_multiple: false
+  Accessors.vertex_types.Leaf:
+    derived_from: Accessors.vertex_types.Base
+    properties:
+      tags:
+        type: Accessors.data_types.String
+"""
+
+ONTOLOGY = """
+name: accessors-ontology
+imports:
+  - accessors.mdl.yml
+vertices:
+  V1:
+    type: Accessors.vertex_types.Leaf
+    properties:
+      tags: [a, b]
+      class: first
+  V2:
+    type: Accessors.vertex_types.Leaf
+    properties:
+      code: C2
+"""
+
+
+@pytest.fixture
+def ontology(tmp_path):
+    (tmp_path / "accessors.mdl.yml").write_text(MODEL, encoding="utf-8")
+    (tmp_path / "accessors.ont.yml").write_text(ONTOLOGY, encoding="utf-8")
+    return Parser().load_ontology_yaml_file(tmp_path / "accessors.ont.yml")
+
+
+def test_props_of_derived_types(ontology):
+    v1, v2 = ontology.vertices["V1"], ontology.vertices["V2"]
+
+    # inherited properties are assigned and read through the derived type
+    assert v1.props.tags == ["a", "b"]
+    assert v1.props.code == "none"
+    assert v1.props["class"] == "first"
+    assert v2.props.tags == []
+    assert v2.props.code == "C2"
+    assert v2.props["class"] is None
+    assert v1.props.as_dict() == {"code": "none", "class": "first", "tags": ["a", "b"]}
+
+    assert type(v1.props) is type(v2.props)
+    assert type(v1.props) is accessor_class(v1.type.value)
+    assert isinstance(v1.props, PropertyAccessor)
+    assert not hasattr(v1.props, "__dict__")
+    assert v1.props is v1.props
+
+    with pytest.raises(AttributeError):
+        v1.props.code = "changed"
+    with pytest.raises(KeyError):
+        v1.props["unknown"]
+
+
+def test_props_are_rebuilt_on_changed_assignments(ontology):
+    v1 = ontology.vertices["V1"]
+    props = v1.props
+    v1.properties = [p for p in v1.properties if p.definition.alias != "tags"]
+    assert v1.props is not props
+    assert v1.props.tags == []
+
+    # a value changed in place, with the same number of assignments
+    props = v1.props
+    assignment = next(p for p in v1.properties if p.definition.alias == "class")
+    assignment.value = "second"
+    assert v1.props is not props
+    assert v1.props["class"] == "second"
+    assert v1.props is v1.props
@@ -0,0 +1,69 @@
+import pytest
+from conftest import AGREGATION
+from conftest import HIERARCHY
+from conftest import load_graph_ontology
+from conftest import load_semantics_ontology
+
+from at_ontology_parser.exceptions import LoadException
+from at_ontology_parser.parsing.parser import Parser
+
+
+def test_consistent_ontology(graph_ontology):
+    assert graph_ontology.check_consistency() == []
+
+
+def test_hierarchy_violations():
+    ontology = load_graph_ontology(
+        Parser(),
+        {
+            "AA": (HIERARCHY, "A", "A"),
+            "AB": (HIERARCHY, "A", "B"),
+            "BA": (HIERARCHY, "B", "A"),
+            "BC": (HIERARCHY, "B", "C"),
+            "CD": (HIERARCHY, "C", "D"),
+            "DB": (HIERARCHY, "D", "B"),
+            "DA": (AGREGATION, "D", "A"),
+        },
+    )
+    violations = ontology.check_consistency()
+    by_message = {(v.args[0].split(" for ")[0], tuple(v.relationships)) for v in violations}
+
+    assert by_message == {
+        ("Reflexive relationship is not allowed", ("AA",)),
+        ("Symmetric relationships are not allowed", ("AB", "BA")),
+        ("Cycle is not allowed", ("AB", "BA", "BC", "CD", "DB")),
+    }
+    reflexive = next(v for v in violations if v.relationships == ["AA"])
+    assert reflexive.represent()["context"] == ["relationships", "AA"]
+
+    with pytest.raises(LoadException) as e:
+        ontology.check_consistency(raise_errors=True)
+    assert len(e.value.errors) == 3
+
+    assert len(ontology.check_consistency(acyclic_types=[AGREGATION])) == 3
+
+
+def test_anti_transitivity_violations():
+    ontology = load_semantics_ontology(
+        Parser(),
+        {
+            "ab": ("Parent", "a", "b"),
+            "bc": ("Parent", "b", "c"),
+            "ac": ("Parent", "a", "c"),
+            "xy": ("Before", "x", "y"),
+            "yx": ("Before", "y", "x"),
+        },
+    )
+    violations = ontology.check_consistency()
+    # the opposite pair is a cycle too, it is reported once
+    assert sorted(v.relationships for v in violations) == [["ab", "bc", "ac"], ["xy", "yx"]]
+
+
+def test_anti_transitivity_on_hub_vertex():
+    relationships = {f"in{i}": ("Parent", f"s{i}", "hub") for i in range(300)}
+    relationships.update({f"out{i}": ("Parent", "hub", f"t{i}") for i in range(300)})
+    relationships["shortcut"] = ("Parent", "s7", "t42")
+    ontology = load_semantics_ontology(Parser(), relationships)
+
+    violations = ontology.check_consistency()
+    assert [v.relationships for v in violations] == [["in7", "out42", "shortcut"]]
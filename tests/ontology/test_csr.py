@@ -0,0 +1,23 @@
+import pytest
+from conftest import AGREGATION
+from conftest import HIERARCHY
+
+numpy = pytest.importorskip("numpy")
+
+
+def test_to_csr(graph_ontology):
+    csr = graph_ontology.to_csr()
+
+    assert csr.vertex_names == ["A", "B", "C", "D", "K"]
+    assert set(csr.relationship_types) == {HIERARCHY, AGREGATION}
+    assert csr.offsets[HIERARCHY].tolist() == [0, 2, 2, 3, 3, 3]
+    assert [csr.vertex_names[i] for i in csr.neighbours(HIERARCHY, csr.vertex_ids["A"])] == ["B", "C"]
+    assert csr.out_degree(HIERARCHY).tolist() == [2, 0, 1, 0, 0]
+    assert csr.in_degree(HIERARCHY).tolist() == [0, 1, 1, 1, 0]
+    assert csr.vertex(csr.vertex_ids["C"]) is graph_ontology.vertices["C"]
+    assert [csr.relationship_names[i] for i in csr.edge_relationships[HIERARCHY]] == ["AB", "AC", "CD"]
+    assert csr.vertex_type_names == [
+        "CourceDiscipline.vertex_types.CourseElement",
+        "CourceDiscipline.vertex_types.Competence",
+    ]
+    assert csr.vertex_types.tolist() == [0, 0, 0, 0, 1]
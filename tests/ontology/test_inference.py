@@ -0,0 +1,55 @@
+from conftest import HIERARCHY
+from conftest import load_semantics_ontology
+
+from at_ontology_parser.ontology.inference import relationship_semantics
+from at_ontology_parser.parsing.parser import Parser
+
+
+def test_semantics_from_property_defaults(graph_ontology):
+    semantics = relationship_semantics(graph_ontology.relationships["AB"].type.value)
+    assert (semantics.reflexivity, semantics.symmetry, semantics.transitivity) == (
+        "anti-reflexive",
+        "anti-symmetric",
+        "non-transitive",
+    )
+    assert semantics.anti_symmetric and not semantics.transitive
+
+
+def test_non_transitive_relation_is_not_extended(graph_ontology):
+    inferred = graph_ontology.infer_relations()
+    assert inferred.holds(HIERARCHY, "A", "C")
+    assert not inferred.holds(HIERARCHY, "A", "D")
+    assert list(inferred.inferred_pairs(HIERARCHY)) == []
+
+
+def test_transitive_symmetric_and_reflexive_closures():
+    ontology = load_semantics_ontology(
+        Parser(),
+        {
+            "ab": ("Before", "a", "b"),
+            "bc": ("Before", "b", "c"),
+            "cd": ("Before", "c", "d"),
+            "xy": ("Similar", "x", "y"),
+            "yz": ("Similar", "y", "z"),
+            "n1": ("Neighbour", "a", "x"),
+        },
+    )
+    inferred = ontology.infer_relations()
+    before = "Semantics.relationship_types.Before"
+    similar = "Semantics.relationship_types.Similar"
+    neighbour = "Semantics.relationship_types.Neighbour"
+
+    assert inferred.holds(before, "a", "d")
+    assert not inferred.holds(before, "d", "a")
+    assert not inferred.holds(before, "a", "a")
+    assert {v.name for v in inferred.successors(before, "b")} == {"c", "d"}
+    assert {(s.name, t.name) for s, t in inferred.inferred_pairs(before)} == {("a", "c"), ("a", "d"), ("b", "d")}
+
+    assert inferred.holds(similar, "z", "x")
+    assert inferred.holds(similar, "y", "y")
+    assert {v.name for v in inferred.successors(similar, ontology.vertices["x"])} == {"x", "y", "z"}
+    assert len(list(inferred.pairs(similar))) == 9
+
+    assert inferred.holds(neighbour, "x", "a")
+    assert not inferred.holds(neighbour, "a", "a")
+    assert len(ontology.relationships) == 6
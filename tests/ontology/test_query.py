@@ -0,0 +1,59 @@
+import pytest
+from conftest import AGREGATION
+from conftest import HIERARCHY
+from conftest import load_graph_ontology
+
+from at_ontology_parser.ontology.query import parse_query
+from at_ontology_parser.ontology.query import QuerySyntaxError
+from at_ontology_parser.parsing.parser import Parser
+
+
+def names(plan):
+    return sorted(tuple(v.name for v in match.vertices) for match in plan)
+
+
+def test_parse_query():
+    query = parse_query("CourseElement {name = 'A', code != 3} -[Hierarchy]-> * <-[]- Competence <- *")
+    assert [n.type for n in query.nodes] == ["CourseElement", None, "Competence", None]
+    assert [(c.key, c.operator, c.value) for c in query.nodes[0].conditions] == [("name", "=", "A"), ("code", "!=", 3)]
+    assert [(e.type, e.forward) for e in query.edges] == [("Hierarchy", True), (None, False), (None, False)]
+
+    with pytest.raises(QuerySyntaxError):
+        parse_query("CourseElement -[Hierarchy]- *")
+    with pytest.raises(QuerySyntaxError):
+        parse_query("CourseElement {code ~ 1}")
+
+
+def test_paths(graph_ontology):
+    assert names(graph_ontology.query("CourseElement -[Hierarchy]-> * -[Hierarchy]-> *")) == [("A", "C", "D")]
+    assert names(graph_ontology.query(f"* -[{HIERARCHY}]-> {{name = D}}")) == [("C", "D")]
+    assert names(graph_ontology.query("* <-[Agregation]- * <-[Hierarchy]- *")) == [("A", "D", "C")]
+    assert names(graph_ontology.query("{name = A} -> *")) == [("A", "B"), ("A", "C")]
+    assert names(graph_ontology.query("Competence {code = UK-1}")) == [("K",)]
+    assert names(graph_ontology.query("Competence {code = UK-2}")) == []
+    assert names(graph_ontology.query("Competence -> *")) == []
+
+    match = next(iter(graph_ontology.query("* -[Agregation]-> *")))
+    assert match.relationships[0] is graph_ontology.relationships["DA"]
+    assert match.relationships[0].type.value.name == AGREGATION
+
+
+def test_index_follows_replaced_relationships(graph_ontology):
+    assert names(graph_ontology.query("* -[Agregation]-> *")) == [("D", "A")]
+    other = load_graph_ontology(Parser(), {"DA": (AGREGATION, "B", "C")}, name="other-ontology")
+    graph_ontology.relationships["DA"] = other.relationships["DA"]
+    assert names(graph_ontology.query("* -[Agregation]-> *")) == [("B", "C")]
+
+
+def test_planner_starts_from_selective_end():
+    edges = {f"R{i}": (HIERARCHY, "Root", f"V{i}") for i in range(50)}
+    ontology = load_graph_ontology(Parser(), edges)
+
+    plan = ontology.query("CourseElement -[Hierarchy]-> {name = V7}")
+    assert plan.from_end and plan.estimates == (51, 1)
+    assert names(plan) == [("Root", "V7")]
+    assert not ontology.query("{name = Root} -[Hierarchy]-> CourseElement").from_end
+
+    # the matches are produced one by one
+    matches = iter(ontology.query("CourseElement -[Hierarchy]-> CourseElement"))
+    assert next(matches).vertices[0].name == "Root"
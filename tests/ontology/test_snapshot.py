@@ -0,0 +1,38 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from conftest import HIERARCHY
+
+from at_ontology_parser.ontology.snapshot import OntologySnapshot
+
+
+def read_neighbours(path, vertex_name):
+    with OntologySnapshot.open(path) as snapshot:
+        return [v.name for v in snapshot.neighbours(snapshot.vertex(vertex_name), HIERARCHY)]
+
+
+def test_snapshot_roundtrip(graph_ontology, tmp_path):
+    path = graph_ontology.write_snapshot(tmp_path / "graph.snapshot")
+
+    with OntologySnapshot.open(path) as snapshot:
+        assert [v.name for v in snapshot.vertices] == list(graph_ontology.vertices)
+        assert [r.name for r in snapshot.relationships] == list(graph_ontology.relationships)
+
+        competence = snapshot.vertex("K")
+        assert competence.type.name == "CourceDiscipline.vertex_types.Competence"
+        assert competence.type.derivation_path == [
+            "ATOntology.vertex_types.Root",
+            "CourceDiscipline.vertex_types.Competence",
+        ]
+        assert competence.properties == {"code": "UK-1", "description": "Компетенция"}
+        assert snapshot.vertex("missing") is None
+
+        relationship = snapshot.relationship("CD")
+        assert (relationship.source.name, relationship.target.name) == ("C", "D")
+        assert relationship.type == snapshot.type(HIERARCHY)
+        assert snapshot.type(HIERARCHY).to_representation()["properties"]["symmetry"]["default"] == "anti-symmetric"
+
+        assert [v.name for v in snapshot.neighbours(snapshot.vertex("A"), HIERARCHY)] == ["B", "C"]
+        assert snapshot.neighbours(snapshot.vertex("B"), HIERARCHY) == []
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert list(executor.map(read_neighbours, [path, path], ["A", "C"])) == [["B", "C"], ["D"]]
@@ -0,0 +1,114 @@
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from at_ontology_parser.parsing.aio import AsyncParser
+from at_ontology_parser.parsing.instrumentation import PHASE_IMPORTS
+from at_ontology_parser.parsing.instrumentation import PHASE_READ
+from at_ontology_parser.parsing.parser import Parser
+
+fixtures_dir = Path(__file__).parent.parent / "fixtures"
+test_ontology = fixtures_dir / "yaml/test-ontology.ont.yml"
+normative_types = fixtures_dir / "yaml/normative-types.mdl.yml"
+
+
+def test_overlapping_loads_and_archive(tmp_path):
+    async def main():
+        async with AsyncParser(max_workers=2) as parser:
+            ontology, model = await asyncio.gather(
+                parser.load_ontology(test_ontology), parser.load_model_yaml_file(normative_types)
+            )
+            archive = await parser.build_archive(ontology, export_dir=tmp_path)
+            return ontology, model, archive
+
+    ontology, model, archive = asyncio.run(main())
+    assert ontology.name == "test-ontology"
+    assert model.name == "normative-types"
+    assert archive.exists()
+
+
+def test_aclose_removes_phase_hook():
+    async def main(parser):
+        async with AsyncParser(parser=parser) as async_parser:
+            await async_parser.load_model_yaml_file(normative_types)
+            assert len(parser._phase_hooks) == 1
+        await async_parser.aclose()
+
+    parser = Parser()
+    asyncio.run(main(parser))
+    assert parser._phase_hooks == []
+
+
+def test_backpressure():
+    active = []
+    peak = []
+
+    def job():
+        active.append(1)
+        peak.append(len(active))
+        time.sleep(0.01)
+        active.pop()
+
+    async def main():
+        async with AsyncParser(max_workers=4, max_concurrency=2) as parser:
+            await asyncio.gather(*(parser.run(job) for _ in range(10)))
+
+    asyncio.run(main())
+    assert len(peak) == 10
+    assert max(peak) <= 2
+
+
+def test_cancelled_load_leaves_parser_intact():
+    started = threading.Event()
+    gate = threading.Event()
+
+    def block(phase, module):
+        if phase == PHASE_READ:
+            started.set()
+            gate.wait(5)
+
+    async def main():
+        async with AsyncParser(max_workers=1) as parser:
+            parser.parser.add_phase_hook(on_phase_start=block)
+            task = asyncio.create_task(parser.load_ontology_yaml_file(test_ontology))
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+            task.cancel()
+            asyncio.get_running_loop().call_later(0.05, gate.set)
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            return parser.parser
+
+    parser = asyncio.run(main())
+    assert not parser.ontology_modules
+    assert not parser.modules
+
+
+def test_cancellation_after_registration_completes_load():
+    started = threading.Event()
+    gate = threading.Event()
+
+    def block(phase, module):
+        # the root entities are registered, the imported models are read next
+        if phase == PHASE_IMPORTS and not started.is_set():
+            started.set()
+            gate.wait(5)
+
+    async def main():
+        async with AsyncParser(max_workers=1) as parser:
+            parser.parser.add_phase_hook(on_phase_start=block)
+            task = asyncio.create_task(parser.load_ontology_yaml_file(test_ontology))
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+            task.cancel()
+            asyncio.get_running_loop().call_later(0.05, gate.set)
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            return parser.parser
+
+    parser = asyncio.run(main())
+    # the load runs to the end, its result is discarded
+    assert len(parser.ontology_modules) == 1
+    assert all(ref.fulfilled for ref in parser._requested_references)
+    assert parser.load_model_yaml_file(normative_types).name == "normative-types"
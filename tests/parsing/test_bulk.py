@@ -0,0 +1,74 @@
+import io
+from pathlib import Path
+
+import pytest
+
+from at_ontology_parser.exceptions import LoadException
+from at_ontology_parser.parsing.bulk import ColumnMapping
+from at_ontology_parser.parsing.parser import Parser
+
+fixtures_dir = Path(__file__).parent.parent / "fixtures"
+
+
+@pytest.fixture
+def parser_with_ontology():
+    parser = Parser()
+    ontology = parser.load_ontology_data(
+        {"name": "bulk-ontology", "imports": ["course-discipline-types.mdl.yml"]},
+        orig_name="bulk-ontology.ont.yml",
+        full_path=fixtures_dir / "yaml/bulk-ontology.ont.yml",
+    )
+    parser.finalize_references()
+    return parser, ontology
+
+
+VERTICES_CSV = """name,type,label,properties.code,properties.description
+Competence1,CourceDiscipline.vertex_types.Competence,К1,UK-1,Описание 1
+Element1,CourceDiscipline.vertex_types.CourseElement,Тема 1,,
+Element2,CourceDiscipline.vertex_types.CourseElement,Тема 2,,
+"""
+
+RELATIONSHIPS_NDJSON = """
+{"name": "H1", "type": "CourceDiscipline.relationship_types.Hierarchy", "source": "Element1", "target": "Element2"}
+{"name": "A1", "type": "CourceDiscipline.relationship_types.Agregation", "source": "Element2", "target": "Element1"}
+"""
+
+
+def test_bulk_load_csv_and_ndjson(parser_with_ontology):
+    parser, ontology = parser_with_ontology
+
+    with parser.bulk_loader(ontology, batch_size=2) as loader:
+        assert loader.load_vertices_csv(io.StringIO(VERTICES_CSV)) == 3
+        assert loader.load_relationships_ndjson(io.StringIO(RELATIONSHIPS_NDJSON)) == 2
+        assert not ontology.relationships["H1"].source.fulfilled
+
+    assert set(ontology.vertices) == {"Competence1", "Element1", "Element2"}
+    assert parser._registered_instances["vertices"]["Element1"] is ontology.vertices["Element1"]
+
+    competence = ontology.vertices["Competence1"]
+    assert competence.type.value.name == "CourceDiscipline.vertex_types.Competence"
+    assert {p.definition.alias: p.value for p in competence.properties} == {
+        "code": "UK-1",
+        "description": "Описание 1",
+    }
+    assert all(p.definition.fulfilled for p in competence.properties)
+
+    relationship = ontology.relationships["H1"]
+    assert relationship.source.value is ontology.vertices["Element1"]
+    assert relationship.target.value is ontology.vertices["Element2"]
+
+    representation = ontology.to_representation(parser.root_context)
+    assert representation["vertices"]["Competence1"]["properties"]["code"] == "UK-1"
+
+
+def test_bulk_load_reports_bad_rows_and_references(parser_with_ontology):
+    parser, ontology = parser_with_ontology
+    loader = parser.bulk_loader(ontology, mapping=ColumnMapping(name="id"))
+
+    with pytest.raises(LoadException) as e:
+        loader.load_vertices([{"id": "V1", "type": "Unknown.Type"}, {"type": "Unknown.Type"}, {"id": "V1"}])
+    assert len(e.value.errors) == 2
+
+    with pytest.raises(LoadException) as e:
+        loader.finalize()
+    assert e.value.errors[0]["context"] == ["vertices", "V1", "type"]
@@ -0,0 +1,84 @@
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import yaml
+
+from at_ontology_parser.exceptions import Context
+from at_ontology_parser.model.types import DataType
+from at_ontology_parser.model.types import VertexType
+from at_ontology_parser.ontology.instances import Vertex
+from at_ontology_parser.parsing.parser import Parser
+from at_ontology_parser.reference import OntologyReference
+
+fixtures_dir = Path(__file__).parent.parent / "fixtures"
+
+THREADS = 8
+ONTOLOGIES = 16
+
+
+def test_reference_specialisations_are_not_shared():
+    assert OntologyReference[DataType] is OntologyReference[DataType]
+    assert OntologyReference[DataType] is not OntologyReference[VertexType]
+    assert issubclass(OntologyReference[VertexType], OntologyReference)
+
+    def create(i: int):
+        reference_type, expected = [(OntologyReference[DataType], DataType), (OntologyReference[Vertex], Vertex)][i % 2]
+        ref = reference_type(alias=str(i), context=Context(name=i))
+        return ref.types == [expected]
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        assert all(executor.map(create, range(10000)))
+
+
+def _ontology_files(directory: Path):
+    for name in ("course-discipline-types.mdl.yml", "normative-types.mdl.yml"):
+        shutil.copy(fixtures_dir / "yaml" / name, directory / name)
+    with open(fixtures_dir / "yaml/test-ontology.ont.yml", "r", encoding="utf-8") as stream:
+        data = yaml.safe_load(stream)
+
+    result = []
+    for i in range(ONTOLOGIES):
+        path = directory / f"ontology-{i}.ont.yml"
+        ontology = {
+            **data,
+            "name": f"ontology-{i}",
+            "vertices": {f"{name}-{i}": vertex for name, vertex in data["vertices"].items()},
+            "relationships": {
+                f"{name}-{i}": {
+                    **relationship,
+                    "source": f"{relationship['source']}-{i}",
+                    "target": f"{relationship['target']}-{i}",
+                }
+                for name, relationship in (data.get("relationships") or {}).items()
+            },
+        }
+        path.write_text(yaml.safe_dump(ontology, allow_unicode=True), encoding="utf-8")
+        result.append(path)
+    return result
+
+
+def _representations(parser: Parser, ontologies):
+    return {o.name: o.to_representation(parser.root_context) for o in ontologies}
+
+
+def test_concurrent_loads_are_deterministic(tmp_path):
+    paths = _ontology_files(tmp_path)
+
+    sequential = Parser()
+    expected = _representations(sequential, [sequential.load_ontology_yaml_file(p) for p in paths])
+
+    for _ in range(3):
+        parser = Parser()
+        with ThreadPoolExecutor(THREADS) as executor:
+            ontologies = list(executor.map(parser.load_ontology_yaml_file, paths))
+
+        assert _representations(parser, ontologies) == expected
+        assert len(parser._modules) == 2 and len(parser._ontology_modules) == ONTOLOGIES
+        assert not parser._requested_references
+
+        registered = parser._registered_types["vertex_types"]
+        for ontology in ontologies:
+            assert parser.get_module_by_ontology(ontology).ontology is ontology
+            for vertex in ontology.vertices.values():
+                assert vertex.type.value is registered[vertex.type.alias]
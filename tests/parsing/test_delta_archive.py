@@ -0,0 +1,112 @@
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from at_ontology_parser.exceptions import LoadException
+from at_ontology_parser.exceptions import OntologyException
+from at_ontology_parser.parsing.archive import MANIFEST_NAME
+from at_ontology_parser.parsing.parser import Parser
+
+ROOT = "Base.vertex_types.Root"
+
+
+def write_sources(directory: Path, label: str, readme: str) -> Path:
+    (directory / "base/docs").mkdir(parents=True, exist_ok=True)
+    (directory / "base/base.mdl.yml").write_text(
+        f"name: base\nvertex_types:\n  {ROOT}:\n    label: Root\n", encoding="utf-8"
+    )
+    (directory / "base/docs/readme.txt").write_text(readme, encoding="utf-8")
+    ontology_path = directory / "delta.ont.yml"
+    ontology_path.write_text(
+        "name: delta\n"
+        "imports:\n  - base/base.mdl.yml\n"
+        f"vertices:\n  V1:\n    type: {ROOT}\n    label: {label}\n  V2:\n    type: {ROOT}\n",
+        encoding="utf-8",
+    )
+    return ontology_path
+
+
+def build(tmp_path: Path, label: str, readme: str, base_archive: Path = None) -> Path:
+    parser = Parser()
+    ontology = parser.load_ontology_yaml_file(write_sources(tmp_path / "src", label, readme))
+    # every build gets its own directory, the archives of the same ontology have the same names
+    export_dir = tmp_path / "export" / str(len(list(tmp_path.glob("export/*"))))
+    if base_archive is None:
+        return parser.build_archive(ontology, export_dir=export_dir)
+    return parser.build_delta_archive(ontology, base_archive, export_dir=export_dir)
+
+
+def members(archive: Path):
+    with zipfile.ZipFile(archive) as zip_ref:
+        return set(zip_ref.namelist())
+
+
+def test_delta_contains_changed_modules(tmp_path):
+    base = build(tmp_path, "First", "v1")
+    assert MANIFEST_NAME in members(base)
+    assert members(build(tmp_path, "First", "v1", base_archive=base)) == {MANIFEST_NAME}
+
+    delta = build(tmp_path, "Second", "v1", base_archive=base)
+    assert members(delta) == {"types.yml", MANIFEST_NAME}
+
+    parser = Parser()
+    ontology = parser.load_ontology_delta_archive(base, delta)
+    assert ontology.vertices["V1"].label == "Second"
+    assert ontology.vertices["V2"].type.value is parser._registered_types["vertex_types"][ROOT]
+    model_module = parser.get_module_by_model(ontology._resolved_imports[0][1])
+    assert model_module.artifacts[Path("docs/readme.txt")].read() == "v1"
+
+    # the base archive is still loadable as a regular one
+    assert Parser().load_ontology(base).vertices["V1"].label == "First"
+
+
+def test_delta_chain(tmp_path):
+    base = build(tmp_path, "First", "v1")
+    delta = build(tmp_path, "Second", "v1", base_archive=base)
+    artifact_delta = build(tmp_path, "Second", "v2", base_archive=delta)
+    assert members(artifact_delta) == {"base/docs/readme.txt", MANIFEST_NAME}
+
+    parser = Parser()
+    ontology = parser.load_ontology_delta_archive(base, delta, artifact_delta)
+    assert ontology.vertices["V1"].label == "Second"
+    model_module = parser.get_module_by_model(ontology._resolved_imports[0][1])
+    assert model_module.artifacts[Path("docs/readme.txt")].read() == "v2"
+
+    with pytest.raises(LoadException):
+        Parser().load_ontology_delta_archive(base, artifact_delta)
+
+
+def test_base_without_manifest(tmp_path):
+    base = build(tmp_path, "First", "v1")
+    legacy = tmp_path / "legacy.zip"
+    with zipfile.ZipFile(base) as source, zipfile.ZipFile(legacy, "w") as target:
+        for name in source.namelist():
+            if name != MANIFEST_NAME:
+                target.writestr(name, source.read(name))
+
+    with pytest.raises(OntologyException):
+        build(tmp_path, "Second", "v1", base_archive=legacy)
+
+
+def test_module_in_archive_root_keeps_its_own_artifacts(tmp_path):
+    ontology_path = write_sources(tmp_path / "src", "First", "v1")
+    (tmp_path / "src/extra").mkdir()
+    (tmp_path / "src/extra/extra.mdl.yml").write_text("name: extra\n", encoding="utf-8")
+    (tmp_path / "src/extra/notes.txt").write_text("notes", encoding="utf-8")
+    ontology_path.write_text(
+        ontology_path.read_text(encoding="utf-8").replace("imports:\n", "imports:\n  - extra: extra/extra.mdl.yml\n"),
+        encoding="utf-8",
+    )
+
+    def subpath(module):
+        return Path("base.mdl.yml") if module.model.name == "base" else Parser.default_module_subpath_generator(module)
+
+    parser = Parser()
+    ontology = parser.load_ontology_yaml_file(ontology_path)
+    base = parser.build_archive(ontology, export_dir=tmp_path / "export", module_subpath_generator=subpath)
+
+    parser = Parser()
+    ontology = parser.load_ontology_delta_archive(base)
+    artifacts = {model.name: set(module.artifacts) for _, model, module in ontology._resolved_imports}
+    assert artifacts == {"base": {Path("docs/readme.txt")}, "extra": {Path("notes.txt")}}
@@ -0,0 +1,129 @@
+import pstats
+import threading
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from at_ontology_parser.parsing.instrumentation import COUNTER_ENTITIES
+from at_ontology_parser.parsing.instrumentation import COUNTER_FILES_OPENED
+from at_ontology_parser.parsing.instrumentation import COUNTER_REFERENCES_CREATED
+from at_ontology_parser.parsing.instrumentation import COUNTER_REFERENCES_DEFERRED
+from at_ontology_parser.parsing.instrumentation import LoadStats
+from at_ontology_parser.parsing.instrumentation import PHASE_FINALIZE
+from at_ontology_parser.parsing.instrumentation import PHASE_IMPORTS
+from at_ontology_parser.parsing.instrumentation import PHASE_READ
+from at_ontology_parser.parsing.instrumentation import PHASE_TO_INTERNAL
+from at_ontology_parser.parsing.instrumentation import PHASE_VALIDATION
+from at_ontology_parser.parsing.parser import Parser
+
+fixtures_dir = Path(__file__).parent.parent / "fixtures"
+test_ontology = fixtures_dir / "yaml/test-ontology.ont.yml"
+
+
+def test_phase_stats_and_hooks():
+    parser = Parser()
+    events = []
+    parser.add_phase_hook(
+        on_phase_start=lambda phase, module: events.append(("start", phase, module)),
+        on_phase_end=lambda record: events.append(("end", record.phase, record.module)),
+    )
+    parser.load_ontology_yaml_file(test_ontology)
+
+    for phase in (PHASE_READ, PHASE_VALIDATION, PHASE_TO_INTERNAL, PHASE_IMPORTS, PHASE_FINALIZE):
+        assert parser.stats.phases[phase].calls >= 1
+        assert parser.stats.phases[phase].wall_time > 0
+
+    # the ontology and the imported models are reported per module
+    assert str(test_ontology) in parser.stats.modules
+    assert len(parser.stats.modules) >= 2
+
+    counters = parser.stats.counters
+    assert counters[COUNTER_ENTITIES] == sum(len(r) for r in parser._registered_types.values()) + sum(
+        len(r) for r in parser._registered_instances.values()
+    )
+    assert counters[COUNTER_REFERENCES_CREATED] >= counters[COUNTER_REFERENCES_DEFERRED] > 0
+    assert counters[COUNTER_FILES_OPENED] >= 2
+
+    # phases are properly nested
+    depth = 0
+    for kind, _, _ in events:
+        depth += 1 if kind == "start" else -1
+        assert depth >= 0
+    assert depth == 0
+    assert events[0] == ("start", PHASE_READ, str(test_ontology))
+    assert events[-1] == ("end", PHASE_FINALIZE, None)
+
+    assert parser.stats.represent()["counters"] == counters
+
+
+def test_peak_memory_is_tracked_on_demand():
+    parser = Parser()
+    parser.load_ontology_yaml_file(test_ontology)
+    assert parser.stats.phases[PHASE_TO_INTERNAL].peak_memory == 0
+
+    parser = Parser(track_memory=True)
+    parser.load_ontology_yaml_file(test_ontology)
+    assert parser.stats.phases[PHASE_TO_INTERNAL].peak_memory > 0
+    # the nested phases are included into the peak of the enclosing one
+    assert parser.stats.phases[PHASE_IMPORTS].peak_memory >= parser.stats.phases[PHASE_VALIDATION].peak_memory
+
+
+def test_peak_memory_is_not_attributed_to_overlapping_phases():
+    stats = LoadStats()
+    started, finished = threading.Event(), threading.Event()
+
+    def other_thread():
+        stats.start(PHASE_READ, "other")
+        started.set()
+        finished.wait(5)
+        stats.end()
+
+    tracemalloc.start()
+    try:
+        stats.start(PHASE_TO_INTERNAL, "alone")
+        data = [bytearray(1024) for _ in range(100)]
+        alone = stats.end()
+
+        stats.start(PHASE_TO_INTERNAL, "overlapped")
+        thread = threading.Thread(target=other_thread)
+        thread.start()
+        started.wait(5)
+        data = [bytearray(1024) for _ in range(100)]
+        finished.set()
+        thread.join()
+        overlapped = stats.end()
+    finally:
+        tracemalloc.stop()
+    assert data
+    assert alone.peak_memory > 0
+    # the peak is process-wide, so it isn't reported for the phases running while another thread loads
+    assert overlapped.peak_memory == 0
+    assert stats.modules["other"][PHASE_READ].peak_memory == 0
+
+
+def test_failing_start_hook_closes_phase():
+    parser = Parser(track_memory=True)
+
+    def fail(phase, module):
+        raise RuntimeError(phase)
+
+    hook = parser.add_phase_hook(on_phase_start=fail)
+    with pytest.raises(RuntimeError):
+        parser.load_ontology_yaml_file(test_ontology)
+    assert not tracemalloc.is_tracing()
+    assert parser.stats.phases[PHASE_READ].calls == 1
+    assert not parser.stats._stack
+
+    parser.remove_phase_hook(hook)
+    parser.load_ontology_yaml_file(test_ontology)
+
+
+def test_profile_dumps_stats(tmp_path):
+    parser = Parser()
+    output = tmp_path / "load.prof"
+    with parser.profile(output):
+        parser.load_ontology_yaml_file(test_ontology)
+
+    stats = pstats.Stats(str(output))
+    assert any(name == "finalize_references" for _, _, name in stats.stats)
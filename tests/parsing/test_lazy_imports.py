@@ -0,0 +1,76 @@
+from pathlib import Path
+
+import pytest
+
+from at_ontology_parser.exceptions import LoadException
+from at_ontology_parser.parsing.lazy import scan_module
+from at_ontology_parser.parsing.parser import Parser
+
+fixtures_dir = Path(__file__).parent.parent / "fixtures"
+course_discipline_types = fixtures_dir / "yaml/course-discipline-types.mdl.yml"
+semantics_types = fixtures_dir / "yaml/semantics-types.mdl.yml"
+normative_types = fixtures_dir / "yaml/normative-types.mdl.yml"
+
+
+def load_ontology(parser: Parser, vertex_type: str):
+    ontology = parser.load_ontology_data(
+        {
+            "name": "lazy",
+            "imports": [{"semantics": "semantics-types.mdl.yml"}, {"course": "course-discipline-types.mdl.yml"}],
+            "vertices": {"A": {"type": vertex_type}},
+        },
+        orig_name="lazy.ont.yml",
+        full_path=fixtures_dir / "yaml/lazy.ont.yml",
+    )
+    parser.finalize_references()
+    return ontology
+
+
+def test_scan_module(tmp_path):
+    names, imports = scan_module(course_discipline_types)
+    assert "CourceDiscipline.vertex_types.CourseElement" in names
+    assert "CourceDiscipline.data_types.Question" in names
+    assert imports == ["normative-types.mdl.yml"]
+
+    model = tmp_path / "model.mdl.yml"
+    model.write_text(
+        "imports:\n- a.mdl.yml\n- alias: 'b.mdl.yml'\nvertex_types: {V: {derived_from: R}}\n"
+        "relationship_types:\n  'R':\n    properties:\n      p: {}\n"
+    )
+    assert scan_module(model) == ({"V", "R"}, ["a.mdl.yml", "b.mdl.yml"])
+
+
+def test_only_required_imports_are_loaded():
+    parser = Parser(lazy_imports=True)
+    ontology = load_ontology(parser, "CourceDiscipline.vertex_types.CourseElement")
+
+    loaded = {Path(path) for path in parser.modules}
+    assert loaded == {course_discipline_types, normative_types}
+    assert [p.full_path for p in parser._pending_imports.values()] == [semantics_types]
+    assert ontology.vertices["A"].type.value.name == "CourceDiscipline.vertex_types.CourseElement"
+    assert [model.name for _, model, _ in ontology._resolved_imports] == ["course-discipline-types"]
+
+    # the closure loads the rest, the resolved imports keep the order of the definitions
+    closure = parser.import_closure(ontology)
+    assert not parser._pending_imports
+    assert [model.name for _, model, _ in ontology._resolved_imports] == ["semantics-types", "course-discipline-types"]
+    assert {getattr(handler, "name", None) for handler in closure[1:]} == {
+        "semantics-types",
+        "course-discipline-types",
+        "normative-types",
+    }
+    assert parser.build_archive(ontology).exists()
+
+
+def test_unknown_alias_forces_pending_imports():
+    parser = Parser(lazy_imports=True)
+    with pytest.raises(LoadException):
+        load_ontology(parser, "Unknown.vertex_types.T")
+    assert not parser._pending_imports
+    assert len(parser.modules) == 3
+
+
+def test_eager_mode_is_default():
+    parser = Parser()
+    load_ontology(parser, "CourceDiscipline.vertex_types.CourseElement")
+    assert len(parser.modules) == 3 and not parser._pending_imports
@@ -0,0 +1,93 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from at_ontology_parser.exceptions import LoadException
+from at_ontology_parser.parsing.memory import class_name
+from at_ontology_parser.parsing.memory import KIND_CONTEXT
+from at_ontology_parser.parsing.memory import KIND_ENTITY
+from at_ontology_parser.parsing.memory import KIND_PYDANTIC
+from at_ontology_parser.parsing.memory import memory_report
+from at_ontology_parser.parsing.memory import ModuleFootprint
+from at_ontology_parser.parsing.memory import walk
+from at_ontology_parser.parsing.parser import Parser
+
+fixtures_dir = Path(__file__).parent.parent / "fixtures"
+
+
+def test_memory_report_per_module():
+    parser = Parser()
+    ontology = parser.load_ontology_yaml_file(fixtures_dir / "yaml/test-ontology.ont.yml")
+
+    report = parser.memory_report()
+    names = [m.name for m in report.modules]
+    assert names == list(parser._modules) + list(parser._ontology_modules) + ["<parser>"]
+    assert report.total.size == sum(m.total.size for m in report.modules)
+    assert report.total.size == sum(f.size for f in report.kinds.values())
+
+    # model types referenced from the ontology are accounted to the model module
+    vertex = next(iter(ontology.vertices.values()))
+    type_module = parser.get_module_by_model(vertex.type.value.owner)
+    type_class = class_name(vertex.type.value.__class__)
+    ontology_module = report.module(str(parser.get_module_by_ontology(ontology).full_path))
+    assert type_class in report.module(str(type_module.full_path)).classes
+    assert type_class not in ontology_module.classes
+
+    # pydantic models are retained through Context.data
+    assert report.kinds[KIND_PYDANTIC].count > 0
+    assert report.kinds[KIND_CONTEXT].count > 0
+    assert report.kinds[KIND_ENTITY].count > 0
+
+    represented = report.represent()
+    assert represented["size"] == report.total.size
+    assert [m["size"] for m in represented["modules"]] == sorted(
+        (m["size"] for m in represented["modules"]), reverse=True
+    )
+
+
+def test_shared_objects_are_counted_once():
+    shared = ["x" * 1000]
+    report = memory_report({"a": {"value": shared}, "b": [shared]})
+    assert report.module("a").classes["builtins.list"].count == 1
+    assert report.module("b").classes["builtins.list"].count == 1
+    assert "builtins.str" not in report.module("b").classes
+
+    footprint = ModuleFootprint(name="single")
+    walk(shared, footprint, set(), set(), {})
+    assert footprint.total.size == sys.getsizeof(shared) + sys.getsizeof(shared[0])
+
+
+def test_compact_releases_parse_time_data():
+    parser = Parser()
+    parser.load_ontology_yaml_file(fixtures_dir / "yaml/test-ontology.ont.yml")
+    before = parser.memory_report()
+    assert parser.compact() > 0
+
+    after = parser.memory_report()
+    assert KIND_PYDANTIC not in after.kinds
+    assert after.total.size < before.total.size
+
+    parser = Parser(retain_context_data=False)
+    parser.load_ontology_yaml_file(fixtures_dir / "yaml/test-ontology.ont.yml")
+    assert KIND_PYDANTIC not in parser.memory_report().kinds
+
+
+@pytest.mark.parametrize("retain_context_data", [True, False])
+def test_errors_without_context_data(retain_context_data):
+    parser = Parser(retain_context_data=retain_context_data)
+    with pytest.raises(LoadException) as e:
+        parser.load_ontology_data(
+            {
+                "name": "broken",
+                "imports": ["course-discipline-types.mdl.yml"],
+                "vertices": {"V": {"type": "Unknown.vertex_types.Type"}},
+            },
+            orig_name="broken.ont.yml",
+            full_path=fixtures_dir / "yaml/broken.ont.yml",
+        )
+        parser.finalize_references()
+
+    assert e.value.represent()["errors"] == [
+        {"msg": 'Unknown reference "Unknown.vertex_types.Type" to VertexType', "context": ["vertices", "V", "type"]}
+    ]
@@ -63,3 +63,41 @@ def test_parse_models_simple(course_discipline_types, test_ontology):
     ontology = parser.load_ontology(archive_path)
     assert ontology.name == "test-ontology"
     assert len(parser._modules) == 2 and len(parser._ontology_modules) == 1
+
+
+def test_modules_are_indexed_and_reused(tmp_path):
+    (tmp_path / "base").mkdir()
+    (tmp_path / "derived").mkdir()
+    (tmp_path / "base/base.mdl.yml").write_text(
+        "name: base\nvertex_types:\n  Base.vertex_types.Root:\n    label: Root\n", encoding="utf-8"
+    )
+    (tmp_path / "derived/derived.mdl.yml").write_text(
+        "name: derived\n"
+        "imports:\n  - ../base/base.mdl.yml\n"
+        "vertex_types:\n  Derived.vertex_types.Leaf:\n    derived_from: Base.vertex_types.Root\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "ontology.ont.yml").write_text(
+        "name: ontology\n"
+        "imports:\n  - base: base/base.mdl.yml\n  - derived: derived/../derived/derived.mdl.yml\n"
+        "vertices:\n  V:\n    type: Derived.vertex_types.Leaf\n",
+        encoding="utf-8",
+    )
+
+    parser = Parser()
+    ontology = parser.load_ontology_yaml_file(tmp_path / "ontology.ont.yml")
+    # the base model is imported by the ontology and by the derived model through different paths
+    assert len(parser._modules) == 2 and len(parser._ontology_modules) == 1
+
+    base_module = parser.get_module_by_path(tmp_path / "derived/../base/base.mdl.yml")
+    assert base_module.model.name == "base"
+    assert parser.get_module_by_model(base_module.model) is base_module
+    assert parser.get_module_by_ontology(ontology) is parser.get_ontology_module_by_orig_name(
+        str(tmp_path / "ontology.ont.yml")
+    )
+    assert parser.get_module_by_model(ontology) is None
+
+    closure = parser.import_closure(ontology)
+    assert closure[0] is ontology
+    assert [m.name for m in closure[1:]] == ["base", "derived"]
+    assert parser.import_closure(ontology) == closure
@@ -0,0 +1,121 @@
+from pathlib import Path
+
+import pytest
+
+from at_ontology_parser.exceptions import OntologyException
+from at_ontology_parser.parsing.memory import iter_contexts
+from at_ontology_parser.parsing.parser import Parser
+
+fixtures_dir = Path(__file__).parent.parent / "fixtures"
+
+
+@pytest.fixture
+def shared_layer():
+    parser = Parser()
+    parser.load_model_yaml_file(fixtures_dir / "yaml/course-discipline-types.mdl.yml")
+    return parser.freeze()
+
+
+def test_parsers_share_frozen_models(shared_layer):
+    first, second = Parser(shared_layer=shared_layer), Parser(shared_layer=shared_layer)
+    first_ontology = first.load_ontology_yaml_file(fixtures_dir / "yaml/test-ontology.ont.yml")
+    second_ontology = second.load_ontology_data(
+        {"name": "other", "imports": ["course-discipline-types.mdl.yml"]},
+        orig_name="other.ont.yml",
+        full_path=fixtures_dir / "yaml/other.ont.yml",
+    )
+    second.finalize_references()
+
+    # the imports are resolved with the shared modules, nothing is reloaded
+    assert len(first.modules) == len(second.modules) == len(shared_layer.modules) == 2
+    assert not first._modules.maps[0] and not second._modules.maps[0]
+    shared_types = shared_layer.registered_types["vertex_types"]
+    for vertex in first_ontology.vertices.values():
+        assert vertex.type.value is shared_types[vertex.type.alias]
+    assert first_ontology._resolved_imports[0][1] is second_ontology._resolved_imports[0][1]
+
+    # the parsers are isolated from each other and don't change the layer
+    assert first_ontology.vertices and not second._registered_instances["vertices"]
+    assert not shared_layer.modules_by_path.get(fixtures_dir / "yaml/test-ontology.ont.yml")
+    assert first.get_module_by_ontology(first_ontology) is not None
+    assert second.get_module_by_ontology(first_ontology) is None
+
+    # archives are built from the shared modules as well
+    assert first.build_archive(first_ontology).exists()
+
+
+def test_layer_is_read_only(shared_layer):
+    with pytest.raises(TypeError):
+        shared_layer.registered_types["vertex_types"]["Other"] = None
+
+    parser = Parser(shared_layer=shared_layer)
+    shared_module = next(iter(shared_layer.modules.values()))
+    assert shared_layer.contains(shared_module)
+    with pytest.raises(OntologyException):
+        parser._remove_module(shared_module)
+
+    # own modules override the shared ones only in the parser
+    shared_orig_names = dict(shared_layer.modules_by_orig_name)
+    parser.load_model_yaml_file(fixtures_dir / "yaml/normative-types.mdl.yml")
+    assert parser.get_module_by_path(fixtures_dir / "yaml/normative-types.mdl.yml") is not (
+        shared_layer.modules_by_path[(fixtures_dir / "yaml/normative-types.mdl.yml").resolve()]
+    )
+    assert dict(shared_layer.modules_by_orig_name) == shared_orig_names
+    own_module = parser.get_module_by_path(fixtures_dir / "yaml/normative-types.mdl.yml")
+    assert parser._modules_by_orig_name[own_module.orig_name][-1] is own_module
+    assert not shared_layer.contains(own_module)
+
+
+def test_freeze_requires_resolved_references():
+    parser = Parser()
+    parser.load_model_yaml_file(fixtures_dir / "yaml/course-discipline-types.mdl.yml", finalize=False)
+    parser.load_ontology_data(
+        {"name": "broken", "vertices": {"V": {"type": "Unknown.vertex_types.Type"}}},
+        orig_name="broken.ont.yml",
+        full_path=fixtures_dir / "yaml/broken.ont.yml",
+    )
+    with pytest.raises(OntologyException):
+        parser.freeze()
+
+
+def test_fork():
+    parser = Parser()
+    parser.load_model_yaml_file(fixtures_dir / "yaml/course-discipline-types.mdl.yml")
+
+    forks = [parser.fork() for _ in range(3)]
+    assert all(fork.shared_layer is forks[0].shared_layer for fork in forks)
+
+    ontologies = [fork.load_ontology_yaml_file(fixtures_dir / "yaml/test-ontology.ont.yml") for fork in forks]
+    for fork, ontology in zip(forks, ontologies):
+        assert len(fork.modules) == 2 and len(fork.ontology_modules) == 1
+        assert not fork._modules.maps[0]
+        assert fork._registered_instances["vertices"]["Vertex1"] is ontology.vertices["Vertex1"]
+        assert (
+            ontology.vertices["Vertex1"].type.value
+            is parser._registered_types["vertex_types"]["CourceDiscipline.vertex_types.CourseElement"]
+        )
+    assert ontologies[0].vertices["Vertex1"] is not ontologies[1].vertices["Vertex1"]
+    assert not parser.ontology_modules and not parser._registered_instances["vertices"]
+
+    # forks made after new modules are loaded see them
+    parser.load_ontology_yaml_file(fixtures_dir / "yaml/test-ontology.ont.yml")
+    parser.load_model_yaml_file(fixtures_dir / "yaml/semantics-types.mdl.yml")
+    fork = parser.fork()
+    assert fork.shared_layer is not forks[0].shared_layer
+    assert len(fork.modules) == 3 and not fork.ontology_modules
+
+
+def test_compact_keeps_shared_modules(shared_layer):
+    fork = Parser(shared_layer=shared_layer)
+    ontology = fork.load_ontology_yaml_file(fixtures_dir / "yaml/test-ontology.ont.yml")
+
+    def snapshot():
+        contexts = list(iter_contexts(shared_layer.modules.values()))
+        return [(id(c), id(c.data), id(c.initiator)) for c in contexts]
+
+    shared = snapshot()
+    assert any(data != id(None) for _, data, _ in shared)
+
+    assert fork.compact() > 0
+    assert snapshot() == shared
+    assert all(v.type.context.data is None for v in ontology.vertices.values())
@@ -0,0 +1,103 @@
+import gc
+import io
+import shutil
+from pathlib import Path
+
+import pytest
+import yaml
+
+from at_ontology_parser.exceptions import OntologyException
+from at_ontology_parser.parsing.parser import Parser
+from at_ontology_parser.parsing.store import OntologyStore
+
+fixtures_dir = Path(__file__).parent.parent / "fixtures"
+HIERARCHY = "CourceDiscipline.relationship_types.Hierarchy"
+
+
+@pytest.fixture
+def stored(tmp_path):
+    # the models are copied, so the stored ontology is opened without the files
+    models_dir = tmp_path / "models"
+    models_dir.mkdir()
+    for name in ("course-discipline-types.mdl.yml", "normative-types.mdl.yml"):
+        shutil.copy(fixtures_dir / "yaml" / name, models_dir / name)
+    vertices = {f"V{i}": {"type": "CourceDiscipline.vertex_types.CourseElement"} for i in range(10)}
+    vertices["K"] = {
+        "type": "CourceDiscipline.vertex_types.Competence",
+        "properties": {"code": "UK-1", "description": "Компетенция"},
+    }
+    ontology_path = models_dir / "graph.ont.yml"
+    ontology_path.write_text(
+        yaml.safe_dump(
+            {
+                "name": "graph",
+                "imports": ["course-discipline-types.mdl.yml"],
+                "vertices": vertices,
+                "relationships": {
+                    f"R{i}": {"type": HIERARCHY, "source": "V0", "target": f"V{i}"} for i in range(1, 10)
+                },
+            },
+            allow_unicode=True,
+        ),
+        encoding="utf-8",
+    )
+    parser = Parser()
+    ontology = parser.load_ontology_yaml_file(ontology_path)
+
+    with OntologyStore(tmp_path / "store.db") as store:
+        store.save_ontology(ontology, parser)
+        # saving again replaces the stored modules
+        store.save_ontology(ontology, parser)
+    shutil.rmtree(models_dir)
+
+    store = OntologyStore(tmp_path / "store.db")
+    yield ontology, parser, store
+    store.close()
+
+
+def test_round_trip(stored):
+    ontology, parser, store = stored
+    assert store.module_names() == ["graph"]
+    assert store.module_names("model") == ["course-discipline-types", "normative-types"]
+
+    lazy = store.open_ontology("graph")
+    assert len(lazy.vertices) == 11 and "K" in lazy.vertices and "X" not in lazy.vertices
+    assert lazy.vertices["K"].props.code == "UK-1"
+    relationship = lazy.relationships["R3"]
+    assert relationship.type.value.name == HIERARCHY
+    assert relationship.source.value is lazy.vertices["V0"]
+    assert lazy.to_representation(lazy.parser.root_context) == ontology.to_representation(parser.root_context)
+
+    stream = io.StringIO()
+    lazy.write_yaml(stream)
+    assert yaml.safe_load(stream.getvalue()) == ontology.to_representation(parser.root_context)
+
+    with pytest.raises(OntologyException):
+        store.open_ontology("unknown")
+
+
+def test_bounded_cache(stored):
+    _, _, store = stored
+    lazy = store.open_ontology("graph", cache_size=3)
+
+    names = [v.name for v in lazy.vertices.values()]
+    assert len(names) == 11 and len(lazy.vertices._recent) == 3
+
+    kept = lazy.vertices["V1"]
+    for _ in lazy.vertices.values():
+        pass
+    gc.collect()
+    # referenced instances stay identical, dropped ones are materialised again
+    assert lazy.vertices["V1"] is kept
+    assert len(lazy.vertices._alive) <= 4
+
+
+def test_store_queries(stored):
+    _, _, store = stored
+    lazy = store.open_ontology("graph")
+
+    plan = lazy.query("CourseElement -[Hierarchy]-> {name = V5}")
+    assert plan.from_end
+    assert [tuple(v.name for v in m.vertices) for m in plan] == [("V0", "V5")]
+    assert len(list(lazy.query("{name = V0} -> CourseElement"))) == 9
+    assert list(lazy.query("Competence <- *")) == []
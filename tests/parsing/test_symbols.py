@@ -0,0 +1,131 @@
+from pathlib import Path
+
+import yaml
+
+from at_ontology_parser.parsing.parser import Parser
+
+VERTEX_TYPE = "Versioned.vertex_types.Node"
+
+
+def write(path: Path, data: dict) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(yaml.safe_dump(data), encoding="utf-8")
+    return path
+
+
+def write_version(tmp_path: Path, version: str) -> Path:
+    return write(
+        tmp_path / version / "versioned.mdl.yml",
+        {"name": "versioned", "vertex_types": {VERTEX_TYPE: {"label": version}}},
+    )
+
+
+def load_ontology(parser: Parser, path: Path, imports: list, vertices: dict):
+    ontology = parser.load_ontology_data(
+        {"name": path.stem, "imports": imports, "vertices": {n: {"type": t} for n, t in vertices.items()}},
+        orig_name=path.name,
+        full_path=path,
+    )
+    parser.finalize_references()
+    return ontology
+
+
+def test_model_versions_coexist(tmp_path):
+    v1, v2 = write_version(tmp_path, "v1"), write_version(tmp_path, "v2")
+    parser = Parser()
+
+    first = load_ontology(parser, tmp_path / "first.ont.yml", [str(v1)], {"A": VERTEX_TYPE})
+    second = load_ontology(parser, tmp_path / "second.ont.yml", [str(v2)], {"A": VERTEX_TYPE})
+    assert first.vertices["A"].type.value.label == "v1"
+    assert second.vertices["A"].type.value.label == "v2"
+
+    both = load_ontology(
+        parser,
+        tmp_path / "both.ont.yml",
+        [{"old": str(v1)}, {"new": str(v2)}],
+        {"A": f"old.{VERTEX_TYPE}", "B": f"new.{VERTEX_TYPE}"},
+    )
+    assert both.vertices["A"].type.value is first.vertices["A"].type.value
+    assert both.vertices["B"].type.value is second.vertices["A"].type.value
+
+
+def test_aliases_are_chained(tmp_path):
+    v1 = write_version(tmp_path, "v1")
+    extension = write(
+        tmp_path / "extension.mdl.yml",
+        {
+            "name": "extension",
+            "imports": [{"base": str(v1)}],
+            "vertex_types": {"Extension.vertex_types.Leaf": {"derived_from": f"base.{VERTEX_TYPE}"}},
+        },
+    )
+    write_version(tmp_path, "v2")
+    parser = Parser()
+    parser.load_model_yaml_file(tmp_path / "v2/versioned.mdl.yml")
+
+    ontology = load_ontology(
+        parser,
+        tmp_path / "chained.ont.yml",
+        [{"ext": str(extension)}],
+        {"A": "ext.Extension.vertex_types.Leaf", "B": f"ext.base.{VERTEX_TYPE}"},
+    )
+    leaf = ontology.vertices["A"].type.value
+    assert leaf.derived_from.value.label == "v1"
+    assert ontology.vertices["B"].type.value is leaf.derived_from.value
+    # the global table keeps the latest declaration for the names looked up outside of modules
+    assert parser._registered_types["vertex_types"][VERTEX_TYPE].label == "v1"
+
+
+def test_transitive_imports_keep_their_version(tmp_path):
+    root_type = "Normative.vertex_types.Root"
+    course_type = "Course.vertex_types.Element"
+    courses = {}
+    for version in ("v1", "v2"):
+        normative = write(
+            tmp_path / version / "normative.mdl.yml",
+            {"name": "normative", "vertex_types": {root_type: {"label": version}}},
+        )
+        courses[version] = write(
+            tmp_path / version / "course.mdl.yml",
+            {
+                "name": "course",
+                "imports": [str(normative)],
+                "vertex_types": {course_type: {"derived_from": root_type, "label": version}},
+            },
+        )
+    parser = Parser()
+    parser.load_model_yaml_file(courses["v1"])
+    parser.load_model_yaml_file(courses["v2"])
+
+    ontology = load_ontology(parser, tmp_path / "v1.ont.yml", [str(courses["v1"])], {"A": course_type, "B": root_type})
+    course = ontology.vertices["A"].type.value
+    assert course.label == "v1"
+    # the type of the transitive import is taken from the closure, not from the latest loaded version
+    assert ontology.vertices["B"].type.value is course.derived_from.value
+    assert course.derived_from.value.label == "v1"
+
+
+def test_alias_equal_to_type_prefix(tmp_path):
+    v1 = write_version(tmp_path, "v1")
+    parser = Parser()
+    ontology = load_ontology(
+        parser,
+        tmp_path / "prefixed.ont.yml",
+        [{"Versioned": str(v1)}],
+        {"A": VERTEX_TYPE, "B": f"Versioned.{VERTEX_TYPE}"},
+    )
+    # the alias-stripped name is unknown, the full name is found in the imported model
+    assert ontology.vertices["A"].type.value.label == "v1"
+    assert ontology.vertices["B"].type.value is ontology.vertices["A"].type.value
+
+
+def test_closure_lookup_follows_new_imports(tmp_path):
+    v1 = write_version(tmp_path, "v1")
+    parser = Parser()
+    first = load_ontology(parser, tmp_path / "first.ont.yml", [str(v1)], {"A": VERTEX_TYPE})
+    symbols = parser.get_module_by_ontology(first).symbols
+    assert symbols.lookup("vertex_types", VERTEX_TYPE) is first.vertices["A"].type.value
+
+    # the flattened closure is rebuilt once the imports change
+    symbols.link([])
+    assert symbols.lookup("vertex_types", VERTEX_TYPE) is None
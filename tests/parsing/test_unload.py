@@ -0,0 +1,108 @@
+import gc
+import tracemalloc
+from pathlib import Path
+
+import pytest
+import yaml
+
+from at_ontology_parser.exceptions import LoadException
+from at_ontology_parser.exceptions import OntologyException
+from at_ontology_parser.parsing.parser import Parser
+
+fixtures_dir = Path(__file__).parent.parent / "fixtures"
+course_discipline_types = fixtures_dir / "yaml/course-discipline-types.mdl.yml"
+COURSE_ELEMENT = "CourceDiscipline.vertex_types.CourseElement"
+HIERARCHY = "CourceDiscipline.relationship_types.Hierarchy"
+
+
+def write_ontology(path: Path, size: int) -> Path:
+    data = {
+        "name": path.stem,
+        "imports": [str(course_discipline_types)],
+        "vertices": {f"V{i}": {"type": COURSE_ELEMENT, "label": f"Vertex {i}"} for i in range(size)},
+        "relationships": {
+            f"R{i}": {"type": HIERARCHY, "source": f"V{i}", "target": f"V{i + 1}"} for i in range(size - 1)
+        },
+    }
+    path.write_text(yaml.safe_dump(data), encoding="utf-8")
+    return path
+
+
+def traced_size() -> int:
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def test_unloaded_ontology_is_freed(tmp_path):
+    ontology_path = write_ontology(tmp_path / "tenant.ont.yml", 500)
+    parser = Parser()
+    parser.load_model_yaml_file(course_discipline_types)
+    # the first load warms up the caches of pydantic and the reference classes
+    parser.unload(parser.get_module_by_ontology(parser.load_ontology_yaml_file(ontology_path)))
+
+    tracemalloc.start()
+    try:
+        baseline = traced_size()
+        module = parser.get_module_by_ontology(parser.load_ontology_yaml_file(ontology_path))
+        loaded = traced_size()
+        assert parser.unload(module) == [module]
+        del module
+        unloaded = traced_size()
+    finally:
+        tracemalloc.stop()
+
+    assert unloaded - baseline < (loaded - baseline) * 0.05
+    assert not parser.ontology_modules
+    assert not parser._registered_instances["vertices"] and not parser._registered_instances["relationships"]
+    assert len(parser.modules) == 2
+
+
+def test_unload_with_unused_imports(tmp_path):
+    parser = Parser()
+    ontology = parser.load_ontology_yaml_file(write_ontology(tmp_path / "tenant.ont.yml", 3))
+    module = parser.get_module_by_ontology(ontology)
+    model_module = parser.get_module_by_path(course_discipline_types)
+    artifacts = list(model_module.artifacts.values())
+
+    with pytest.raises(OntologyException):
+        parser.unload(model_module)
+
+    unloaded = parser.unload(module, unused_imports=True)
+    assert unloaded[0] is module and model_module in unloaded and len(unloaded) == 3
+    assert not parser.modules and not parser.ontology_modules
+    assert not any(parser._registered_types.values())
+    assert all(artifact.closed for artifact in artifacts)
+    assert ontology.owner is None
+
+    with pytest.raises(OntologyException):
+        parser.unload(module)
+
+
+def test_references_to_unloaded_types_are_requested_again(tmp_path):
+    versions = []
+    for version in ("v1", "v2"):
+        path = tmp_path / version / "versioned.mdl.yml"
+        path.parent.mkdir()
+        path.write_text(yaml.safe_dump({"name": "versioned", "vertex_types": {"Versioned.vertex_types.Node": {}}}))
+        versions.append(path)
+
+    parser = Parser()
+    first = parser.load_model_yaml_file(versions[0])
+    parser.load_model_yaml_file(versions[1])
+    # the ontology doesn't import the model, so its vertex is resolved by the global registry
+    ontology = parser.load_ontology_data(
+        {"name": "loose", "vertices": {"A": {"type": "Versioned.vertex_types.Node"}}},
+        orig_name="loose.ont.yml",
+        full_path=tmp_path / "loose.ont.yml",
+    )
+    parser.finalize_references()
+    vertex_type = ontology.vertices["A"].type
+
+    parser.unload(parser.get_module_by_path(versions[1]))
+    # the type of the remaining version takes the place of the unloaded one
+    assert vertex_type.value is first.vertex_types["Versioned.vertex_types.Node"]
+
+    parser.unload(parser.get_module_by_model(first))
+    assert vertex_type.value is None
+    with pytest.raises(LoadException):
+        parser.finalize_references()
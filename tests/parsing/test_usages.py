@@ -0,0 +1,75 @@
+from pathlib import Path
+
+from at_ontology_parser.parsing.parser import Parser
+
+fixtures_dir = Path(__file__).parent.parent / "fixtures"
+course_discipline_types = fixtures_dir / "yaml/course-discipline-types.mdl.yml"
+COURSE_ELEMENT = "CourceDiscipline.vertex_types.CourseElement"
+QUESTION = "CourceDiscipline.data_types.Question"
+HIERARCHY = "CourceDiscipline.relationship_types.Hierarchy"
+
+
+def load_ontology(parser: Parser, name: str = "usages"):
+    ontology = parser.load_ontology_data(
+        {
+            "name": name,
+            "imports": [str(course_discipline_types)],
+            "vertices": {v: {"type": COURSE_ELEMENT} for v in "ABC"},
+            "relationships": {"AB": {"type": HIERARCHY, "source": "A", "target": "B"}},
+        },
+        orig_name=f"{name}.ont.yml",
+        full_path=fixtures_dir / f"yaml/{name}.ont.yml",
+    )
+    parser.finalize_references()
+    return ontology
+
+
+def test_referrers():
+    parser = Parser()
+    ontology = load_ontology(parser)
+    course_element = parser._registered_types["vertex_types"][COURSE_ELEMENT]
+    hierarchy = parser._registered_types["relationship_types"][HIERARCHY]
+
+    referrers = parser.usages.referrers(course_element)
+    assert [ontology.vertices[v] for v in "ABC"] == [r for r in referrers if r.owner is ontology]
+    # valid source and target types
+    assert hierarchy in referrers
+    assert {id(ref) for ref in parser.usages.references(course_element)} >= {
+        id(ref) for ref in hierarchy.valid_source_types
+    }
+
+    vertex = ontology.vertices["A"]
+    assert parser.usages.referrers(vertex) == [ontology.relationships["AB"]]
+    assert parser.usages.referrers(ontology.vertices["C"]) == []
+    # the subtypes reference their parents through derived_from
+    assert course_element in parser.usages.referrers(course_element.derived_from.value)
+
+
+def test_impact():
+    parser = Parser()
+    ontology = load_ontology(parser)
+    question = parser._registered_types["data_types"][QUESTION]
+    course_element = parser._registered_types["vertex_types"][COURSE_ELEMENT]
+
+    # the property definition of the data type belongs to the vertex type, which is used by the vertices
+    impact = parser.usages.impact(question)
+    assert impact[0] is course_element
+    assert all(any(entity is v for entity in impact) for v in ontology.vertices.values())
+    assert any(entity is ontology.relationships["AB"] for entity in impact)
+    assert not any(entity is question for entity in impact)
+
+
+def test_usages_follow_unload_and_forks():
+    parser = Parser()
+    ontology = load_ontology(parser)
+    course_element = parser._registered_types["vertex_types"][COURSE_ELEMENT]
+    model_referrers = [r for r in parser.usages.referrers(course_element) if r.owner is not ontology]
+
+    fork = parser.fork()
+    forked = load_ontology(fork, "forked")
+    # the fork sees the usages of the shared models and its own ones, but not the ontologies of the parser
+    assert fork.usages.referrers(course_element) == model_referrers + list(forked.vertices.values())
+
+    parser.unload(parser.get_module_by_ontology(ontology))
+    assert parser.usages.referrers(course_element) == model_referrers
+    assert not parser.usages.references(ontology.vertices["A"])
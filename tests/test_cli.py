@@ -0,0 +1,67 @@
+import json
+from pathlib import Path
+
+from at_ontology_parser.cli import iter_ontology_paths
+from at_ontology_parser.cli import main
+
+fixtures_dir = Path(__file__).parent / "fixtures"
+course_discipline_types = fixtures_dir / "yaml/course-discipline-types.mdl.yml"
+
+
+def _ontologies(directory: Path):
+    valid = directory / "valid.ont.yml"
+    valid.write_text(
+        f"name: valid\nimports:\n  - {course_discipline_types}\n"
+        "vertices:\n  V:\n    type: CourceDiscipline.vertex_types.CourseElement\n",
+        encoding="utf-8",
+    )
+    broken = directory / "nested/broken.ont.yml"
+    broken.parent.mkdir()
+    broken.write_text(
+        f"name: broken\nimports:\n  - {course_discipline_types}\n"
+        "vertices:\n  V:\n    type: Unknown.vertex_types.Type\n",
+        encoding="utf-8",
+    )
+    return valid, broken
+
+
+def test_iter_ontology_paths(tmp_path):
+    valid, broken = _ontologies(tmp_path)
+    (tmp_path / "model.mdl.yml").write_text("name: model\n", encoding="utf-8")
+
+    assert list(iter_ontology_paths([str(tmp_path)])) == [broken, valid]
+    assert list(iter_ontology_paths([str(tmp_path / "*.yml"), str(valid)])) == [tmp_path / "model.mdl.yml", valid]
+
+
+def test_validate(tmp_path, capsys):
+    valid, broken = _ontologies(tmp_path)
+
+    for jobs in ("1", "2"):
+        code = main(["validate", str(tmp_path), "--model", str(course_discipline_types), "--jobs", jobs])
+        assert code == 1
+
+        captured = capsys.readouterr()
+        results = {r["path"]: r for r in map(json.loads, captured.out.splitlines())}
+        assert results[str(valid)]["ok"] and results[str(valid)]["vertices"] == 1
+        assert not results[str(broken)]["ok"]
+        assert results[str(broken)]["error"]["errors"][0]["context"] == ["vertices", "V", "type"]
+        assert all(r["time"] > 0 for r in results.values())
+        assert json.loads(captured.err)["failed"] == 1
+
+    assert main(["validate", str(valid), "--jobs", "1"]) == 0
+
+
+def test_validate_with_broken_model(tmp_path, capsys):
+    valid, broken = _ontologies(tmp_path)
+    model = tmp_path / "broken.mdl.yml"
+    model.write_text("name: broken\nvertex_types:\n  - not a mapping\n", encoding="utf-8")
+
+    for jobs in ("1", "2"):
+        assert main(["validate", str(valid), str(broken), "--model", str(model), "--jobs", jobs]) == 1
+
+        captured = capsys.readouterr()
+        results = [json.loads(line) for line in captured.out.splitlines()]
+        assert sorted(r["path"] for r in results) == sorted([str(valid), str(broken)])
+        assert not any(r["ok"] for r in results)
+        assert all(r["error"]["msg"] for r in results)
+        assert json.loads(captured.err)["failed"] == 2
@@ -0,0 +1,99 @@
+from pathlib import Path
+
+import yaml
+
+import at_ontology_parser.diff as diff_module
+from at_ontology_parser.diff import ADDED
+from at_ontology_parser.diff import CHANGED
+from at_ontology_parser.diff import diff
+from at_ontology_parser.diff import REMOVED
+from at_ontology_parser.diff import structural_hash
+from at_ontology_parser.parsing.parser import Parser
+
+fixtures_dir = Path(__file__).parent / "fixtures"
+test_ontology = fixtures_dir / "yaml/test-ontology.ont.yml"
+course_discipline_types = fixtures_dir / "yaml/course-discipline-types.mdl.yml"
+COURSE_ELEMENT = "CourceDiscipline.vertex_types.CourseElement"
+HIERARCHY = "CourceDiscipline.relationship_types.Hierarchy"
+
+
+def load_ontology(path: Path):
+    return Parser().load_ontology_yaml_file(path)
+
+
+def write_copy(tmp_path: Path, name: str, change) -> Path:
+    data = yaml.safe_load(test_ontology.read_text(encoding="utf-8"))
+    data["imports"] = [str(course_discipline_types)]
+    data["relationships"] = {"R1": {"type": HIERARCHY, "source": "Vertex1", "target": "Vertex2"}}
+    change(data)
+    path = tmp_path / name
+    path.write_text(yaml.safe_dump(data, allow_unicode=True), encoding="utf-8")
+    return path
+
+
+def test_unchanged_versions(tmp_path):
+    old = load_ontology(write_copy(tmp_path, "old.ont.yml", lambda data: None))
+    new = load_ontology(write_copy(tmp_path, "new.ont.yml", lambda data: None))
+    assert old is not new
+    assert structural_hash(old) == structural_hash(new)
+    assert diff(old, new) == []
+
+
+def test_changes(tmp_path):
+    def change(data):
+        data["vertices"]["Vertex1"]["label"] = "Changed"
+        data["vertices"]["Vertex2"]["properties"]["questions"][0]["difficulty"] = 2
+        data["vertices"]["Vertex3"] = {"type": COURSE_ELEMENT}
+        del data["relationships"]["R1"]
+
+    old = load_ontology(write_copy(tmp_path, "old.ont.yml", lambda data: None))
+    new = load_ontology(write_copy(tmp_path, "new.ont.yml", change))
+
+    changes = {(c.kind, c.path) for c in diff(old, new)}
+    assert changes == {
+        (CHANGED, ("vertices", "Vertex1", "label")),
+        (CHANGED, ("vertices", "Vertex2", "properties", "questions", "value")),
+        (ADDED, ("vertices", "Vertex3")),
+        (REMOVED, ("relationships", "R1")),
+    }
+    removed = next(c for c in diff(old, new) if c.kind == REMOVED)
+    assert removed.old is old.relationships["R1"]
+
+
+def test_model_diff():
+    parser = Parser()
+    model = parser.load_model_yaml_file(course_discipline_types)
+    other = Parser().load_model_yaml_file(course_discipline_types)
+    assert diff(model, other) == []
+
+    other.vertex_types[COURSE_ELEMENT].label = "Changed"
+    # the hashes are cached, so the changes after the load are visible only in uncached entities
+    other.vertex_types[COURSE_ELEMENT]._meta.clear()
+    other._meta.clear()
+    assert [c.path for c in diff(model, other)] == [("vertex_types", COURSE_ELEMENT, "label")]
+
+
+def test_diff_descends_into_changed_subtrees(tmp_path, monkeypatch):
+    def write(name, label):
+        data = {
+            "name": "large",
+            "imports": [str(course_discipline_types)],
+            "vertices": {f"V{i}": {"type": COURSE_ELEMENT, "label": f"Vertex {i}"} for i in range(2000)},
+            "relationships": {},
+        }
+        data["vertices"]["V1000"]["label"] = label
+        return load_ontology(write_copy(tmp_path, name, lambda d: d.update(data)))
+
+    old, new = write("old.ont.yml", "old"), write("new.ont.yml", "new")
+    structural_hash(old), structural_hash(new)
+
+    visited = []
+    diff_nodes = diff_module._diff_nodes
+
+    def counting_diff_nodes(*args):
+        visited.append(args[2])
+        return diff_nodes(*args)
+
+    monkeypatch.setattr(diff_module, "_diff_nodes", counting_diff_nodes)
+    assert [c.path for c in diff(old, new)] == [("vertices", "V1000", "label")]
+    assert len(visited) < 50
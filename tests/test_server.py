@@ -0,0 +1,94 @@
+import json
+import threading
+from pathlib import Path
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+import pytest
+import yaml
+
+from at_ontology_parser.server import OntologyService
+from at_ontology_parser.server import QueryServer
+
+fixtures_dir = Path(__file__).parent / "fixtures"
+course_discipline_types = fixtures_dir / "yaml/course-discipline-types.mdl.yml"
+COURSE_ELEMENT = "CourceDiscipline.vertex_types.CourseElement"
+HIERARCHY = "CourceDiscipline.relationship_types.Hierarchy"
+
+
+def write_ontology(path: Path, vertices, relationships):
+    data = {
+        "name": path.name.split(".")[0],
+        "imports": [str(course_discipline_types)],
+        "vertices": {v: {"type": COURSE_ELEMENT} for v in vertices},
+        "relationships": {
+            name: {"type": HIERARCHY, "source": source, "target": target}
+            for name, (source, target) in relationships.items()
+        },
+    }
+    path.write_text(yaml.safe_dump(data), encoding="utf-8")
+
+
+@pytest.fixture
+def server(tmp_path):
+    ontology = tmp_path / "graph.ont.yml"
+    write_ontology(ontology, ["A", "B", "C"], {"AB": ("A", "B"), "AC": ("A", "C")})
+    service = OntologyService(model_paths=[course_discipline_types], ontology_paths=[ontology])
+    with QueryServer(service, ("127.0.0.1", 0), reload_interval=0) as server:
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        yield server
+        server.shutdown()
+        thread.join()
+
+
+def get(server: QueryServer, path: str):
+    try:
+        with urlopen(server.url + path) as response:
+            return response.status, json.loads(response.read())
+    except HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_queries(server):
+    status, vertex = get(server, "/vertices/A")
+    assert status == 200 and vertex["type"] == COURSE_ELEMENT and vertex["ontology"] == "graph"
+
+    _, neighbours = get(server, "/vertices/A/neighbours")
+    assert {n["vertex"] for n in neighbours} == {"B", "C"}
+    _, neighbours = get(server, f"/vertices/B/neighbours?direction=both&type={HIERARCHY}")
+    assert neighbours == [{"direction": "in", "relationship": "AB", "type": HIERARCHY, "vertex": "A"}]
+
+    _, course_element = get(server, f"/types/{COURSE_ELEMENT}")
+    assert course_element["derivation"][-1] == COURSE_ELEMENT
+    _, subtypes = get(server, f"/types/{course_element['derivation'][0]}/subtypes?transitive=1")
+    assert COURSE_ELEMENT in {t["name"] for t in subtypes}
+
+    _, result = get(server, f"/validate?path={fixtures_dir / 'yaml/test-ontology.ont.yml'}")
+    assert result["ok"] and result["vertices"] == 2
+    assert get(server, "/vertices/Vertex1")[0] == 404
+
+    assert get(server, "/vertices/Unknown")[0] == 404
+    assert get(server, "/vertices/A/neighbours?direction=up")[0] == 400
+    assert get(server, "/unknown")[0] == 404
+
+
+def test_hot_reload(server, tmp_path):
+    service = server.service
+    models = service.snapshot.models
+    assert not service.reload_if_changed()
+
+    write_ontology(tmp_path / "graph.ont.yml", ["A", "B", "C", "D"], {"AB": ("A", "B"), "CD": ("C", "D")})
+    assert service.reload_if_changed()
+    # the models are not changed, so they are not reloaded
+    assert service.snapshot.models is models
+    assert {n["vertex"] for n in get(server, "/vertices/A/neighbours")[1]} == {"B"}
+    assert get(server, "/vertices/D")[0] == 200
+
+    (tmp_path / "graph.ont.yml").write_text("name: graph\nvertices:\n  A:\n    type: Unknown.vertex_types.T\n")
+    assert not service.reload_if_changed()
+    _, status = get(server, "/status")
+    assert status["reloads"] == 1 and status["last_error"]
+    assert get(server, "/vertices/D")[0] == 200
+    # the broken file is not reloaded again until it changes
+    assert not service.reload_if_changed()